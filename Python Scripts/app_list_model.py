@@ -0,0 +1,159 @@
+# Author: TheLionDeveloper44
+# Dieses Skript unterliegt der Lizenz, die in der LICENSE-Datei im Stammverzeichnis dieses Repositories enthalten ist.
+# Ohne ausdrückliche schriftliche Genehmigung ist es untersagt, dieses Skript zu kopieren, zu modifizieren oder zu verbreiten.
+
+# Listenmodell mit ankreuzbaren Zeilen für Suchergebnisse und installierte Apps.
+# Die Auswahl liegt im Modell statt in einzelnen Widgets; eine QListView zeichnet nur die
+# sichtbaren Zeilen, daher bleiben auch zehntausende Einträge flüssig.
+
+from typing import Dict, Iterable, List, Set
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt
+
+
+class CheckableAppModel(QAbstractListModel):
+    """Flat list of app names, each with a check box.
+
+    With ``keep_hidden_checks`` the checked set survives ``set_apps``/``clear`` (the selection
+    across several searches); otherwise only checks of apps still listed are kept.
+    """
+
+    def __init__(self, keep_hidden_checks: bool = False, parent=None):
+        super().__init__(parent)
+        self.keep_hidden_checks = keep_hidden_checks
+        self._apps: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._checked: Set[str] = set()
+        self._labels: Dict[str, str] = {}  # Shown instead of the name, e.g. with an available update
+
+    # Qt model interface
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._apps)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        app = self._apps[index.row()]
+        if role in (Qt.DisplayRole, Qt.ToolTipRole):
+            return self._labels.get(app, app)
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if app in self._checked else Qt.Unchecked
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole) -> bool:
+        if not index.isValid() or role != Qt.CheckStateRole:
+            return False
+        app = self._apps[index.row()]
+        if Qt.CheckState(value) == Qt.Checked:
+            self._checked.add(app)
+        else:
+            self._checked.discard(app)
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        # Not ItemIsUserCheckable: the view toggles on a click anywhere in the row, and the
+        # delegate would otherwise toggle a click on the indicator a second time
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    # Rows
+
+    def apps(self) -> List[str]:
+        return list(self._apps)
+
+    def app_at(self, row: int) -> str:
+        return self._apps[row]
+
+    def set_labels(self, labels: Dict[str, str]) -> None:
+        """Show ``labels[app]`` instead of the app name (apps not in ``labels`` show their name)."""
+        self._labels = dict(labels)
+        if self._apps:
+            self.dataChanged.emit(self.index(0), self.index(len(self._apps) - 1), [Qt.DisplayRole])
+
+    def set_apps(self, apps: Iterable[str]) -> None:
+        self.beginResetModel()
+        self._apps = list(dict.fromkeys(apps))
+        self._rows = {app: row for row, app in enumerate(self._apps)}
+        if not self.keep_hidden_checks:
+            self._checked &= set(self._rows)
+        self.endResetModel()
+
+    def sync_apps(self, apps: Iterable[str]) -> None:
+        """Change the rows to ``apps`` by removing and inserting only the rows that differ.
+
+        Unchanged rows keep their check state and scroll position. Falls back to a reset if the
+        order of the remaining rows changed.
+        """
+        target = list(dict.fromkeys(apps))
+        keep = set(target)
+        for row in reversed(range(len(self._apps))):
+            if self._apps[row] not in keep:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._apps[row]
+                self.endRemoveRows()
+        present = set(self._apps)
+        if [app for app in target if app in present] != self._apps:
+            self.set_apps(target)
+            return
+        for row, app in enumerate(target):
+            if app not in present:
+                self.beginInsertRows(QModelIndex(), row, row)
+                self._apps.insert(row, app)
+                self.endInsertRows()
+        self._rows = {app: row for row, app in enumerate(self._apps)}
+        if not self.keep_hidden_checks:
+            self._checked &= keep
+
+    def append(self, apps: Iterable[str]) -> None:
+        """Add apps that are not listed yet, in one row insertion."""
+        new = [app for app in dict.fromkeys(apps) if app not in self._rows]
+        if not new:
+            return
+        first = len(self._apps)
+        self.beginInsertRows(QModelIndex(), first, first + len(new) - 1)
+        for row, app in enumerate(new, first):
+            self._rows[app] = row
+        self._apps.extend(new)
+        self.endInsertRows()
+
+    def clear(self) -> None:
+        self.set_apps([])
+
+    # Check state
+
+    def checked(self) -> List[str]:
+        """All checked apps, including (with ``keep_hidden_checks``) ones not currently listed."""
+        return sorted(self._checked)
+
+    def is_checked(self, app: str) -> bool:
+        return app in self._checked
+
+    def set_checked(self, app: str, checked: bool) -> None:
+        if checked:
+            self._checked.add(app)
+        else:
+            self._checked.discard(app)
+        row = self._rows.get(app)
+        if row is not None:
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+
+    def set_all_listed(self, checked: bool) -> None:
+        """Check or uncheck every listed row with a single change notification."""
+        if checked:
+            self._checked.update(self._apps)
+        else:
+            self._checked.difference_update(self._apps)
+        self._notify_all()
+
+    def clear_checked(self) -> None:
+        """Uncheck everything, listed or not."""
+        self._checked.clear()
+        self._notify_all()
+
+    def _notify_all(self) -> None:
+        if self._apps:
+            self.dataChanged.emit(self.index(0), self.index(len(self._apps) - 1), [Qt.CheckStateRole])
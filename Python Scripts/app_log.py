@@ -0,0 +1,91 @@
+# Author: TheLionDeveloper44
+# Dieses Skript unterliegt der Lizenz, die in der LICENSE-Datei im Stammverzeichnis dieses Repositories enthalten ist.
+# Ohne ausdrückliche schriftliche Genehmigung ist es untersagt, dieses Skript zu kopieren, zu modifizieren oder zu verbreiten.
+
+# Protokolldatei im Cache-Verzeichnis ("logs/app_manager.log", rotiert nach Größe): alle
+# Fortschrittsmeldungen und bei fehlgeschlagenen Scoop-Befehlen deren vollständige Ausgabe.
+# Geschrieben wird in einem eigenen Thread, der Aufrufer legt die Meldung nur in eine Warteschlange.
+# Solange start() nicht aufgerufen wurde (z.B. im Benchmark), werden Meldungen verworfen.
+
+import atexit
+import logging
+import logging.handlers
+import queue
+import subprocess
+from pathlib import Path
+from typing import Optional
+
+LOG_FILE_NAME = "app_manager.log"
+MAX_BYTES = 1024 * 1024
+BACKUP_COUNT = 3  # Rotated files kept next to the current one (app_manager.log.1 ... .3)
+
+_LOGGER = logging.getLogger("app_manager")
+_LOGGER.addHandler(logging.NullHandler())
+_LOGGER.propagate = False  # Never falls back to printing on stderr
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.Handler] = None
+_log_file: Optional[Path] = None
+
+
+def start(directory: Path) -> Optional[Path]:
+    """Start writing to ``directory``/app_manager.log; returns the file, or None if not writable."""
+    global _listener, _queue_handler, _log_file
+    if _listener is not None:
+        return _log_file
+    path = Path(directory) / LOG_FILE_NAME
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        handler = logging.handlers.RotatingFileHandler(
+            path, maxBytes=MAX_BYTES, backupCount=BACKUP_COUNT, encoding="utf-8", delay=True
+        )
+    except OSError:
+        return None
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)-7s [%(threadName)s] %(message)s"))
+    records: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _queue_handler = logging.handlers.QueueHandler(records)
+    _listener = logging.handlers.QueueListener(records, handler)
+    _listener.start()
+    _LOGGER.addHandler(_queue_handler)
+    _LOGGER.setLevel(logging.INFO)
+    _log_file = path
+    atexit.register(stop)
+    return path
+
+
+def stop() -> None:
+    """Write the queued records and close the file."""
+    global _listener, _queue_handler
+    if _listener is None:
+        return
+    _LOGGER.removeHandler(_queue_handler)
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = _queue_handler = None
+
+
+def log_file() -> Optional[Path]:
+    return _log_file if _listener is not None else None
+
+
+def info(message: str) -> None:
+    _LOGGER.info(message)
+
+
+def error(message: str) -> None:
+    _LOGGER.error(message)
+
+
+def command_failed(command: str, exc: subprocess.SubprocessError) -> None:
+    """Keep the complete output of a failed Scoop command (the UI only shows a summary)."""
+    if not _LOGGER.isEnabledFor(logging.ERROR) or _listener is None:
+        return
+    code = getattr(exc, "returncode", None)
+    reason = f"Exit-Code {code}" if code is not None else type(exc).__name__
+    parts = [f"Befehl fehlgeschlagen ({reason}): {command}"]
+    for label, text in (("stdout", getattr(exc, "stdout", None)), ("stderr", getattr(exc, "stderr", None))):
+        if isinstance(text, bytes):
+            text = text.decode("utf-8", "replace")
+        if text and text.strip():
+            parts.append(f"--- {label} ---\n{text.rstrip()}")
+    _LOGGER.error("\n".join(parts))
@@ -0,0 +1,202 @@
+# Author: TheLionDeveloper44
+# Dieses Skript unterliegt der Lizenz, die in der LICENSE-Datei im Stammverzeichnis dieses Repositories enthalten ist.
+# Ohne ausdrückliche schriftliche Genehmigung ist es untersagt, dieses Skript zu kopieren, zu modifizieren oder zu verbreiten.
+
+# Deklaratives App-Profil (z.B. apps.json) und Abgleich mit den installierten Apps.
+# reconcile() vergleicht nur Daten und ruft Scoop nicht auf; ist das Profil bereits erfüllt,
+# kostet ein Abgleich genau ein Lesen des Inventars.
+
+import json
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, List, Optional
+
+import installer
+import scoop_progress
+from inventory import InstalledApp
+
+PROFILE_FORMAT = 1
+
+
+@dataclass
+class ProfileEntry:
+    name: str
+    bucket: Optional[str] = None  # Pin: install from this bucket
+    version: Optional[str] = None  # Pin: keep exactly this version installed
+
+    @classmethod
+    def parse(cls, ref: str) -> "ProfileEntry":
+        """Build an entry from "[bucket/]name[@version]"."""
+        bucket, name, version = installer.split_app_ref(ref.strip())
+        if not name:
+            raise ValueError(f"Ungültiger Profileintrag: {ref!r}")
+        return cls(name, bucket, version)
+
+    def ref(self) -> str:
+        """The reference passed to Scoop, e.g. "extras/vscode@1.90.0"."""
+        text = f"{self.bucket}/{self.name}" if self.bucket else self.name
+        return f"{text}@{self.version}" if self.version else text
+
+    def to_dict(self) -> dict:
+        data = {"name": self.name}
+        if self.bucket:
+            data["bucket"] = self.bucket
+        if self.version:
+            data["version"] = self.version
+        return data
+
+
+@dataclass
+class Profile:
+    apps: List[ProfileEntry] = field(default_factory=list)
+    prune: bool = False  # Uninstall apps that are not part of the profile
+
+    def to_dict(self) -> dict:
+        return {"format": PROFILE_FORMAT, "prune": self.prune, "apps": [entry.to_dict() for entry in self.apps]}
+
+
+@dataclass
+class ReconcilePlan:
+    install: List[ProfileEntry] = field(default_factory=list)
+    upgrade: List[ProfileEntry] = field(default_factory=list)  # Installed, but not at the pinned version
+    uninstall: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    bucket_drift: List[str] = field(default_factory=list)  # Installed from another bucket than pinned
+
+    def is_empty(self) -> bool:
+        return not (self.install or self.upgrade or self.uninstall)
+
+    def to_dict(self) -> dict:
+        return {
+            "install": [entry.ref() for entry in self.install],
+            "upgrade": [entry.ref() for entry in self.upgrade],
+            "uninstall": list(self.uninstall),
+            "unchanged": list(self.unchanged),
+            "bucket_drift": list(self.bucket_drift),
+        }
+
+
+def _parse_entry(item) -> ProfileEntry:
+    if isinstance(item, str):
+        return ProfileEntry.parse(item)
+    if isinstance(item, dict) and isinstance(item.get("name"), str) and item["name"].strip():
+        return ProfileEntry(item["name"].strip(), item.get("bucket") or None, item.get("version") or None)
+    raise ValueError(f"Ungültiger Profileintrag: {item!r}")
+
+
+def parse_profile(text: str) -> Profile:
+    """Parse a profile: a JSON object {"apps": [...], "prune": bool}, a JSON list, or one app per line.
+
+    Entries are "[bucket/]name[@version]" strings or objects with name, bucket and version.
+    In text files "#" starts a comment.
+    """
+    stripped = text.lstrip()
+    if stripped.startswith("{") or stripped.startswith("["):
+        data = json.loads(text)
+        if isinstance(data, dict):
+            if data.get("format", PROFILE_FORMAT) > PROFILE_FORMAT:
+                raise ValueError(f"Profilformat {data['format']} wird nicht unterstützt.")
+            items, prune = data.get("apps", []), bool(data.get("prune", False))
+        else:
+            items, prune = data, False
+        if not isinstance(items, list):
+            raise ValueError("Das Profil muss eine Liste von Apps enthalten.")
+        entries = [_parse_entry(item) for item in items]
+    else:
+        entries = []
+        prune = False
+        for line in text.splitlines():
+            line = line.split("#", 1)[0].strip()
+            if line:
+                entries.append(ProfileEntry.parse(line))
+    unique = {}
+    for entry in entries:
+        unique[entry.name.lower()] = entry  # The last mention of an app wins
+    return Profile(list(unique.values()), prune)
+
+
+def load_profile(path: str) -> Profile:
+    with open(path, "r", encoding="utf-8-sig") as f:
+        return parse_profile(f.read())
+
+
+def save_profile(profile: Profile, path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(profile.to_dict(), f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+
+def lock_profile(records: Iterable[InstalledApp], prune: bool = False) -> Profile:
+    """Build a profile that pins bucket and version of every installed (non-global) app."""
+    entries = [
+        ProfileEntry(app.name, app.bucket, app.version)
+        for app in records
+        if not app.global_install
+    ]
+    return Profile(entries, prune)
+
+
+def reconcile(profile: Profile, installed: Iterable[InstalledApp]) -> ReconcilePlan:
+    """Compute the minimal changes that make ``installed`` match ``profile``.
+
+    A differing version pin becomes an upgrade; a differing bucket is only reported, since
+    reinstalling from another bucket is rarely what is wanted. With ``profile.prune`` apps not in
+    the profile are uninstalled, except global ones (they need an elevated uninstall).
+    """
+    records = {}
+    for app in installed:
+        # A user installation shadows a global one of the same app
+        if app.name.lower() not in records or not app.global_install:
+            records[app.name.lower()] = app
+    plan = ReconcilePlan()
+    for entry in profile.apps:
+        current = records.get(entry.name.lower())
+        if current is None:
+            plan.install.append(entry)
+            continue
+        if entry.version and current.version != entry.version:
+            plan.upgrade.append(entry)
+        else:
+            plan.unchanged.append(current.name)
+        if entry.bucket and current.bucket and entry.bucket.lower() != current.bucket.lower():
+            plan.bucket_drift.append(current.name)
+    if profile.prune:
+        wanted = {entry.name.lower() for entry in profile.apps}
+        plan.uninstall = [
+            app.name for key, app in records.items() if key not in wanted and not app.global_install
+        ]
+    return plan
+
+
+def apply_plan(
+    plan: ReconcilePlan,
+    installed: Iterable[str] = (),
+    progress: Optional[Callable[[str], None]] = None,
+    on_event: Optional[Callable[[scoop_progress.ProgressEvent], None]] = None,
+    cancel: Optional[threading.Event] = None,
+    concurrency: Optional[int] = None,
+) -> None:
+    """Execute a plan through the installer.
+
+    ``on_event`` and ``cancel`` go to every installer call, ``concurrency`` (parallel downloads)
+    to installing and upgrading.
+    """
+    if plan.install:
+        installer.install_apps(
+            [entry.ref() for entry in plan.install],
+            progress=progress,
+            concurrency=concurrency,
+            installed=installed,
+            on_event=on_event,
+            cancel=cancel,
+        )
+    if plan.upgrade:
+        installer.update_apps(
+            [entry.ref() for entry in plan.upgrade],
+            progress=progress,
+            on_event=on_event,
+            cancel=cancel,
+            concurrency=concurrency,
+        )
+    if plan.uninstall:
+        installer.uninstall_apps(plan.uninstall, progress=progress, on_event=on_event, cancel=cancel)
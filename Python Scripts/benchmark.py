@@ -0,0 +1,355 @@
+# Author: TheLionDeveloper44
+# Dieses Skript unterliegt der Lizenz, die in der LICENSE-Datei im Stammverzeichnis dieses Repositories enthalten ist.
+# Ohne ausdrückliche schriftliche Genehmigung ist es untersagt, dieses Skript zu kopieren, zu modifizieren oder zu verbreiten.
+
+# Reproduzierbarer Benchmark für Suche, Liste, Installation und Deinstallation, auch unter Linux:
+# installer._POWER_SHELL wird durch fake_scoop.py ersetzt.
+#   python benchmark.py -o bench.json
+#   python benchmark.py -o neu.json --compare bench.json --latency-scale 0.2
+# Läuft in einem temporären Verzeichnis mit eigenem HOME und Scoop-Verzeichnis, verändert also
+# weder ~/.app_manager_cache noch eine echte Scoop-Installation.
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import fake_scoop
+
+FORMAT = 1
+_WORDS = ["git", "node", "python", "vim", "code", "chrome", "fire", "zip", "java", "go"]
+
+
+def _catalog_names(size: int) -> List[str]:
+    return [f"{_WORDS[i % len(_WORDS)]}-{i:05d}" for i in range(size)]
+
+
+def _dir_size(path: Path) -> int:
+    total = 0
+    for file in path.rglob("*"):
+        try:
+            total += file.stat().st_size if file.is_file() else 0
+        except OSError:
+            pass
+    return total
+
+
+class Bench:
+    """Runs the scenarios in an isolated environment and collects their measurements."""
+
+    def __init__(self, workdir: Path, catalog: int, apps: int, repeat: int, scale: float, host: bool):
+        self.workdir = workdir
+        self.repeat = repeat
+        self.scale = scale
+        self.root = workdir / "scoop"
+        self.empty_root = workdir / "scoop-empty"  # No buckets and no apps: forces Scoop calls
+        self.log = self.root / "fake_scoop.log"
+        self._log_offset = 0
+        self.cache_bytes_written = 0
+
+        names = _catalog_names(catalog)
+        for name in names:
+            fake_scoop.write_manifest(self.root / "buckets" / "main", name)
+        self.apps = names[:apps]
+        if len(self.apps) > 1:
+            # One dependency, so the install plan has something to order
+            fake_scoop.write_manifest(self.root / "buckets" / "main", self.apps[1], depends=[self.apps[0]])
+        (self.root / "apps").mkdir(parents=True, exist_ok=True)
+        self.empty_root.mkdir(parents=True, exist_ok=True)
+        self.log.touch()
+
+        home = workdir / "home"
+        home.mkdir(parents=True, exist_ok=True)
+        os.environ.update(
+            {
+                "HOME": str(home),
+                "USERPROFILE": str(home),
+                "SCOOP": str(self.root),
+                "SCOOP_GLOBAL": str(workdir / "scoop-global"),
+                "SCOOP_CACHE": str(workdir / "scoop-cache"),
+                "APP_MANAGER_PS_HOST": "1" if host else "0",
+                "APP_MANAGER_INSTALL_RETRIES": "0",
+            }
+        )
+        # Imported only now: the cache directory is derived from HOME at import time
+        import cache
+        import bucket_index
+        import installer
+        import ps_host
+
+        self.installer = installer
+        self.ps_host = ps_host
+        self.cache_dir = installer._CACHE_DIR
+        installer._POWER_SHELL = [
+            sys.executable, str(Path(fake_scoop.__file__).resolve()),
+            "--root", str(self.root), "--latency-scale", str(scale),
+        ]
+        self._instrument(cache, bucket_index)
+
+    def _instrument(self, cache, bucket_index) -> None:
+        """Count the bytes the app writes into its cache directory."""
+        bench = self
+        put, save = cache.CacheStore.put, bucket_index.BucketIndex._save
+
+        def counting_put(store, namespace, key, value, stored_at=None):
+            bench.cache_bytes_written += len(key) + len(json.dumps(value, separators=(",", ":"), ensure_ascii=False))
+            return put(store, namespace, key, value, stored_at)
+
+        def counting_save(index):
+            save(index)
+            try:
+                bench.cache_bytes_written += index.index_file.stat().st_size
+            except OSError:
+                pass
+
+        cache.CacheStore.put = counting_put
+        bucket_index.BucketIndex._save = counting_save
+
+    # State helpers used by the scenario setups
+
+    def use_root(self, root: Path) -> None:
+        os.environ["SCOOP"] = str(root)
+
+    def cold_hosts(self) -> None:
+        self.ps_host.shutdown()
+
+    def reset_caches(self) -> None:
+        inst = self.installer
+        inst._wait_for_caches()
+        inst._SEARCH_CACHE.clear()
+        inst._BUCKET_CACHE.clear()
+        with inst._BUCKET_LIST_LOCK:
+            inst._BUCKET_LIST_CACHE = None
+        if inst._STORE is not None:
+            inst._STORE.delete("meta", "bucket_list")
+            inst._STORE.delete("meta", "common_buckets")
+        inst._BUCKETS_INITIALIZED = False
+        self.reset_index()
+
+    def reset_index(self) -> None:
+        self.installer._INDEX = None
+        self.installer._INDEX_FILE.unlink(missing_ok=True)
+
+    def remove_added_buckets(self) -> None:
+        for bucket_dir in (self.root / "buckets").iterdir():
+            if bucket_dir.name != "main":
+                shutil.rmtree(bucket_dir, ignore_errors=True)
+
+    def set_installed(self, installed: bool) -> None:
+        """Install or remove the benchmark apps directly on disk, without a Scoop call."""
+        for app in self.apps:
+            current = self.root / "apps" / app / "current"
+            if installed:
+                current.mkdir(parents=True, exist_ok=True)
+                (current / "manifest.json").write_text(json.dumps({"version": "1.0.0"}), encoding="utf-8")
+                (current / "install.json").write_text(json.dumps({"bucket": "main"}), encoding="utf-8")
+            else:
+                shutil.rmtree(current.parent, ignore_errors=True)
+        self.installer._invalidate_inventory()
+
+    # Measurement
+
+    def _counters(self) -> Dict[str, int]:
+        with open(self.log, "r", encoding="utf-8") as f:
+            f.seek(self._log_offset)
+            new = f.read()
+            self._log_offset = f.tell()
+        inst = self.installer
+        return {
+            "processes": new.count("START "),
+            "commands": new.count("CMD "),
+            "search_hits": inst._SEARCH_CACHE.hits,
+            "search_misses": inst._SEARCH_CACHE.misses,
+            "bucket_hits": inst._BUCKET_CACHE.hits,
+            "bucket_misses": inst._BUCKET_CACHE.misses,
+            "cache_bytes_written": self.cache_bytes_written,
+        }
+
+    def measure(self, action: Callable[[], object], setup: Optional[Callable[[], None]] = None) -> dict:
+        walls: List[float] = []
+        totals: Dict[str, int] = {}
+        for _ in range(self.repeat):
+            if setup:
+                setup()
+            before = self._counters()
+            start = time.perf_counter()
+            action()
+            walls.append(time.perf_counter() - start)
+            after = self._counters()
+            for key in after:
+                # Processes and commands are read from the new part of the log, the rest are totals
+                delta = after[key] if key in ("processes", "commands") else after[key] - before[key]
+                totals[key] = totals.get(key, 0) + delta
+        per_run = {key: value / self.repeat for key, value in totals.items()}
+
+        def ratio(hits: float, misses: float) -> Optional[float]:
+            return round(hits / (hits + misses), 3) if hits + misses else None
+
+        return {
+            "wall_ms": {
+                "min": round(min(walls) * 1000, 2),
+                "median": round(statistics.median(walls) * 1000, 2),
+                "max": round(max(walls) * 1000, 2),
+            },
+            "processes": per_run["processes"],
+            "commands": per_run["commands"],
+            "search_cache_hit_ratio": ratio(per_run["search_hits"], per_run["search_misses"]),
+            "bucket_cache_hit_ratio": ratio(per_run["bucket_hits"], per_run["bucket_misses"]),
+            "cache_bytes_written": int(per_run["cache_bytes_written"]),
+            "cache_dir_bytes": _dir_size(self.cache_dir),
+        }
+
+    def scenarios(self) -> Dict[str, tuple]:
+        """name -> (action, setup); run in this order, later scenarios rely on earlier state."""
+        inst = self.installer
+        term = "git"
+
+        def cold_search_setup() -> None:
+            self.use_root(self.empty_root)
+            self.remove_added_buckets()
+            self.reset_caches()
+            self.cold_hosts()
+
+        def index_setup() -> None:
+            self.use_root(self.root)
+            self.reset_index()
+            inst._SEARCH_CACHE.clear()
+
+        def install_setup() -> None:
+            self.use_root(self.root)
+            self.set_installed(False)
+            inst.discard_install_jobs()
+
+        import app_profile
+
+        def reconcile_satisfied() -> None:
+            profile = app_profile.Profile([app_profile.ProfileEntry(app) for app in self.apps])
+            plan = app_profile.reconcile(profile, inst.installed_inventory())
+            assert plan.is_empty(), plan
+
+        return {
+            "search_scoop_cold": (lambda: inst.search_apps(term), cold_search_setup),
+            "search_scoop_warm": (lambda: inst.search_apps(term), None),
+            "search_index_cold": (lambda: inst.search_apps(term), index_setup),
+            "search_index_warm": (lambda: inst.search_apps("python"), None),
+            "instant_search": (lambda: inst.instant_search("pyth"), None),
+            "list_scoop": (inst.installed_inventory, lambda: self.use_root(self.empty_root)),
+            "list_inventory_cold": (
+                inst.installed_inventory, lambda: (self.use_root(self.root), inst._invalidate_inventory())
+            ),
+            "list_inventory_cached": (inst.installed_inventory, None),
+            "ensure_buckets_cold": (
+                inst.ensure_common_buckets, lambda: (self.remove_added_buckets(), self.reset_caches())
+            ),
+            "install": (lambda: inst.install_apps(self.apps), install_setup),
+            "reconcile_satisfied": (reconcile_satisfied, lambda: self.set_installed(True)),
+            "uninstall": (lambda: inst.uninstall_apps(self.apps), lambda: self.set_installed(True)),
+        }
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).resolve().parent, capture_output=True, text=True, check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def run_benchmark(args) -> dict:
+    workdir = Path(tempfile.mkdtemp(prefix="app-manager-bench-"))
+    try:
+        bench = Bench(workdir, args.catalog, args.apps, args.repeat, args.latency_scale, not args.no_host)
+        results = {}
+        for name, (action, setup) in bench.scenarios().items():
+            if args.only and name not in args.only:
+                continue
+            print(f"{name}...", file=sys.stderr, flush=True)
+            results[name] = bench.measure(action, setup)
+        bench.cold_hosts()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return {
+        "format": FORMAT,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "revision": _git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {
+            "catalog": args.catalog,
+            "apps": args.apps,
+            "repeat": args.repeat,
+            "latency_scale": args.latency_scale,
+            "ps_host": not args.no_host,
+        },
+        "scenarios": results,
+    }
+
+
+def compare(current: dict, baseline: dict) -> List[str]:
+    """Median wall time and subprocess count of each scenario against a baseline run."""
+    lines = [f"{'Szenario':<24} {'Median ms':>10} {'vorher':>10} {'Δ %':>8} {'Prozesse':>9} {'vorher':>7}"]
+    for name, now in current["scenarios"].items():
+        before = baseline.get("scenarios", {}).get(name)
+        if before is None:
+            lines.append(f"{name:<24} {now['wall_ms']['median']:>10.1f} {'-':>10}")
+            continue
+        new, old = now["wall_ms"]["median"], before["wall_ms"]["median"]
+        change = (new - old) / old * 100 if old else 0.0
+        lines.append(
+            f"{name:<24} {new:>10.1f} {old:>10.1f} {change:>+8.1f} {now['processes']:>9.1f} {before['processes']:>7.1f}"
+        )
+    return lines
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark mit simuliertem Scoop")
+    parser.add_argument("-o", "--output", default="benchmark.json", help="JSON-Datei für die Ergebnisse")
+    parser.add_argument("--compare", metavar="JSON", help="mit einem früheren Ergebnis vergleichen")
+    parser.add_argument("--catalog", type=int, default=3000, help="Anzahl Manifeste im Bucket 'main'")
+    parser.add_argument("--apps", type=int, default=5, help="Anzahl Apps für Installation und Deinstallation")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--latency-scale", type=float, default=1.0, help="Faktor für alle simulierten Laufzeiten")
+    parser.add_argument("--no-host", action="store_true", help="einen Prozess pro Aufruf statt des PowerShell-Hosts")
+    parser.add_argument("--only", nargs="+", metavar="SZENARIO", help="nur diese Szenarien ausführen")
+    parser.add_argument("--trace", metavar="JSON", help="Chrome-Trace aller Scoop-Aufrufe und Cache-Abfragen schreiben")
+    args = parser.parse_args(argv)
+    if args.trace:
+        os.environ["APP_MANAGER_DIAGNOSTICS"] = "1"
+
+    result = run_benchmark(args)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2)
+        f.write("\n")
+    for name, data in result["scenarios"].items():
+        print(
+            f"{name:<24} {data['wall_ms']['median']:>9.1f} ms  {data['processes']:>4.1f} Prozesse  "
+            f"{data['commands']:>4.1f} Befehle  Cache-Treffer Suche {data['search_cache_hit_ratio']}, "
+            f"Buckets {data['bucket_cache_hit_ratio']}"
+        )
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        print()
+        print("\n".join(compare(result, baseline)))
+    if args.trace:
+        import diagnostics
+
+        diagnostics.export(args.trace, chrome_trace=True)
+        print(f"Trace in {args.trace}")
+    print(f"Ergebnisse in {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,248 @@
+# Author: TheLionDeveloper44
+# Dieses Skript unterliegt der Lizenz, die in der LICENSE-Datei im Stammverzeichnis dieses Repositories enthalten ist.
+# Ohne ausdrückliche schriftliche Genehmigung ist es untersagt, dieses Skript zu kopieren, zu modifizieren oder zu verbreiten.
+
+# Lokaler Index über die JSON-Manifeste aller Scoop-Buckets.
+# Damit kann die Suche ohne "scoop search" beantwortet werden. Der Index wird inkrementell
+# aktualisiert: nur Manifeste mit geänderter mtime/Grösse werden gelesen, und nur solche mit
+# geändertem Git-Blob-Hash werden neu geparst.
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+_INDEX_FORMAT = 2
+_SEARCH_CHUNK = 4096  # Entries scanned between two checks of a cancellable search
+
+# Positions inside a stored manifest record (kept as a list to keep the file compact)
+_MTIME, _SIZE, _BLOB, _VERSION, _DESCRIPTION, _BINS, _DEPENDS, _SUGGEST = range(8)
+
+
+def scoop_root() -> Path:
+    """Return the Scoop installation directory ($env:SCOOP or ~/scoop)."""
+    env = os.environ.get("SCOOP")
+    return Path(env) if env else Path.home() / "scoop"
+
+
+def _git_blob_hash(data: bytes) -> str:
+    """Hash content the same way git does for blobs, so unchanged checkouts are recognised."""
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def _binary_names(bin_field) -> List[str]:
+    """Extract the command names a manifest exposes through its "bin" field."""
+    if not bin_field:
+        return []
+    entries = bin_field if isinstance(bin_field, list) else [bin_field]
+    names = []
+    for entry in entries:
+        if isinstance(entry, list):
+            # [path, alias, args...] - the alias is the exposed command if given
+            path = entry[1] if len(entry) > 1 and entry[1] else (entry[0] if entry else "")
+        else:
+            path = entry
+        if isinstance(path, str) and path:
+            name = path.replace("\\", "/").rsplit("/", 1)[-1]
+            names.append(name.rsplit(".", 1)[0] if "." in name else name)
+    return names
+
+
+def _string_list(value) -> List[str]:
+    """Normalize a manifest field that may be a string or a list of strings."""
+    if isinstance(value, str):
+        return [value] if value else []
+    if isinstance(value, list):
+        return [v for v in value if isinstance(v, str) and v]
+    return []
+
+
+def _suggestions(suggest_field) -> List[str]:
+    """Flatten the "suggest" field ({feature: app or [apps]}) into a list of app references."""
+    if not isinstance(suggest_field, dict):
+        return []
+    apps = []
+    for value in suggest_field.values():
+        apps.extend(_string_list(value))
+    return apps
+
+
+def _manifest_dir(bucket_dir: Path) -> Path:
+    # Most buckets keep their manifests in "bucket/", older ones at the repository root
+    sub = bucket_dir / "bucket"
+    return sub if sub.is_dir() else bucket_dir
+
+
+class BucketIndex:
+    """Compact on-disk index of name, bucket, version, description, binaries and dependencies per manifest.
+
+    Readers may run while ``refresh`` updates the index on another thread: a refresh builds new
+    tables and swaps each one in with a single assignment, and every reader uses only one table.
+    """
+
+    def __init__(self, root: Path, index_file: Path):
+        self.root = Path(root)
+        self.index_file = Path(index_file)
+        self._buckets: Dict[str, dict] = {}
+        self._entries: List[Tuple[str, str, str]] = []  # (search text, name, bucket)
+        self._by_name: Dict[str, List[Tuple[str, str, list]]] = {}  # name -> (bucket, name, record)
+        self._load()
+
+    @property
+    def buckets_dir(self) -> Path:
+        return self.root / "buckets"
+
+    def available(self) -> bool:
+        return self.buckets_dir.is_dir()
+
+    def bucket_names(self) -> List[str]:
+        return sorted(self._buckets)
+
+    def _load(self) -> None:
+        try:
+            with open(self.index_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return
+        if data.get("format") != _INDEX_FORMAT or data.get("root") != str(self.root):
+            return
+        self._buckets = data.get("buckets", {})
+        self._rebuild_lookup(self._buckets)
+
+    def _save(self) -> None:
+        self.index_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.index_file.with_suffix(".tmp")
+        data = {"format": _INDEX_FORMAT, "root": str(self.root), "buckets": self._buckets}
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"), ensure_ascii=False)
+            os.replace(tmp, self.index_file)
+        except IOError:
+            pass  # The index is rebuilt from the manifests if it cannot be stored
+
+    def _rebuild_lookup(self, buckets: Dict[str, dict]) -> None:
+        entries = []
+        by_name: Dict[str, List[Tuple[str, str, list]]] = {}
+        for bucket, info in buckets.items():
+            for name, rec in info.get("manifests", {}).items():
+                # Name and binaries joined by newlines, so one substring test covers all of them
+                haystack = "\n".join([name.lower()] + [b.lower() for b in rec[_BINS]])
+                entries.append((haystack, name, bucket))
+                by_name.setdefault(name.lower(), []).append((bucket, name, rec))
+        entries.sort()
+        self._entries = entries
+        self._by_name = {name: sorted(found, key=lambda item: item[:2]) for name, found in by_name.items()}
+
+    def refresh(self) -> bool:
+        """Bring the index up to date with the manifests on disk. Returns True if anything changed."""
+        if not self.available():
+            return False
+        # Changes go to a copy; readers keep using the current tables until the swap
+        buckets = dict(self._buckets)
+        changed = False
+        seen = set()
+        for bucket_dir in self.buckets_dir.iterdir():
+            if not bucket_dir.is_dir():
+                continue
+            bucket = bucket_dir.name.lower()
+            seen.add(bucket)
+            if self._refresh_bucket(buckets, bucket, _manifest_dir(bucket_dir)):
+                changed = True
+        for bucket in set(buckets) - seen:
+            del buckets[bucket]
+            changed = True
+        if changed:
+            self._rebuild_lookup(buckets)
+            self._buckets = buckets
+            self._save()
+        return changed
+
+    def _refresh_bucket(self, buckets: Dict[str, dict], bucket: str, manifest_dir: Path) -> bool:
+        info = buckets.get(bucket)
+        old = info.get("manifests", {}) if info else {}
+        manifests = {}
+        changed = info is None
+        try:
+            listing = list(os.scandir(manifest_dir))
+        except OSError:
+            return False
+        for entry in listing:
+            if not entry.name.endswith(".json") or not entry.is_file():
+                continue
+            name = entry.name[:-5]
+            st = entry.stat()
+            rec = old.get(name)
+            if rec and rec[_MTIME] == st.st_mtime_ns and rec[_SIZE] == st.st_size:
+                manifests[name] = rec
+                continue
+            try:
+                with open(entry.path, "rb") as f:
+                    raw = f.read()
+            except IOError:
+                continue
+            blob = _git_blob_hash(raw)
+            changed = True
+            if rec and rec[_BLOB] == blob:
+                manifests[name] = [st.st_mtime_ns, st.st_size] + rec[_BLOB:]
+                continue
+            try:
+                manifest = json.loads(raw.decode("utf-8-sig"))
+            except (ValueError, UnicodeDecodeError):
+                continue
+            if not isinstance(manifest, dict):
+                continue
+            description = manifest.get("description") or ""
+            manifests[name] = [
+                st.st_mtime_ns,
+                st.st_size,
+                blob,
+                str(manifest.get("version") or ""),
+                description if isinstance(description, str) else " ".join(map(str, description)),
+                _binary_names(manifest.get("bin")),
+                _string_list(manifest.get("depends")),
+                _suggestions(manifest.get("suggest")),
+            ]
+        if not changed and len(manifests) == len(old):
+            return False
+        buckets[bucket] = {"manifests": manifests}
+        return True
+
+    def search(self, term: str, should_stop: Optional[Callable[[], bool]] = None) -> List[Tuple[str, str]]:
+        """Return (name, bucket) pairs whose name or binaries contain ``term`` (case-insensitive).
+
+        ``should_stop`` is polled every few thousand entries; once it returns True the search
+        ends early and the partial result is returned.
+        """
+        needle = term.lower().replace("\n", "")
+        entries = self._entries
+        if should_stop is None:
+            return [(name, bucket) for haystack, name, bucket in entries if needle in haystack]
+        found: List[Tuple[str, str]] = []
+        for start in range(0, len(entries), _SEARCH_CHUNK):
+            if should_stop():
+                break
+            found.extend(
+                (name, bucket) for haystack, name, bucket in entries[start:start + _SEARCH_CHUNK] if needle in haystack
+            )
+        return found
+
+    def buckets_for(self, app: str) -> List[str]:
+        """Return all buckets providing a manifest named ``app`` (sorted)."""
+        return [b for b, _, _ in self._by_name.get(app.lower(), [])]
+
+    def manifest_info(self, app: str, bucket: Optional[str] = None) -> Optional[dict]:
+        """Return the indexed fields of an app's manifest, from ``bucket`` or the first that has it."""
+        for b, name, rec in self._by_name.get(app.lower(), []):
+            if bucket and b != bucket.lower():
+                continue
+            return {
+                "name": name,
+                "bucket": b,
+                "version": rec[_VERSION],
+                "description": rec[_DESCRIPTION],
+                "bin": list(rec[_BINS]),
+                "depends": list(rec[_DEPENDS]),
+                "suggest": list(rec[_SUGGEST]),
+            }
+        return None
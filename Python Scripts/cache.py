@@ -0,0 +1,238 @@
+# Author: TheLionDeveloper44
+# Dieses Skript unterliegt der Lizenz, die in der LICENSE-Datei im Stammverzeichnis dieses Repositories enthalten ist.
+# Ohne ausdrückliche schriftliche Genehmigung ist es untersagt, dieses Skript zu kopieren, zu modifizieren oder zu verbreiten.
+
+# Begrenzter Cache mit LRU-Verdrängung und Ablaufzeit (TTL) pro Eintrag.
+# Abgelaufene Einträge bleiben lesbar ("stale"), damit der Aufrufer sofort antworten und im
+# Hintergrund aktualisieren kann (stale-while-revalidate).
+# Persistiert wird in eine SQLite-Datenbank im WAL-Modus: jeder Eintrag wird einzeln und
+# atomar geschrieben, statt bei jeder Änderung die ganze Datei neu zu schreiben.
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+FRESH = "fresh"
+STALE = "stale"
+MISSING = "missing"
+
+
+def _estimate_size(key: str, value: Any) -> int:
+    return len(key) + len(json.dumps(value, separators=(",", ":"), ensure_ascii=False))
+
+
+class CacheStore:
+    """SQLite-backed key/value store, one row per (namespace, key), values stored as JSON."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.RLock()
+        try:
+            self._conn = self._open()
+        except sqlite3.DatabaseError:
+            # A corrupt database only holds cached data, so start over with an empty one
+            self.path.unlink(missing_ok=True)
+            self._conn = self._open()
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, stored_at REAL NOT NULL,"
+            " PRIMARY KEY (namespace, key)) WITHOUT ROWID"
+        )
+        return conn
+
+    @contextmanager
+    def transaction(self):
+        """Group several writes into one atomic commit."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def put(self, namespace: str, key: str, value: Any, stored_at: Optional[float] = None) -> None:
+        data = json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO entries (namespace, key, value, stored_at) VALUES (?, ?, ?, ?)",
+                    (namespace, key, data, time.time() if stored_at is None else stored_at),
+                )
+            except sqlite3.Error:
+                pass  # Losing a single cache entry is harmless; the next lookup recomputes it
+
+    def get(self, namespace: str, key: str, default: Any = None) -> Any:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM entries WHERE namespace = ? AND key = ?", (namespace, key)
+            ).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def delete(self, namespace: str, key: str) -> None:
+        with self._lock:
+            try:
+                self._conn.execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (namespace, key))
+            except sqlite3.Error:
+                pass
+
+    def clear(self, namespace: str) -> None:
+        with self._lock:
+            try:
+                self._conn.execute("DELETE FROM entries WHERE namespace = ?", (namespace,))
+            except sqlite3.Error:
+                pass
+
+    def items(self, namespace: str) -> List[Tuple[str, Any, float]]:
+        """Return (key, value, stored_at) for a namespace, oldest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, value, stored_at FROM entries WHERE namespace = ? ORDER BY stored_at",
+                (namespace,),
+            ).fetchall()
+        return [(key, json.loads(value), stored_at) for key, value, stored_at in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class BoundedCache:
+    """Dict-like cache bounded by entry count and approximate byte size.
+
+    Reading an entry through ``[]`` or ``get`` marks it as recently used; ``in`` does not.
+    Each entry remembers when it was stored, and ``status`` tells fresh from stale entries.
+    ``hits`` and ``misses`` count the lookups reported through ``record_lookup``.
+    All methods are thread-safe (searches, installs and background refreshes share the caches).
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, ttl: float):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[str, tuple[Any, float, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self._store: Optional[CacheStore] = None
+        self._namespace = ""
+
+    def attach(self, store: CacheStore, namespace: str) -> None:
+        """Load the entries persisted under ``namespace`` and write every change through to ``store``."""
+        with self._lock:
+            self._store = None
+            self.clear()
+            for key, value, stored_at in store.items(namespace):
+                self.set(key, value, stored_at=stored_at)
+            self._store = store
+            self._namespace = namespace
+            # Entries evicted while loading (e.g. after lowering the budget) are pruned on disk too
+            stored_keys = {key for key, _, _ in store.items(namespace)}
+            for key in stored_keys - set(self._data):
+                store.delete(namespace, key)
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter(list(self._data))
+
+    def __getitem__(self, key: str) -> Any:
+        with self._lock:
+            value, _, _ = self._data[key]
+            self._data.move_to_end(key)
+            return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.set(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            _, _, size = self._data.pop(key)
+            self._bytes -= size
+            if self._store is not None:
+                self._store.delete(self._namespace, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            if key not in self._data:
+                return default
+            return self[key]
+
+    def record_lookup(self, hit: bool) -> None:
+        """Count one lookup; called where the caller decides whether the cache can answer it."""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def set(self, key: str, value: Any, stored_at: Optional[float] = None) -> None:
+        with self._lock:
+            if key in self._data:
+                _, _, old_size = self._data.pop(key)
+                self._bytes -= old_size
+            stored_at = time.time() if stored_at is None else stored_at
+            size = _estimate_size(key, value)
+            self._data[key] = (value, stored_at, size)
+            self._bytes += size
+            if self._store is not None:
+                self._store.put(self._namespace, key, value, stored_at)
+            self._evict()
+
+    def _evict(self) -> None:
+        while self._data and (len(self._data) > self.max_entries or self._bytes > self.max_bytes):
+            key, (_, _, size) = self._data.popitem(last=False)
+            self._bytes -= size
+            if self._store is not None:
+                self._store.delete(self._namespace, key)
+
+    def status(self, key: str) -> str:
+        """Return FRESH, STALE or MISSING for ``key`` without touching the LRU order."""
+        with self._lock:
+            entry = self._data.get(key)
+        if entry is None:
+            return MISSING
+        return FRESH if time.time() - entry[1] < self.ttl else STALE
+
+    def stored_at(self, key: str) -> Optional[float]:
+        with self._lock:
+            entry = self._data.get(key)
+        return entry[1] if entry else None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+            if self._store is not None:
+                self._store.clear(self._namespace)
+
+    def load_dict(self, data: Dict[str, Any]) -> None:
+        """Merge entries from the former JSON cache files.
+
+        Accepts both {key: [value, stored_at]} and plain {key: value}; plain values are loaded as stale.
+        """
+        with self._lock:
+            for key, item in data.items():
+                if isinstance(item, list) and len(item) == 2 and isinstance(item[1], (int, float)):
+                    self.set(key, item[0], stored_at=float(item[1]))
+                else:
+                    self.set(key, item, stored_at=0.0)
@@ -0,0 +1,261 @@
+# Author: TheLionDeveloper44
+# Dieses Skript unterliegt der Lizenz, die in der LICENSE-Datei im Stammverzeichnis dieses Repositories enthalten ist.
+# Ohne ausdrückliche schriftliche Genehmigung ist es untersagt, dieses Skript zu kopieren, zu modifizieren oder zu verbreiten.
+
+# Kommandozeile ohne GUI, z.B. für die automatische Einrichtung vieler Rechner:
+#   python run.py install git 7zip --json
+#   python cli.py sync apps.json --prune
+#   python cli.py lock apps.json
+#   python cli.py outdated / python cli.py update [apps...]
+# Lädt PySide6 nie. Fortschrittsmeldungen gehen nach stderr, Ergebnisse nach stdout.
+
+import argparse
+import json
+import subprocess
+import sys
+from typing import Callable, Dict, List, Optional
+
+import app_log
+import app_profile
+import installer
+import job_queue
+
+EXIT_OK = 0
+EXIT_FAILED = 1  # A Scoop operation failed
+EXIT_USAGE = 2  # Invalid arguments (argparse uses the same code)
+EXIT_NOT_FOUND = 3  # Search without results, or apps to uninstall that are not installed
+EXIT_INTERRUPTED = 130
+
+
+def _progress(args) -> Callable[[str], None]:
+    """Progress always goes to the log file, and to stderr unless --quiet is given."""
+    if args.quiet:
+        return app_log.info
+
+    def report(message: str) -> None:
+        app_log.info(message)
+        print(message, file=sys.stderr, flush=True)
+
+    return report
+
+
+def _output(args, data, lines: List[str]) -> None:
+    if args.json:
+        json.dump(data, sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write("\n")
+    else:
+        for line in lines:
+            print(line)
+
+
+def _installed_names(progress) -> Dict[str, str]:
+    """Map lowercase name -> name of every installed app."""
+    return {name.lower(): name for name in installer.list_installed_apps(progress)}
+
+
+def cmd_search(args) -> int:
+    try:
+        apps = installer.search_apps(args.term, progress=_progress(args))
+    except installer.NoMatches:
+        apps = []
+    _output(args, {"term": args.term, "apps": apps}, apps)
+    return EXIT_OK if apps else EXIT_NOT_FOUND
+
+
+def cmd_list(args) -> int:
+    records = installer.installed_inventory(_progress(args))
+    lines = [
+        f"{app.name:<30} {app.version or '?':<20} {app.bucket or '-'}{'  (global)' if app.global_install else ''}"
+        for app in records
+    ]
+    _output(args, {"apps": [app.to_dict() for app in records]}, lines)
+    return EXIT_OK
+
+
+def _install(args, apps: List[str], installed: Dict[str, str]) -> List[str]:
+    """Install the apps that are not installed yet; returns the apps that were installed.
+
+    Apps are given as "[bucket/]name[@version]" and compared on the name; a different version of
+    an installed app is left to ``update``.
+    """
+    missing = [app for app in dict.fromkeys(apps) if installer.split_app_ref(app)[1].lower() not in installed]
+    if missing:
+        installer.install_apps(missing, progress=_progress(args), installed=installed.values())
+    return missing
+
+
+def _report(args, report) -> int:
+    """Print the per-app outcome of an install batch."""
+    _output(args, {"jobs": [job.to_dict() for job in report]}, [job.describe() for job in report])
+    return EXIT_OK if all(job.state == job_queue.DONE for job in report) else EXIT_FAILED
+
+
+def cmd_resume(args) -> int:
+    if args.discard:
+        installer.discard_install_jobs()
+        return EXIT_OK
+    if not installer.unfinished_install_jobs():
+        _output(args, {"jobs": []}, ["Keine unterbrochene Installation."])
+        return EXIT_OK
+    try:
+        report = installer.resume_install_jobs(progress=_progress(args))
+    except installer.BatchFailed as exc:
+        report = exc.report
+    return _report(args, report)
+
+
+def cmd_install(args) -> int:
+    progress = _progress(args)
+    installed = _installed_names(progress)
+    try:
+        done = _install(args, args.apps, installed)
+    except installer.BatchFailed as exc:
+        return _report(args, exc.report)
+    skipped = [app for app in args.apps if app not in done]
+    _output(
+        args,
+        {"installed": done, "skipped": skipped},
+        [f"installiert: {app}" for app in done] + [f"bereits installiert: {app}" for app in skipped],
+    )
+    return EXIT_OK
+
+
+def cmd_uninstall(args) -> int:
+    progress = _progress(args)
+    installed = _installed_names(progress)
+    present = [installed[app.lower()] for app in args.apps if app.lower() in installed]
+    absent = [app for app in args.apps if app.lower() not in installed]
+    installer.uninstall_apps(present, progress=progress)
+    _output(
+        args,
+        {"uninstalled": present, "not_installed": absent},
+        [f"deinstalliert: {app}" for app in present] + [f"nicht installiert: {app}" for app in absent],
+    )
+    return EXIT_NOT_FOUND if absent and not present else EXIT_OK
+
+
+def cmd_outdated(args) -> int:
+    outdated = installer.outdated_apps(_progress(args), refresh_buckets=not args.no_fetch)
+    lines = [f"{app.name:<30} {app.installed:<20} -> {app.latest:<20} {app.bucket}" for app in outdated]
+    _output(args, {"outdated": [app.to_dict() for app in outdated]}, lines or ["Alle Apps sind aktuell."])
+    return EXIT_OK
+
+
+def cmd_update(args) -> int:
+    progress = _progress(args)
+    if args.apps:
+        installed = _installed_names(progress)
+        refs = [app for app in args.apps if installer.split_app_ref(app)[1].lower() in installed]
+        absent = [app for app in args.apps if app not in refs]
+    else:
+        refs = [app.name for app in installer.outdated_apps(progress, refresh_buckets=not args.no_fetch)]
+        absent = []
+    installer.update_apps(refs, progress=progress)
+    _output(
+        args,
+        {"updated": refs, "not_installed": absent},
+        [f"aktualisiert: {app}" for app in refs]
+        + [f"nicht installiert: {app}" for app in absent]
+        + ([] if refs or absent else ["Alle Apps sind aktuell."]),
+    )
+    return EXIT_NOT_FOUND if absent and not refs else EXIT_OK
+
+
+def cmd_sync(args) -> int:
+    progress = _progress(args)
+    profile = app_profile.load_profile(args.file)
+    if args.prune is not None:
+        profile.prune = args.prune
+    records = installer.installed_inventory(progress)
+    plan = app_profile.reconcile(profile, records)
+    if not args.dry_run and not plan.is_empty():
+        app_profile.apply_plan(plan, installed=[app.name for app in records], progress=progress)
+    prefix = "würde " if args.dry_run else ""
+    lines = (
+        [f"{prefix}installieren: {entry.ref()}" for entry in plan.install]
+        + [f"{prefix}aktualisieren: {entry.ref()}" for entry in plan.upgrade]
+        + [f"{prefix}deinstallieren: {app}" for app in plan.uninstall]
+    ) or ["Alles aktuell."]
+    lines += [f"Hinweis: {app} stammt aus einem anderen Bucket als im Profil angegeben." for app in plan.bucket_drift]
+    _output(args, dict(plan.to_dict(), dry_run=args.dry_run), lines)
+    return EXIT_OK
+
+
+def cmd_lock(args) -> int:
+    profile = app_profile.lock_profile(installer.installed_inventory(_progress(args)), prune=args.prune)
+    app_profile.save_profile(profile, args.file)
+    _output(args, profile.to_dict(), [f"{len(profile.apps)} Apps in {args.file} festgehalten."])
+    return EXIT_OK
+
+
+def build_parser() -> argparse.ArgumentParser:
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--json", action="store_true", help="Ergebnis als JSON auf stdout ausgeben")
+    common.add_argument("-q", "--quiet", action="store_true", help="keine Fortschrittsmeldungen auf stderr")
+
+    parser = argparse.ArgumentParser(prog="run.py", description="Scoop-Apps ohne GUI verwalten.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("search", parents=[common], help="Apps suchen")
+    p.add_argument("term")
+    p.set_defaults(func=cmd_search)
+
+    p = sub.add_parser("install", parents=[common], help="Apps installieren (bereits installierte werden übersprungen)")
+    p.add_argument("apps", nargs="+")
+    p.set_defaults(func=cmd_install)
+
+    p = sub.add_parser("resume", parents=[common], help="eine unterbrochene Installation fortsetzen")
+    p.add_argument("--discard", action="store_true", help="offene Apps verwerfen statt fortsetzen")
+    p.set_defaults(func=cmd_resume)
+
+    p = sub.add_parser("uninstall", parents=[common], help="Apps deinstallieren")
+    p.add_argument("apps", nargs="+")
+    p.set_defaults(func=cmd_uninstall)
+
+    p = sub.add_parser("list", parents=[common], help="installierte Apps auflisten")
+    p.set_defaults(func=cmd_list)
+
+    p = sub.add_parser("outdated", parents=[common], help="Apps mit neuerer Version im Bucket auflisten")
+    p.add_argument("--no-fetch", action="store_true", help="Buckets vorher nicht aktualisieren")
+    p.set_defaults(func=cmd_outdated)
+
+    p = sub.add_parser("update", parents=[common], help="Apps aktualisieren (ohne Angabe alle veralteten)")
+    p.add_argument("apps", nargs="*", help="[bucket/]name[@version]")
+    p.add_argument("--no-fetch", action="store_true", help="Buckets vorher nicht aktualisieren")
+    p.set_defaults(func=cmd_update)
+
+    p = sub.add_parser("sync", parents=[common], help="installierte Apps an ein Profil angleichen")
+    p.add_argument("file", help="Profil: JSON-Datei, JSON-Liste oder Textdatei (eine App pro Zeile)")
+    prune = p.add_mutually_exclusive_group()
+    prune.add_argument("--prune", dest="prune", action="store_true", default=None,
+                       help="nicht aufgeführte Apps deinstallieren (überschreibt das Profil)")
+    prune.add_argument("--no-prune", dest="prune", action="store_false", help="nichts deinstallieren")
+    p.add_argument("-n", "--dry-run", action="store_true", help="nur anzeigen, was geändert würde")
+    p.set_defaults(func=cmd_sync)
+
+    p = sub.add_parser("lock", parents=[common], help="installierte Apps mit Bucket und Version als Profil speichern")
+    p.add_argument("file")
+    p.add_argument("--prune", action="store_true", help="im Profil festlegen, dass andere Apps entfernt werden")
+    p.set_defaults(func=cmd_lock)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    installer.start_logging()
+    try:
+        return args.func(args)
+    except KeyboardInterrupt:
+        app_log.error("Abgebrochen (Strg+C).")
+        return EXIT_INTERRUPTED
+    except (RuntimeError, ValueError, OSError, subprocess.SubprocessError) as exc:
+        app_log.error(f"✗ {exc}")
+        if args.json:
+            json.dump({"error": str(exc)}, sys.stdout, ensure_ascii=False)
+            sys.stdout.write("\n")
+        print(f"✗ {exc}", file=sys.stderr)
+        return EXIT_FAILED
+
+
+if __name__ == "__main__":
+    sys.exit(main())
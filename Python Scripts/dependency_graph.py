@@ -0,0 +1,124 @@
+# Author: TheLionDeveloper44
+# Dieses Skript unterliegt der Lizenz, die in der LICENSE-Datei im Stammverzeichnis dieses Repositories enthalten ist.
+# Ohne ausdrückliche schriftliche Genehmigung ist es untersagt, dieses Skript zu kopieren, zu modifizieren oder zu verbreiten.
+
+# Abhängigkeitsgraph aus den "depends"-Feldern der Manifeste.
+# Gemeinsame Abhängigkeiten werden nur einmal eingeplant; Zyklen und fehlende Abhängigkeiten
+# werden gemeldet, bevor irgendetwas installiert wird.
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+
+@dataclass
+class InstallPlan:
+    order: List[str]  # Topological order: every app comes after its dependencies
+    depends: Dict[str, List[str]]  # Direct dependencies within the plan
+    buckets: Dict[str, str] = field(default_factory=dict)  # Buckets named explicitly ("bucket/app")
+    added: List[str] = field(default_factory=list)  # Dependencies that were not selected
+    suggestions: Dict[str, List[str]] = field(default_factory=dict)
+
+
+def _split_ref(ref: str) -> tuple[Optional[str], str]:
+    if "/" in ref:
+        bucket, name = ref.split("/", 1)
+        return bucket.lower(), name
+    return None, ref
+
+
+def _find_cycle(depends: Dict[str, List[str]]) -> Optional[List[str]]:
+    """Return one dependency cycle as a list of apps, or None if the graph is acyclic."""
+    visiting: List[str] = []
+    state: Dict[str, int] = {}  # 1 = on the current path, 2 = done
+
+    def visit(node: str) -> Optional[List[str]]:
+        state[node] = 1
+        visiting.append(node)
+        for dep in depends.get(node, []):
+            if state.get(dep) == 1:
+                return visiting[visiting.index(dep):] + [dep]
+            if dep not in state:
+                cycle = visit(dep)
+                if cycle:
+                    return cycle
+        visiting.pop()
+        state[node] = 2
+        return None
+
+    for node in depends:
+        if node not in state:
+            cycle = visit(node)
+            if cycle:
+                return cycle
+    return None
+
+
+def _topological_order(roots: List[str], depends: Dict[str, List[str]]) -> List[str]:
+    order: List[str] = []
+    seen: Set[str] = set()
+
+    def visit(node: str) -> None:
+        if node in seen:
+            return
+        seen.add(node)
+        for dep in depends.get(node, []):
+            visit(dep)
+        order.append(node)
+
+    for root in roots:
+        visit(root)
+    return order
+
+
+def build_plan(
+    apps: Iterable[str],
+    lookup: Callable[[str, Optional[str]], Optional[dict]],
+    installed: Iterable[str] = (),
+) -> InstallPlan:
+    """Resolve the dependency graph of ``apps`` through ``lookup(name, bucket) -> manifest info``.
+
+    Dependencies that are already ``installed`` are left out. Raises ``RuntimeError`` listing all
+    missing dependencies or a cycle, so nothing is installed from an unresolvable plan.
+    """
+    roots = list(dict.fromkeys(apps))
+    installed_lower = {app.lower() for app in installed}
+    depends: Dict[str, List[str]] = {}
+    buckets: Dict[str, str] = {}
+    suggestions: Dict[str, List[str]] = {}
+    missing: List[str] = []
+
+    pending = list(roots)
+    while pending:
+        app = pending.pop()
+        if app in depends:
+            continue
+        info = lookup(app, buckets.get(app))
+        if info is None:
+            if app not in roots:
+                missing.append(app)
+            depends[app] = []  # Selected apps without a manifest are left for Scoop to report
+            continue
+        deps = []
+        for ref in info.get("depends", []):
+            bucket, name = _split_ref(ref)
+            if name.lower() in installed_lower:
+                continue
+            if bucket:
+                buckets[name] = bucket
+            deps.append(name)
+            pending.append(name)
+        depends[app] = deps
+        suggested = [_split_ref(ref)[1] for ref in info.get("suggest", [])]
+        suggested = [s for s in suggested if s.lower() not in installed_lower]
+        if suggested:
+            suggestions[app] = suggested
+
+    if missing:
+        raise RuntimeError("Fehlende Abhängigkeiten: " + ", ".join(sorted(set(missing))))
+    cycle = _find_cycle(depends)
+    if cycle:
+        raise RuntimeError("Zyklische Abhängigkeit: " + " -> ".join(cycle))
+
+    order = _topological_order(roots, depends)
+    added = [app for app in order if app not in roots]
+    return InstallPlan(order=order, depends=depends, buckets=buckets, added=added, suggestions=suggestions)
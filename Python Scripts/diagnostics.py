@@ -0,0 +1,270 @@
+# Author: TheLionDeveloper44
+# Dieses Skript unterliegt der Lizenz, die in der LICENSE-Datei im Stammverzeichnis dieses Repositories enthalten ist.
+# Ohne ausdrückliche schriftliche Genehmigung ist es untersagt, dieses Skript zu kopieren, zu modifizieren oder zu verbreiten.
+
+# Laufzeitmessung der heißen Pfade: jeder Scoop-Aufruf und jede Cache-Abfrage ("cache: ...") im
+# Installer wird als "Span" erfasst (Art, Dauer, Exit-Code, Ausgabegröße, aus dem Cache bedient)
+# und pro Art in ein Latenz-Histogramm einsortiert. Export als JSON oder im Chrome-Trace-Format
+# (chrome://tracing, https://ui.perfetto.dev). Eingeschaltet mit APP_MANAGER_DIAGNOSTICS=1 oder
+# im Diagnose-Tab; ausgeschaltet kostet ein Span nur eine Abfrage und einen leeren with-Block.
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+# Upper bounds of the histogram buckets in milliseconds; slower spans land in an overflow bucket
+BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+MAX_SPANS = 10000  # Recent spans kept for the trace export
+
+_enabled = os.environ.get("APP_MANAGER_DIAGNOSTICS", "0") not in ("", "0")
+_lock = threading.Lock()
+_origin = time.perf_counter()
+_spans: Deque["Span"] = deque(maxlen=MAX_SPANS)
+_histograms: Dict[str, "Histogram"] = {}
+
+
+class Histogram:
+    """Latency distribution of one span kind with fixed buckets."""
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms = 0.0
+        self.max_ms = 0.0
+        self.cached = 0
+        self.errors = 0
+        self.output_bytes = 0
+
+    def add(self, span: "Span") -> None:
+        ms = span.duration * 1000
+        index = next((i for i, bound in enumerate(BUCKETS_MS) if ms <= bound), len(BUCKETS_MS))
+        self.counts[index] += 1
+        self.min_ms = ms if not self.count else min(self.min_ms, ms)
+        self.max_ms = max(self.max_ms, ms)
+        self.count += 1
+        self.total_ms += ms
+        self.cached += bool(span.cached)
+        self.errors += span.error is not None
+        self.output_bytes += span.output_bytes
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound of the bucket holding the given fraction of spans (capped at the maximum)."""
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return min(float(BUCKETS_MS[i]) if i < len(BUCKETS_MS) else self.max_ms, self.max_ms)
+        return self.max_ms
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "cached": self.cached,
+            "errors": self.errors,
+            "output_bytes": self.output_bytes,
+            "total_ms": round(self.total_ms, 3),
+            "min_ms": round(self.min_ms, 3),
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "p50_ms": round(self.percentile(0.5), 3),
+            "p95_ms": round(self.percentile(0.95), 3),
+            "max_ms": round(self.max_ms, 3),
+            "buckets": {
+                (f"<={BUCKETS_MS[i]}" if i < len(BUCKETS_MS) else f">{BUCKETS_MS[-1]}"): count
+                for i, count in enumerate(self.counts)
+                if count
+            },
+        }
+
+
+class Span:
+    """One timed operation; used as a context manager and recorded when the block ends.
+
+    An exception leaving the block is recorded as the span's error, together with the exit
+    code and output of a ``subprocess.CalledProcessError``.
+    """
+
+    __slots__ = ("kind", "detail", "start", "duration", "exit_code", "output_bytes", "cached", "error", "thread")
+
+    def __init__(self, kind: str, detail: str = ""):
+        self.kind = kind
+        self.detail = detail
+        self.start = 0.0
+        self.duration = 0.0
+        self.exit_code: Optional[int] = None
+        self.output_bytes = 0
+        self.cached: Optional[bool] = None
+        self.error: Optional[str] = None
+        self.thread = threading.current_thread().name
+
+    def __enter__(self) -> "Span":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.duration = time.perf_counter() - self.start
+        if exc is not None:
+            self.error = exc_type.__name__
+            if self.exit_code is None:
+                self.exit_code = getattr(exc, "returncode", None)
+            if not self.output_bytes:
+                self.output_bytes = _output_size(getattr(exc, "stdout", None), getattr(exc, "stderr", None))
+        _record(self)
+        return False
+
+    def completed(self, result) -> None:
+        """Take exit code and output size from a ``subprocess.CompletedProcess``."""
+        self.exit_code = result.returncode
+        self.output_bytes = _output_size(result.stdout, result.stderr)
+
+    def to_dict(self) -> dict:
+        return {
+            "kind": self.kind,
+            "detail": self.detail,
+            "start_ms": round((self.start - _origin) * 1000, 3),
+            "duration_ms": round(self.duration * 1000, 3),
+            "exit_code": self.exit_code,
+            "output_bytes": self.output_bytes,
+            "cached": self.cached,
+            "error": self.error,
+            "thread": self.thread,
+        }
+
+
+class _NullSpan:
+    """Stand-in while diagnostics are off: accepts everything and records nothing."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        pass
+
+    def completed(self, result) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def _output_size(stdout, stderr) -> int:
+    size = 0
+    for text in (stdout, stderr):
+        size += len(text.encode("utf-8", "replace")) if isinstance(text, str) else len(text or b"")
+    return size
+
+
+def _record(span: Span) -> None:
+    with _lock:
+        _spans.append(span)
+        histogram = _histograms.get(span.kind)
+        if histogram is None:
+            histogram = _histograms[span.kind] = Histogram()
+        histogram.add(span)
+
+
+def span(kind: str, detail: str = ""):
+    """Return a span for ``with``; a shared no-op object while diagnostics are disabled."""
+    if not _enabled:
+        return _NULL_SPAN
+    return Span(kind, detail)
+
+
+def record(kind: str, start: float, duration: float, detail: str = "") -> None:
+    """Record an operation measured elsewhere (``start`` is a perf_counter value, in seconds)."""
+    if not _enabled:
+        return
+    item = Span(kind, detail)
+    item.start, item.duration = start, duration
+    _record(item)
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def enable() -> None:
+    global _enabled
+    _enabled = True
+
+
+def disable() -> None:
+    global _enabled
+    _enabled = False
+
+
+def reset() -> None:
+    global _origin
+    with _lock:
+        _spans.clear()
+        _histograms.clear()
+        _origin = time.perf_counter()
+
+
+def histograms() -> Dict[str, dict]:
+    """Per-kind summary (count, cache hits, errors, percentiles, bucket counts), sorted by kind."""
+    with _lock:
+        return {kind: _histograms[kind].to_dict() for kind in sorted(_histograms)}
+
+
+def recent_spans() -> List[dict]:
+    with _lock:
+        return [span.to_dict() for span in _spans]
+
+
+def to_json() -> dict:
+    return {
+        "format": 1,
+        "enabled": _enabled,
+        "bucket_bounds_ms": list(BUCKETS_MS),
+        "histograms": histograms(),
+        "spans": recent_spans(),
+    }
+
+
+def to_chrome_trace() -> dict:
+    """The recent spans as complete events ("ph": "X") of the Chrome trace event format."""
+    pid = os.getpid()
+    threads: Dict[str, int] = {}
+    events: List[dict] = []
+    for item in recent_spans():
+        tid = threads.setdefault(item["thread"], len(threads) + 1)
+        args = {
+            key: item[key]
+            for key in ("detail", "exit_code", "output_bytes", "cached", "error")
+            if item[key] not in (None, "")
+        }
+        events.append(
+            {
+                "name": item["kind"],
+                "cat": item["kind"].split(":", 1)[0] if ":" in item["kind"] else "scoop",
+                "ph": "X",
+                "ts": round(item["start_ms"] * 1000, 1),
+                "dur": round(item["duration_ms"] * 1000, 1),
+                "pid": pid,
+                "tid": tid,
+                "args": args,
+            }
+        )
+    for name, tid in threads.items():
+        events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}})
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def export(path: str, chrome_trace: bool = False) -> None:
+    """Write ``to_json()`` or, with ``chrome_trace``, ``to_chrome_trace()`` to ``path``."""
+    data = to_chrome_trace() if chrome_trace else to_json()
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=1, ensure_ascii=False)
+        f.write("\n")
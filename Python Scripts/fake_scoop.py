@@ -0,0 +1,291 @@
+# Author: TheLionDeveloper44
+# Dieses Skript unterliegt der Lizenz, die in der LICENSE-Datei im Stammverzeichnis dieses Repositories enthalten ist.
+# Ohne ausdrückliche schriftliche Genehmigung ist es untersagt, dieses Skript zu kopieren, zu modifizieren oder zu verbreiten.
+
+# Deterministischer Ersatz für PowerShell und Scoop, damit sich Suche, Installation, Liste und
+# Deinstallation auch unter Linux messen lassen (siehe benchmark.py). Wird anstelle von
+# installer._POWER_SHELL gestartet:
+#   python fake_scoop.py --root DIR [--latency-scale F] <befehl>      (ein Prozess pro Aufruf)
+#   python fake_scoop.py --root DIR [--latency-scale F] <HOST_SCRIPT> (Host-Protokoll aus ps_host)
+# Der Katalog sind die Manifeste unter DIR/buckets/*/bucket; installierte Apps landen unter
+# DIR/apps wie bei Scoop. Jeder Prozessstart und jeder Befehl wird in DIR/fake_scoop.log notiert.
+
+import argparse
+import json
+import os
+import re
+import shlex
+import shutil
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import ps_host
+
+# Simulated duration in seconds of each operation (before --latency-scale)
+LATENCY = {
+    "startup": 0.3,  # PowerShell cold start, paid once per process
+    "--version": 0.05,
+    "bucket list": 0.1,
+    "bucket add": 1.0,
+    "search": 0.8,
+    "list": 0.4,
+    "download": 0.6,
+    "install": 0.8,
+    "uninstall": 0.4,
+    "update": 1.0,
+}
+DOWNLOAD_SIZE_MB = 12.5
+BUCKET_ADD_MANIFESTS = 200  # Manifests generated for a bucket added with "scoop bucket add"
+
+Emit = Callable[[int, str], None]
+
+
+def write_manifest(bucket_dir: Path, name: str, version: str = "1.0.0", depends: Optional[List[str]] = None) -> None:
+    manifest = {
+        "version": version,
+        "description": f"Benchmark app {name}",
+        "url": f"https://example.invalid/{name}-{version}.zip",
+        "bin": f"{name}.exe",
+    }
+    if depends:
+        manifest["depends"] = depends
+    path = bucket_dir / "bucket" / f"{name}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(manifest), encoding="utf-8")
+
+
+class FakeScoop:
+    def __init__(self, root: Path, scale: float):
+        self.root = root
+        self.scale = scale
+        self._catalog: Optional[Dict[str, tuple]] = None  # name -> (bucket, version)
+        self._log = open(root / "fake_scoop.log", "a", encoding="utf-8")
+        self._note(f"START {os.getpid()}")
+        self._sleep("startup")
+
+    def _note(self, text: str) -> None:
+        self._log.write(text + "\n")
+        self._log.flush()
+
+    def _sleep(self, operation: str, share: float = 1.0) -> None:
+        delay = LATENCY.get(operation, 0.0) * self.scale * share
+        if delay > 0:
+            time.sleep(delay)
+
+    def catalog(self) -> Dict[str, tuple]:
+        if self._catalog is None:
+            self._catalog = {}
+            for bucket_dir in sorted((self.root / "buckets").glob("*")):
+                for path in sorted((bucket_dir / "bucket").glob("*.json")):
+                    try:
+                        version = json.loads(path.read_text(encoding="utf-8")).get("version", "1.0.0")
+                    except ValueError:
+                        continue
+                    self._catalog.setdefault(path.stem.lower(), (bucket_dir.name, version))
+        return self._catalog
+
+    def _app_dir(self, name: str) -> Path:
+        return self.root / "apps" / name
+
+    def execute(self, command: str, emit: Emit) -> int:
+        """Run one command, passing (1, line) / (2, line) to ``emit``; returns the exit code."""
+        self._note(f"CMD {command}")
+        words = shlex.split(command, posix=False)
+        if not words or words[0] != "scoop":
+            emit(2, f"Unbekannter Befehl: {command}")
+            return 1
+        args = words[1:]
+        verb = args[0] if args else ""
+        if verb == "--version":
+            self._sleep("--version")
+            emit(1, "Current Scoop version:\nv0.5.2 - Released at 2024-07-26")
+            return 0
+        if verb == "bucket" and args[1:2] == ["list"]:
+            self._sleep("bucket list")
+            emit(1, "Name Source Updated Manifests")
+            emit(1, "---- ------ ------- ---------")
+            for bucket_dir in sorted((self.root / "buckets").glob("*")):
+                emit(1, f"{bucket_dir.name} https://example.invalid/{bucket_dir.name} 2024-01-01 0")
+            return 0
+        if verb == "bucket" and args[1:2] == ["add"] and len(args) > 2:
+            return self._bucket_add(args[2], emit)
+        if verb == "search":
+            return self._search(" ".join(args[1:]), emit)
+        if verb == "list":
+            self._sleep("list")
+            emit(1, "Installed apps:")
+            for app_dir in sorted((self.root / "apps").glob("*")):
+                manifest = app_dir / "current" / "manifest.json"
+                if manifest.exists():
+                    version = json.loads(manifest.read_text(encoding="utf-8")).get("version", "?")
+                    bucket = self.catalog().get(app_dir.name.lower(), ("main",))[0]
+                    emit(1, f"  {app_dir.name} {version} [{bucket}]")
+            return 0
+        if verb == "update" and len(args) == 1:
+            self._sleep("update")
+            emit(1, "Updating Scoop...\nUpdating Buckets...\nScoop was updated successfully!")
+            return 0
+        if verb == "status":
+            return self._status(emit)
+        if verb in ("download", "install", "update") and len(args) > 1:
+            return getattr(self, f"_{verb}")(args[1], emit)
+        if verb == "uninstall" and len(args) > 1:
+            return self._uninstall(args[1], emit)
+        emit(2, f"Unbekannter Befehl: {command}")
+        return 1
+
+    def _resolve(self, ref: str, emit: Emit) -> Optional[tuple]:
+        ref, _, version = ref.partition("@")
+        name = ref.rsplit("/", 1)[-1]
+        found = self.catalog().get(name.lower())
+        if found is None:
+            emit(2, f"Couldn't find manifest for '{name}'.")
+            return None
+        return name, found[0], version or found[1]
+
+    def _bucket_add(self, bucket: str, emit: Emit) -> int:
+        bucket_dir = self.root / "buckets" / bucket
+        if bucket_dir.exists():
+            emit(1, f"WARN  The '{bucket}' bucket already exists. To add this bucket again, first remove it.")
+            return 0
+        self._sleep("bucket add")
+        for i in range(BUCKET_ADD_MANIFESTS):
+            write_manifest(bucket_dir, f"{bucket}-app{i:04d}")
+        self._catalog = None
+        emit(1, "Checking repo... OK")
+        emit(1, f"The {bucket} bucket was added successfully.")
+        return 0
+
+    def _search(self, query: str, emit: Emit) -> int:
+        pattern = query.strip("'\"")
+        try:
+            regex = re.compile(pattern, re.IGNORECASE)
+        except re.error:
+            regex = re.compile(re.escape(pattern), re.IGNORECASE)
+        # Results arrive in two halves, like a search that reads local buckets first
+        self._sleep("search", 0.5)
+        rows = [
+            f"{name} {version} {bucket} {name}.exe"
+            for name, (bucket, version) in self.catalog().items()
+            if regex.search(name)
+        ]
+        if rows:
+            emit(1, "Name Version Source Binaries")
+            emit(1, "---- ------- ------ --------")
+        for i, row in enumerate(rows):
+            if i == len(rows) // 2:
+                self._sleep("search", 0.5)
+            emit(1, row)
+        if not rows:
+            self._sleep("search", 0.5)
+            emit(2, "WARN  No matches found.")
+        return 0
+
+    def _download(self, ref: str, emit: Emit) -> int:
+        resolved = self._resolve(ref, emit)
+        if resolved is None:
+            return 1
+        name, _bucket, version = resolved
+        emit(1, f"Starting download for {name} ({version})")
+        emit(1, f"Downloading https://example.invalid/{name}-{version}.zip ({DOWNLOAD_SIZE_MB} MB)...")
+        for percent in (25, 50, 75, 100):
+            self._sleep("download", 0.25)
+            emit(1, f"{name}-{version}.zip ({DOWNLOAD_SIZE_MB} MB) [{'=' * (percent // 10):<10}] {percent}%")
+        emit(1, f"Checking hash of {name}-{version}.zip ... ok.")
+        return 0
+
+    def _install(self, ref: str, emit: Emit) -> int:
+        resolved = self._resolve(ref, emit)
+        if resolved is None:
+            return 1
+        name, bucket, version = resolved
+        current = self._app_dir(name) / "current"
+        if current.exists():
+            emit(1, f"WARN  '{name}' ({version}) is already installed.")
+            return 0
+        emit(1, f"Installing '{name}' ({version}) [64bit] from '{bucket}' bucket")
+        self._sleep("install", 0.5)
+        emit(1, f"Extracting {name}-{version}.zip ... done.")
+        self._sleep("install", 0.5)
+        emit(1, f"Linking ~\\scoop\\apps\\{name}\\current => ~\\scoop\\apps\\{name}\\{version}")
+        emit(1, f"Creating shim for '{name}'.")
+        current.mkdir(parents=True, exist_ok=True)
+        (current / "manifest.json").write_text(json.dumps({"version": version}), encoding="utf-8")
+        (current / "install.json").write_text(json.dumps({"bucket": bucket, "architecture": "64bit"}), encoding="utf-8")
+        emit(1, f"'{name}' ({version}) was installed successfully!")
+        return 0
+
+    def _uninstall(self, name: str, emit: Emit) -> int:
+        app_dir = self._app_dir(name)
+        if not app_dir.exists():
+            emit(2, f"ERROR '{name}' isn't installed.")
+            return 1
+        emit(1, f"Uninstalling '{name}'.")
+        self._sleep("uninstall")
+        emit(1, f"Removing shim '{name}.shim'.")
+        shutil.rmtree(app_dir, ignore_errors=True)
+        emit(1, f"'{name}' was uninstalled.")
+        return 0
+
+    def _installed_version(self, name: str) -> Optional[str]:
+        try:
+            manifest = self._app_dir(name) / "current" / "manifest.json"
+            return json.loads(manifest.read_text(encoding="utf-8")).get("version")
+        except (OSError, ValueError):
+            return None
+
+    def _update(self, name: str, emit: Emit) -> int:
+        if not self._app_dir(name).exists():
+            emit(2, f"ERROR '{name}' isn't installed.")
+            return 1
+        latest = (self._resolve(name, emit) or (name, "main", None))[2]
+        installed = self._installed_version(name)
+        if latest is None or installed == latest:
+            emit(1, "Latest versions for all apps are installed! For more information try 'scoop status'")
+            return 0
+        self._sleep("update")
+        current = self._app_dir(name) / "current"
+        (current / "manifest.json").write_text(json.dumps({"version": latest}), encoding="utf-8")
+        emit(1, f"'{name}' was updated from {installed} to version {latest}.")
+        emit(1, f"'{name}' ({latest}) was installed successfully!")
+        return 0
+
+    def _status(self, emit: Emit) -> int:
+        self._sleep("list")
+        rows = []
+        for app_dir in sorted((self.root / "apps").glob("*")):
+            installed = self._installed_version(app_dir.name)
+            latest = self.catalog().get(app_dir.name.lower(), (None, None))[1]
+            if installed and latest and installed != latest:
+                rows.append(f"{app_dir.name} {installed} {latest}")
+        if rows:
+            emit(1, "Name Installed Version Latest Version Missing Dependencies Info")
+            emit(1, "---- ----------------- -------------- -------------------- ----")
+            for row in rows:
+                emit(1, row)
+        else:
+            emit(1, "Latest versions for all apps are installed! For more information try 'scoop status'")
+        return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Scoop-Ersatz für Benchmarks")
+    parser.add_argument("--root", required=True, type=Path)
+    parser.add_argument("--latency-scale", type=float, default=1.0)
+    parser.add_argument("command")
+    args = parser.parse_args(argv)
+    scoop = FakeScoop(args.root, args.latency_scale)
+    if args.command == ps_host.HOST_SCRIPT:
+        ps_host.serve(scoop.execute)
+        return 0
+
+    def emit(stream: int, text: str) -> None:
+        print(text, file=sys.stderr if stream == 2 else sys.stdout, flush=True)
+
+    return scoop.execute(args.command, emit)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
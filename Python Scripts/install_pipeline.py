@@ -0,0 +1,112 @@
+# Author: TheLionDeveloper44
+# Dieses Skript unterliegt der Lizenz, die in der LICENSE-Datei im Stammverzeichnis dieses Repositories enthalten ist.
+# Ohne ausdrückliche schriftliche Genehmigung ist es untersagt, dieses Skript zu kopieren, zu modifizieren oder zu verbreiten.
+
+# Installations-Pipeline: Pakete werden parallel vorab heruntergeladen ("scoop download"),
+# installiert wird danach in Abhängigkeitsreihenfolge aus dem bereits gefüllten Scoop-Cache.
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional
+
+
+def run_pipeline(
+    apps: List[str],
+    download: Callable[[str], None],
+    install: Callable[[str], None],
+    progress: Optional[Callable[[str], None]] = None,
+    concurrency: int = 4,
+    depends: Optional[Dict[str, List[str]]] = None,
+    install_concurrency: int = 1,
+    on_failed: Optional[Callable[[str, Exception], None]] = None,
+    on_skipped: Optional[Callable[[str, str], None]] = None,
+) -> None:
+    """Prefetch ``apps`` with up to ``concurrency`` parallel downloads and install them.
+
+    An app is installed as soon as its own download and all of its ``depends`` (within ``apps``)
+    are done, with up to ``install_concurrency`` installs at once; ready apps are started in the
+    order of ``apps``. A failed download is only reported: the install step downloads the package
+    itself. A failed install (``install`` raising) stops the pipeline; downloads and installs that
+    have not started yet are cancelled.
+
+    With ``on_failed`` a failed install is reported to it instead and the pipeline goes on; apps
+    that depend on the failed one (directly or not) are passed to ``on_skipped`` together with
+    the failed dependency and are not installed. ``on_failed`` may re-raise to stop after all.
+    """
+    total = len(apps)
+    position = {app: index for index, app in enumerate(apps, 1)}
+    depends = depends or {}
+    waiting_on = {app: {dep for dep in depends.get(app, []) if dep in position} for app in apps}
+
+    def emit(app: str, message: str) -> None:
+        if progress:
+            progress(f"[{position[app]}/{total}] {app}: {message}")
+
+    def prefetch(app: str) -> bool:
+        emit(app, "Download gestartet...")
+        try:
+            download(app)
+        except Exception as exc:  # noqa: BLE001
+            emit(app, f"Vorab-Download fehlgeschlagen ({exc}), wird bei der Installation geladen.")
+            return False
+        emit(app, "Download abgeschlossen.")
+        return True
+
+    def install_or_report(app: str) -> None:
+        try:
+            install(app)
+        except Exception as exc:  # noqa: BLE001
+            if on_failed is None:
+                raise
+            on_failed(app, exc)
+
+    if total <= 1:
+        # Nothing to overlap with, so a separate download step would only add a Scoop call
+        for app in apps:
+            install_or_report(app)
+        return
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix="scoop-download") as pool, \
+            ThreadPoolExecutor(max_workers=max(1, install_concurrency), thread_name_prefix="scoop-install") as installers:
+        downloads: Dict[str, Future] = {app: pool.submit(prefetch, app) for app in apps}
+
+        def download_then_install(app: str) -> None:
+            downloads[app].result()
+            install(app)
+
+        running: Dict[Future, str] = {}
+        done: set = set()
+        failed: Dict[str, str] = {}  # App that could not be installed -> failed app it is blocked by
+        try:
+            while waiting_on or running:
+                # In dependency order, so skipping an app also reaches the apps that depend on it
+                for app in apps:
+                    if app in waiting_on and waiting_on[app] & failed.keys():
+                        blocker = failed[min(waiting_on.pop(app) & failed.keys(), key=position.get)]
+                        failed[app] = blocker
+                        downloads[app].cancel()
+                        if on_skipped:
+                            on_skipped(app, blocker)
+                if not waiting_on and not running:
+                    break
+                for app in [a for a in apps if a in waiting_on and waiting_on[a] <= done]:
+                    if len(running) >= max(1, install_concurrency):
+                        break
+                    del waiting_on[app]
+                    running[installers.submit(download_then_install, app)] = app
+                if not running:
+                    raise RuntimeError("Zyklische Abhängigkeit: " + ", ".join(waiting_on))
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    app = running.pop(future)
+                    exc = future.exception()
+                    if exc is None:
+                        done.add(app)
+                    elif on_failed is None or not isinstance(exc, Exception):
+                        raise exc
+                    else:
+                        failed[app] = app
+                        on_failed(app, exc)
+        except BaseException:
+            for future in list(downloads.values()) + list(running):
+                future.cancel()
+            raise
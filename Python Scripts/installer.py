@@ -6,97 +6,257 @@
 
 import subprocess
 import json
+import os
+import queue
+import re
+import sqlite3
+import threading
+import time
 from pathlib import Path
-from typing import Iterable, Callable, Optional, List
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, Callable, Optional, List, Set
+
+import app_log
+import bucket_index
+import cache
+import diagnostics
+import inventory
+import job_queue
+import ps_host
+import scoop_progress
+import task_executor
+
+if TYPE_CHECKING:
+    import dependency_graph
+
+# concurrent.futures, dependency_graph and install_pipeline are imported where they are
+# used: a search or the start of the window should not pay for the install machinery.
 
 _POWER_SHELL = ["powershell", "-NoProfile", "-ExecutionPolicy", "Bypass", "-Command"]
 _BUCKETS_INITIALIZED = False
-_SEARCH_CACHE: dict[str, List[str]] = {}
-_BUCKET_CACHE: dict[str, str] = {}
+
+# Cache budgets: entries beyond these limits are evicted least-recently-used first.
+# Entries older than the TTL are still served, but trigger a refresh in the background.
+_SEARCH_CACHE_MAX_ENTRIES = 500
+_SEARCH_CACHE_MAX_BYTES = 1024 * 1024
+_SEARCH_CACHE_TTL = 24 * 3600.0
+_BUCKET_CACHE_MAX_ENTRIES = 5000
+_BUCKET_CACHE_MAX_BYTES = 512 * 1024
+_BUCKET_CACHE_TTL = 7 * 24 * 3600.0
+
+_SEARCH_CACHE = cache.BoundedCache(_SEARCH_CACHE_MAX_ENTRIES, _SEARCH_CACHE_MAX_BYTES, _SEARCH_CACHE_TTL)
+_BUCKET_CACHE = cache.BoundedCache(_BUCKET_CACHE_MAX_ENTRIES, _BUCKET_CACHE_MAX_BYTES, _BUCKET_CACHE_TTL)
+# Replaced as a whole (never changed in place) under the lock, so readers may use it without one
 _BUCKET_LIST_CACHE: Optional[set[str]] = None
+_BUCKET_LIST_LOCK = threading.Lock()
 
 # Persistent cache configuration
 # Caches are stored in the user's home directory under ".app_manager_cache"
 _CACHE_DIR = Path.home() / ".app_manager_cache"
+_STORE_FILE = _CACHE_DIR / "cache.sqlite3"
+_INDEX_FILE = _CACHE_DIR / "bucket_index.json"
+_LOG_DIR = _CACHE_DIR / "logs"
+_STORE: Optional[cache.CacheStore] = None
+
+# Former JSON cache files, migrated into the store once and then removed
 _SEARCH_CACHE_FILE = _CACHE_DIR / "search_cache.json"
 _BUCKET_CACHE_FILE = _CACHE_DIR / "bucket_cache.json"
 _BUCKET_LIST_CACHE_FILE = _CACHE_DIR / "bucket_list_cache.json"
 
+# Number of packages downloaded in parallel while installing
+# (kept below ps_host.MAX_HOSTS so the install step always finds a free host)
+_DOWNLOAD_CONCURRENCY = 3
+# Number of independent apps installed at the same time. Scoop updates PATH and shims with
+# read-modify-write steps, so parallel installs are opt-in.
+_INSTALL_CONCURRENCY = 1
+# A failed install is retried this many times, after _RETRY_BACKOFF seconds, doubling each time
+_INSTALL_RETRIES = int(os.environ.get("APP_MANAGER_INSTALL_RETRIES", "1"))
+_RETRY_BACKOFF = 2.0
+
+# Buckets added automatically for better search coverage
+# (override with a comma-separated list in APP_MANAGER_COMMON_BUCKETS)
+_COMMON_BUCKETS = [
+    b.strip().lower()
+    for b in os.environ.get("APP_MANAGER_COMMON_BUCKETS", "extras,versions,java,games").split(",")
+    if b.strip()
+]
+# Number of "scoop bucket add" clones running at the same time
+_BUCKET_ADD_CONCURRENCY = 4
+
+# Local manifest index (answers searches without "scoop search")
+# Checking the manifests on disk is cheap but not free, so it happens at most once per interval
+_INDEX_REFRESH_INTERVAL = 60.0
+_INDEX: Optional[bucket_index.BucketIndex] = None
+_INDEX_REFRESHED_AT = 0.0
+_INDEX_LOCK = threading.Lock()  # One refresh at a time, e.g. for overlapping as-you-type searches
+_INVENTORY: Optional[inventory.Inventory] = None
+_LAST_INVENTORY: Optional[List[inventory.InstalledApp]] = None  # Most recent read, persisted on exit
+_JOBS: Optional[job_queue.JobQueue] = None
+
+
+class BatchFailed(RuntimeError):
+    """Some apps of an install batch failed or were skipped; ``report`` holds every app's job."""
+
+    def __init__(self, report: List[job_queue.Job]):
+        failed = [job for job in report if job.state in (job_queue.FAILED, job_queue.SKIPPED)]
+        super().__init__(
+            f"{len(failed)} von {len(report)} App(s) nicht installiert:\n"
+            + "\n".join(job.describe() for job in failed)
+        )
+        self.report = report
+
+
+class NoMatches(RuntimeError):
+    """A search found no apps."""
+
+    def __init__(self, term: str):
+        super().__init__(f"Keine Treffer für '{term}' gefunden.")
+        self.term = term
+
 
 def _ensure_cache_dir() -> None:
     """Ensure cache directory exists."""
     _CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def _load_cache_from_disk() -> None:
-    """Load all caches from disk on startup."""
-    global _SEARCH_CACHE, _BUCKET_CACHE, _BUCKET_LIST_CACHE
-    
-    _ensure_cache_dir()
-    
-    # Load search cache
-    if _SEARCH_CACHE_FILE.exists():
-        try:
-            with open(_SEARCH_CACHE_FILE, "r", encoding="utf-8") as f:
-                _SEARCH_CACHE = json.load(f)
-        except (json.JSONDecodeError, IOError):
-            _SEARCH_CACHE = {}
-    
-    # Load bucket cache
-    if _BUCKET_CACHE_FILE.exists():
-        try:
-            with open(_BUCKET_CACHE_FILE, "r", encoding="utf-8") as f:
-                _BUCKET_CACHE = json.load(f)
-        except (json.JSONDecodeError, IOError):
-            _BUCKET_CACHE = {}
-    
-    # Load bucket list cache
-    if _BUCKET_LIST_CACHE_FILE.exists():
+def _migrate_json_caches(store: cache.CacheStore) -> None:
+    """Move entries from the former JSON cache files into the store (one transaction), then delete them."""
+    legacy = [_SEARCH_CACHE_FILE, _BUCKET_CACHE_FILE, _BUCKET_LIST_CACHE_FILE]
+    if not any(path.exists() for path in legacy):
+        return
+    loaded = {}
+    for path in legacy:
         try:
-            with open(_BUCKET_LIST_CACHE_FILE, "r", encoding="utf-8") as f:
-                _BUCKET_LIST_CACHE = set(json.load(f))
+            with open(path, "r", encoding="utf-8") as f:
+                loaded[path] = json.load(f)
         except (json.JSONDecodeError, IOError):
-            _BUCKET_LIST_CACHE = None
+            continue  # Missing or unreadable files have nothing worth migrating
+    with store.transaction():
+        if isinstance(loaded.get(_SEARCH_CACHE_FILE), dict):
+            _SEARCH_CACHE.load_dict(loaded[_SEARCH_CACHE_FILE])
+        if isinstance(loaded.get(_BUCKET_CACHE_FILE), dict):
+            _BUCKET_CACHE.load_dict(loaded[_BUCKET_CACHE_FILE])
+        if isinstance(loaded.get(_BUCKET_LIST_CACHE_FILE), list) and loaded[_BUCKET_LIST_CACHE_FILE]:
+            store.put("meta", "bucket_list", loaded[_BUCKET_LIST_CACHE_FILE])
+    for path in legacy:
+        path.unlink(missing_ok=True)
 
 
-def _save_search_cache() -> None:
-    """Save search cache to disk."""
+def _load_cache_from_disk() -> None:
+    """Open the cache store and load all caches on startup."""
+    global _STORE, _BUCKET_LIST_CACHE
+    
     _ensure_cache_dir()
     try:
-        with open(_SEARCH_CACHE_FILE, "w", encoding="utf-8") as f:
-            json.dump(_SEARCH_CACHE, f, indent=2)
-    except IOError:
-        pass  # Silently fail if unable to write
+        _STORE = cache.CacheStore(_STORE_FILE)
+    except sqlite3.Error:
+        _STORE = None  # Caches stay in memory for this session
+        return
 
+    _SEARCH_CACHE.attach(_STORE, "search")
+    _BUCKET_CACHE.attach(_STORE, "bucket")
+    _migrate_json_caches(_STORE)
 
-def _save_bucket_cache() -> None:
-    """Save bucket cache to disk."""
-    _ensure_cache_dir()
-    try:
-        with open(_BUCKET_CACHE_FILE, "w", encoding="utf-8") as f:
-            json.dump(_BUCKET_CACHE, f, indent=2)
-    except IOError:
-        pass  # Silently fail if unable to write
+    bucket_list = _STORE.get("meta", "bucket_list")
+    with _BUCKET_LIST_LOCK:
+        _BUCKET_LIST_CACHE = set(bucket_list) if bucket_list else None
 
 
 def _save_bucket_list_cache() -> None:
-    """Save bucket list cache to disk."""
-    global _BUCKET_LIST_CACHE
-    _ensure_cache_dir()
+    """Persist the known bucket list (search and bucket caches are written through on change)."""
+    if _STORE is not None:
+        _STORE.put("meta", "bucket_list", sorted(_BUCKET_LIST_CACHE or []))
+
+
+_CACHE_LOAD_LOCK = threading.Lock()
+_CACHES_LOADED = threading.Event()
+_CACHE_LOADER: Optional[threading.Thread] = None
+
+
+def _load_caches_once() -> None:
     try:
-        with open(_BUCKET_LIST_CACHE_FILE, "w", encoding="utf-8") as f:
-            json.dump(list(_BUCKET_LIST_CACHE) if _BUCKET_LIST_CACHE else [], f, indent=2)
-    except IOError:
-        pass  # Silently fail if unable to write
+        _load_cache_from_disk()
+    finally:
+        _CACHES_LOADED.set()
+
+
+def load_caches_in_background() -> None:
+    """Start loading the caches on a background thread, e.g. while the window is being built."""
+    global _CACHE_LOADER
+    with _CACHE_LOAD_LOCK:
+        if _CACHE_LOADER is not None or _CACHES_LOADED.is_set():
+            return
+        _CACHE_LOADER = threading.Thread(target=_load_caches_once, name="cache-loader", daemon=True)
+        _CACHE_LOADER.start()
+
+
+def start_logging() -> Optional[Path]:
+    """Write progress messages and failed Scoop output to the rotating log in the cache directory."""
+    return app_log.start(_LOG_DIR)
+
+
+def _wait_for_caches() -> None:
+    """Block until the caches are loaded; loads them right here if no background load was started."""
+    if _CACHES_LOADED.is_set():
+        return
+    with _CACHE_LOAD_LOCK:
+        if _CACHE_LOADER is None and not _CACHES_LOADED.is_set():
+            _load_caches_once()
+            return
+    _CACHES_LOADED.wait()
+
 
+def _get_index(force_refresh: bool = False) -> Optional[bucket_index.BucketIndex]:
+    """Return the local manifest index, or None if there are no Scoop buckets on this machine."""
+    global _INDEX, _INDEX_REFRESHED_AT
+    root = bucket_index.scoop_root()
+    with _INDEX_LOCK:
+        if _INDEX is None or _INDEX.root != root:
+            _INDEX = bucket_index.BucketIndex(root, _INDEX_FILE)
+            _INDEX_REFRESHED_AT = 0.0
+        if not _INDEX.available():
+            return None
+        now = time.monotonic()
+        if force_refresh or not _INDEX_REFRESHED_AT or now - _INDEX_REFRESHED_AT > _INDEX_REFRESH_INTERVAL:
+            with diagnostics.span("index: refresh", str(root)):
+                _INDEX.refresh()
+            _INDEX_REFRESHED_AT = now
+        return _INDEX
 
-# Load caches from disk on module import
-_load_cache_from_disk()
+
+def search_cache_status(term: str) -> str:
+    """Report how a search would be answered.
+
+    Returns ``cache.FRESH`` or ``cache.STALE`` for cached terms, ``"index"`` if the local manifest
+    index can answer, and ``cache.MISSING`` if Scoop has to be queried.
+    """
+    _wait_for_caches()
+    term = (term or "").strip()
+    status = _SEARCH_CACHE.status(term)
+    if status != cache.MISSING:
+        return status
+    if (bucket_index.scoop_root() / "buckets").is_dir():
+        return "index"
+    return cache.MISSING
 
 
 def is_search_cached(term: str) -> bool:
-    """Check if a search term is already cached."""
-    return (term or "").strip() in _SEARCH_CACHE
+    """Check if a search can be answered without querying Scoop (cached term or local index)."""
+    return search_cache_status(term) != cache.MISSING
+
+
+def instant_search(term: str, cancel: Optional[threading.Event] = None) -> Optional[List[str]]:
+    """Search the in-process manifest index only, for as-you-type filtering.
+
+    Never calls Scoop and never adds buckets. Returns None if there is no local index (the caller
+    then falls back to ``iter_search_apps``); an empty list means no matches. Once ``cancel`` is
+    set the scan stops early and its partial result should be discarded.
+    """
+    term = (term or "").strip()
+    index = _get_index()
+    if index is None or not index.bucket_names():
+        return None
+    should_stop = cancel.is_set if cancel is not None else None
+    return sorted({name for name, _bucket in index.search(term, should_stop)})
 
 
 def _emit(progress: Optional[Callable[[str], None]], message: str) -> None:
@@ -104,207 +264,952 @@ def _emit(progress: Optional[Callable[[str], None]], message: str) -> None:
         progress(message)
 
 
-def _run_ps(command: str) -> subprocess.CompletedProcess:
-    return subprocess.run(
+def _command_kind(command: str) -> str:
+    """Group commands for the diagnostics, e.g. "scoop bucket add extras" -> "scoop bucket add"."""
+    words = command.split(None, 3)
+    if len(words) > 2 and words[1] in ("bucket", "cache", "config"):
+        return " ".join(words[:3])
+    return " ".join(words[:2])
+
+
+def _run_ps(
+    command: str,
+    timeout: Optional[float] = None,
+    on_line: Optional[Callable[[int, str], None]] = None,
+    cancel: Optional[threading.Event] = None,
+) -> subprocess.CompletedProcess:
+    """Run a PowerShell command through the persistent host (or a fresh process if disabled).
+
+    Setting ``cancel`` kills the running process and raises ``ps_host.CommandCancelled``.
+    """
+    with diagnostics.span(_command_kind(command), command) as span:
+        span.cached = False
+        try:
+            if ps_host.enabled():
+                with ps_host.get_pool(_POWER_SHELL + [ps_host.HOST_SCRIPT]).lease() as host:
+                    result = host.run(command, timeout=timeout, on_line=on_line, cancel=cancel)
+            elif on_line is None and cancel is None:
+                result = subprocess.run(
+                    _POWER_SHELL + [command],
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout,
+                )
+            else:
+                result = _run_ps_streaming(command, timeout, on_line or (lambda stream, line: None), cancel)
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as exc:
+            app_log.command_failed(command, exc)
+            raise
+        span.completed(result)
+        return result
+
+
+def _run_ps_streaming(
+    command: str,
+    timeout: Optional[float],
+    on_line: Callable[[int, str], None],
+    cancel: Optional[threading.Event] = None,
+) -> subprocess.CompletedProcess:
+    """One-off PowerShell process whose output lines are passed to ``on_line`` as they arrive."""
+    proc = subprocess.Popen(
         _POWER_SHELL + [command],
-        check=True,
-        capture_output=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
         text=True,
+        encoding="utf-8",
+        errors="replace",
     )
+    stdout: List[str] = []
+    stderr: List[str] = []
+
+    def drain(pipe, stream: int, sink: List[str]) -> None:
+        for line in pipe:
+            line = line.rstrip("\r\n")
+            sink.append(line)
+            on_line(stream, line)
+
+    finished = threading.Event()
+    reason: List[str] = []
+    deadline = None if timeout is None else time.monotonic() + timeout
+
+    def watch() -> None:
+        while not finished.wait(0.2):
+            if cancel is not None and cancel.is_set():
+                reason.append("cancel")
+            elif deadline is not None and time.monotonic() > deadline:
+                reason.append("timeout")
+            else:
+                continue
+            proc.kill()
+            return
+
+    err_reader = threading.Thread(target=drain, args=(proc.stderr, 2, stderr), daemon=True)
+    err_reader.start()
+    threading.Thread(target=watch, daemon=True).start()
+    try:
+        drain(proc.stdout, 1, stdout)
+        returncode = proc.wait()
+        err_reader.join()
+    finally:
+        finished.set()
+    out, err = "\n".join(stdout), "\n".join(stderr)
+    if reason == ["cancel"]:
+        raise ps_host.CommandCancelled(command)
+    if reason == ["timeout"]:
+        raise subprocess.TimeoutExpired(command, timeout, output=out, stderr=err)
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, command, output=out, stderr=err)
+    return subprocess.CompletedProcess(command, returncode, stdout=out, stderr=err)
+
+
+def _stream_ps(command: str, cancel: Optional[threading.Event] = None) -> Iterator[List[str]]:
+    """Run a command in the background and yield its stdout lines in batches as they arrive.
+
+    Each batch holds every line that arrived since the previous one. Raises like ``_run_ps``
+    once the command has finished with an error. Setting ``cancel`` or closing the generator
+    early kills the command.
+    """
+    lines: "queue.Queue[tuple]" = queue.Queue()
+    done = object()
+    stop = cancel or threading.Event()
+
+    def worker() -> None:
+        try:
+            _run_ps(command, on_line=lambda stream, line: lines.put((stream, line)), cancel=stop)
+            lines.put((done, None))
+        except BaseException as exc:  # noqa: BLE001 - re-raised in the consuming thread
+            lines.put((done, exc))
+
+    threading.Thread(target=worker, daemon=True).start()
+    try:
+        while True:
+            batch: List[str] = []
+            item = lines.get()
+            while True:
+                stream, payload = item
+                if stream is done:
+                    if batch:
+                        yield batch
+                    if payload is not None:
+                        raise payload
+                    return
+                if stream == 1:
+                    batch.append(payload)
+                try:
+                    item = lines.get_nowait()
+                except queue.Empty:
+                    break
+            if batch:
+                yield batch
+    except GeneratorExit:
+        stop.set()
+        raise
 
 
 def ensure_scoop_available(progress: Optional[Callable[[str], None]] = None) -> None:
     _emit(progress, "Prüfe auf Scoop...")
     try:
-        _run_ps("scoop --version")
+        # Searches and installs starting at the same time share a single check
+        task_executor.get_executor().run(("scoop --version",), lambda cancel: _run_ps("scoop --version"))
     except subprocess.CalledProcessError as exc:
         raise RuntimeError(
             "Scoop ist nicht installiert. Bitte installieren Sie Scoop zuerst: https://scoop.sh/"
         ) from exc
 
 
-def ensure_common_buckets(progress: Optional[Callable[[str], None]] = None) -> None:
-    """Ensure common Scoop buckets are added for better search coverage (cached after first run)."""
+def _parse_bucket_list(stdout: str) -> set[str]:
+    """Parse "scoop bucket list" output (plain names or the table format) into bucket names."""
+    names = set()
+    for line in stdout.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith("-"):
+            continue
+        token = stripped.split()[0].lower()
+        if token != "name":
+            names.add(token)
+    return names
+
+
+def _refresh_bucket_list() -> set[str]:
+    """Read the added buckets from Scoop and remember them."""
+    _wait_for_caches()
+
+    def refresh(cancel: threading.Event) -> set[str]:
+        global _BUCKET_LIST_CACHE
+        found = _parse_bucket_list(_run_ps("scoop bucket list").stdout)
+        with _BUCKET_LIST_LOCK:
+            _BUCKET_LIST_CACHE = found
+        _save_bucket_list_cache()
+        return found
+
+    return task_executor.get_executor().run(("scoop bucket list",), refresh)
+
+
+def _add_buckets(buckets: List[str], progress: Optional[Callable[[str], None]] = None) -> Dict[str, Optional[str]]:
+    """Add buckets concurrently (bounded); returns {bucket: error message or None}."""
+    def add(bucket: str) -> Optional[str]:
+        _emit(progress, f"Füge Bucket '{bucket}' hinzu...")
+        try:
+            # Two clones of the same bucket at once would fight over the same directory
+            task_executor.get_executor().run(
+                ("scoop bucket add", bucket), lambda cancel: _run_ps(f"scoop bucket add {bucket}")
+            )
+        except subprocess.CalledProcessError as exc:
+            stderr = exc.stderr.strip() if exc.stderr else ""
+            stdout = exc.stdout.strip() if exc.stdout else ""
+            detail = stderr or stdout or "unbekannter Fehler"
+            _emit(progress, f"✗ Bucket '{bucket}' konnte nicht hinzugefügt werden: {detail}")
+            return detail
+        _emit(progress, f"✓ Bucket '{bucket}' hinzugefügt.")
+        return None
+
+    if not buckets:
+        return {}
+    from concurrent.futures import ThreadPoolExecutor
+
+    _wait_for_caches()
+    with ThreadPoolExecutor(max_workers=min(len(buckets), _BUCKET_ADD_CONCURRENCY)) as pool:
+        results = dict(zip(buckets, pool.map(add, buckets)))
+    added = {bucket for bucket, error in results.items() if error is None}
+    if added:
+        global _BUCKET_LIST_CACHE
+        with _BUCKET_LIST_LOCK:
+            if _BUCKET_LIST_CACHE is not None:
+                _BUCKET_LIST_CACHE = _BUCKET_LIST_CACHE | added
+        _save_bucket_list_cache()
+    return results
+
+
+def ensure_common_buckets(
+    progress: Optional[Callable[[str], None]] = None, buckets: Optional[Iterable[str]] = None
+) -> Dict[str, Optional[str]]:
+    """Add the common buckets (or ``buckets``) in parallel for better search coverage.
+
+    Returns {bucket: error message or None} for every bucket that had to be added. Buckets known
+    to be present are remembered in the cache store, so later sessions skip "scoop bucket list".
+    """
     global _BUCKETS_INITIALIZED
-    if _BUCKETS_INITIALIZED:
-        return
-    
-    common_buckets = ["extras", "versions", "java", "games"]
-    res = _run_ps("scoop bucket list")
-    existing = {ln.strip().lower() for ln in res.stdout.splitlines() if ln.strip()}
-    
-    for bucket in common_buckets:
-        if bucket not in existing:
-            try:
-                _emit(progress, f"Füge Bucket '{bucket}' für bessere Suchergebnisse hinzu...")
-                _run_ps(f"scoop bucket add {bucket}")
-            except subprocess.CalledProcessError:
-                # Silently continue if bucket can't be added
-                pass
-    
-    _BUCKETS_INITIALIZED = True
+    default = buckets is None
+    if default and _BUCKETS_INITIALIZED:
+        return {}
+    wanted = sorted({b.lower() for b in (_COMMON_BUCKETS if default else buckets)})
+    _wait_for_caches()
+    with diagnostics.span("cache: common buckets", ", ".join(wanted)) as span:
+        known = set(_STORE.get("meta", "common_buckets", [])) if _STORE is not None else set()
+        span.cached = set(wanted) <= known
+    if set(wanted) <= known:
+        _BUCKETS_INITIALIZED = _BUCKETS_INITIALIZED or default
+        return {}
+
+    existing = _refresh_bucket_list()
+    missing = [bucket for bucket in wanted if bucket not in existing]
+    if missing:
+        _emit(progress, f"Füge {len(missing)} Bucket(s) für bessere Suchergebnisse hinzu...")
+    results = _add_buckets(missing, progress)
+    present = {bucket for bucket in wanted if results.get(bucket) is None}
+    if _STORE is not None:
+        # Failed buckets are not remembered, so the next session tries them again
+        _STORE.put("meta", "common_buckets", sorted(known | present))
+    _BUCKETS_INITIALIZED = _BUCKETS_INITIALIZED or default
+    return results
+
+
+class _SearchOutputParser:
+    """Parse "scoop search" output line by line into (name, bucket) pairs.
+
+    Handles both the older "bucket/name" lines and the table format ("Name Version Source ...");
+    bucket is None if the output does not show it.
+    """
+
+    def __init__(self):
+        self._table = False
+
+    def feed(self, line: str) -> Optional[tuple[str, Optional[str]]]:
+        stripped = line.strip()
+        if not stripped:
+            return None
+        low = stripped.lower()
+        if low.startswith("name"):
+            self._table = "source" in low.split()
+            return None
+        if "result" in low or stripped.startswith("-") or low.endswith("bucket:"):
+            return None
+        tokens = stripped.split()
+        token = tokens[0]
+        if "/" in token:
+            bucket, name = token.split("/", 1)
+            return name, bucket.lower()
+        if self._table and len(tokens) >= 3:
+            return token, tokens[2].lower()
+        return token, None
+
+
+def _parse_search_output(stdout: str) -> List[tuple[str, Optional[str]]]:
+    """Parse complete "scoop search" output into (name, bucket) pairs."""
+    parser = _SearchOutputParser()
+    return [found for found in map(parser.feed, stdout.splitlines()) if found]
+
+
+def _search_index(term: str, progress: Optional[Callable[[str], None]] = None) -> Optional[List[str]]:
+    """Answer a search from the local manifest index; None if the index is not usable."""
+    index = _get_index()
+    if index is None:
+        return None
+    if not _BUCKETS_INITIALIZED and not set(_COMMON_BUCKETS) <= set(index.bucket_names()):
+        ensure_scoop_available(progress)
+        ensure_common_buckets(progress)
+        index = _get_index(force_refresh=True)
+    _emit(progress, f"Suche nach '{term}' (lokaler Index)...")
+    apps: List[str] = []
+    for name, _bucket in index.search(term):
+        apps.append(name)
+    if not apps:
+        raise NoMatches(term)
+    return sorted(dict.fromkeys(apps))
 
 
 def search_apps(term: str, progress: Optional[Callable[[str], None]] = None) -> List[str]:
-    global _SEARCH_CACHE, _BUCKET_CACHE
+    apps = [app for batch in iter_search_apps(term, progress) for app in batch]
+    return sorted(dict.fromkeys(apps))
+
+
+def iter_search_apps(
+    term: str,
+    progress: Optional[Callable[[str], None]] = None,
+    cancel: Optional[threading.Event] = None,
+) -> Iterator[List[str]]:
+    """Like ``search_apps``, but yields results in batches as soon as they are known.
+
+    Cached and indexed searches yield a single batch; a Scoop search yields a batch whenever new
+    output lines arrive, so the first results show up before the whole search has finished.
+    Setting ``cancel`` stops a running Scoop search (``ps_host.CommandCancelled`` is raised).
+    """
     term = (term or "").strip()
     if len(term) < 2:
         raise ValueError("Bitte mindestens 2 Zeichen für die Suche eingeben.")
-    
-    if term in _SEARCH_CACHE:
+    _wait_for_caches()
+
+    with diagnostics.span("cache: search", term) as span:
+        status = _SEARCH_CACHE.status(term)
+        span.cached = status != cache.MISSING
+    _SEARCH_CACHE.record_lookup(status != cache.MISSING)
+    if status == cache.FRESH:
         _emit(progress, f"Suche nach '{term}' (cached)...")
-        return _SEARCH_CACHE[term]
-    
+        yield _SEARCH_CACHE.get(term)
+        return
+    if status == cache.STALE:
+        _emit(progress, f"Suche nach '{term}' (cached, wird im Hintergrund aktualisiert)...")
+        _revalidate_search(term)
+        yield _SEARCH_CACHE.get(term)
+        return
+
+    with diagnostics.span("index: search", term) as span:
+        indexed = _search_index(term, progress)
+        span.cached = indexed is not None
+    if indexed is not None:
+        yield indexed
+        return
+
+    yield from _iter_search_scoop(term, progress, cancel)
+
+
+def _revalidate_search(term: str) -> None:
+    """Refresh a stale search result on the shared executor (at most one refresh per term)."""
+
+    def worker(cancel: threading.Event) -> None:
+        try:
+            for _batch in _iter_search_scoop(term, cancel=cancel):
+                pass
+        except (RuntimeError, subprocess.SubprocessError, OSError):
+            pass  # Keep serving the stale entry
+
+    task_executor.get_executor().submit(("revalidate search", term.lower()), worker)
+
+
+def _iter_search_scoop(
+    term: str,
+    progress: Optional[Callable[[str], None]] = None,
+    cancel: Optional[threading.Event] = None,
+) -> Iterator[List[str]]:
+    """Stream "scoop search" results for ``term``; the complete result is cached at the end."""
     ensure_scoop_available(progress)
     ensure_common_buckets(progress)
     _emit(progress, f"Suche nach '{term}' (Erstmalige Suche, Ergebnisse werden für schnellere zukünftige Suchen gecacht)...")
+    parser = _SearchOutputParser()
+    seen: set[str] = set()
     try:
-        result = _run_ps(f"scoop search {term}")
+        for lines in _stream_ps(f"scoop search {term}", cancel):
+            batch: List[str] = []
+            for name, bucket in filter(None, map(parser.feed, lines)):
+                if bucket:
+                    _BUCKET_CACHE[name.lower()] = bucket
+                if name not in seen:
+                    seen.add(name)
+                    batch.append(name)
+            if batch:
+                yield batch
     except subprocess.CalledProcessError as exc:
         stderr = exc.stderr.strip() if exc.stderr else "unknown error"
         raise RuntimeError(f"Suche fehlgeschlagen: {stderr}") from exc
 
-    apps: List[str] = []
-    for line in result.stdout.splitlines():
-        stripped = line.strip()
-        if not stripped:
-            continue
-        low = stripped.lower()
-        if "result" in low or stripped.startswith("-") or low.startswith("name"):
-            continue
-        token = stripped.split()[0]
-        if "/" in token:
-            bucket, name = token.split("/", 1)
-            _BUCKET_CACHE[name.lower()] = bucket.lower()
-            token = name
-        if token:
-            apps.append(token)
+    if not seen:
+        raise NoMatches(term)
+    _SEARCH_CACHE[term] = sorted(seen)
 
-    if not apps:
-        raise RuntimeError(f"Keine Treffer für '{term}' gefunden.")
-    
-    result_list = sorted(dict.fromkeys(apps))
-    _SEARCH_CACHE[term] = result_list
-    _save_search_cache()
-    _save_bucket_cache()
-    return result_list
+
+def resolve_buckets(apps: Iterable[str], progress: Optional[Callable[[str], None]] = None) -> Dict[str, Optional[str]]:
+    """Resolve the bucket of every app in one pass.
+
+    Uses fresh cache entries first, then the local manifest index, and only for the remaining apps
+    a single "scoop search" with an exact-name pattern. Apps without a known bucket map to None.
+    """
+    apps = list(dict.fromkeys(apps))
+    _wait_for_caches()
+    index = _get_index()
+    resolved: Dict[str, Optional[str]] = {}
+    unknown: List[str] = []
+    with diagnostics.span("cache: bucket", ", ".join(apps)) as span:
+        for app in apps:
+            status = _BUCKET_CACHE.status(app.lower())
+            hit = status == cache.FRESH or (status == cache.STALE and index is None)
+            _BUCKET_CACHE.record_lookup(hit)
+            if hit:
+                resolved[app] = _BUCKET_CACHE.get(app.lower())
+            elif index is not None:
+                buckets = index.buckets_for(app)
+                resolved[app] = buckets[0] if buckets else None
+            else:
+                unknown.append(app)
+        span.cached = not unknown
+
+    if unknown:
+        pattern = "^(" + "|".join(re.escape(app) for app in unknown) + ")$"
+        _emit(progress, f"Suche Buckets für {len(unknown)} App(s)...")
+        try:
+            res = _run_ps(f"scoop search '{pattern}'")
+            found: Dict[str, set] = {}
+            for name, bucket in _parse_search_output(res.stdout):
+                if bucket:
+                    found.setdefault(name.lower(), set()).add(bucket)
+        except subprocess.CalledProcessError:
+            found = {}
+        for app in unknown:
+            buckets = found.get(app.lower())
+            resolved[app] = sorted(buckets)[0] if buckets else None
+
+    for app, bucket in resolved.items():
+        if bucket:
+            if _BUCKET_CACHE.status(app.lower()) != cache.FRESH:
+                _BUCKET_CACHE[app.lower()] = bucket
+            _emit(progress, f"Bucket für {app}: {bucket}")
+    return resolved
+
+
+def ensure_buckets(buckets: Iterable[str], progress: Optional[Callable[[str], None]] = None) -> None:
+    """Make sure all ``buckets`` are added, listing the existing ones at most once."""
+    wanted = sorted({b.lower() for b in buckets if b})
+    if not wanted:
+        return
+    _wait_for_caches()
+    existing = _BUCKET_LIST_CACHE
+    with diagnostics.span("cache: bucket list", ", ".join(wanted)) as span:
+        span.cached = existing is not None and set(wanted) <= existing
+    if existing is None or not set(wanted) <= existing:
+        # Refresh before adding anything; the cached list may predate buckets added elsewhere
+        existing = _refresh_bucket_list()
+
+    failed = {bucket: error for bucket, error in _add_buckets([b for b in wanted if b not in existing], progress).items() if error}
+    if failed:
+        details = "; ".join(f"{bucket}: {error}" for bucket, error in failed.items())
+        raise RuntimeError(f"Bucket(s) konnten nicht hinzugefügt werden: {details}")
 
 
 def _discover_bucket_for_app(app: str, progress: Optional[Callable[[str], None]] = None) -> Optional[str]:
-    global _BUCKET_CACHE
-    app_lower = app.lower()
-    
-    if app_lower in _BUCKET_CACHE:
-        bucket = _BUCKET_CACHE[app_lower]
-        _emit(progress, f"Bucket für {app} (gecacht): {bucket}")
-        return bucket
-    
+    return resolve_buckets([app], progress).get(app)
+
+
+def ensure_bucket(bucket: str, progress: Optional[Callable[[str], None]] = None) -> None:
+    ensure_buckets([bucket], progress)
+
+
+def _run_tracked(
+    command: str,
+    parser: scoop_progress.OutputParser,
+    progress: Optional[Callable[[str], None]] = None,
+    cancel: Optional[threading.Event] = None,
+) -> subprocess.CompletedProcess:
+    """Run a Scoop command, streaming its output to ``progress`` and ``parser`` line by line."""
+    def on_line(stream: int, line: str) -> None:
+        parser.feed(line)
+        text = line.rsplit("\r", 1)[-1].strip()
+        if text and not (parser.phase == scoop_progress.DOWNLOAD and text.endswith("%")):
+            _emit(progress, f"    {parser.app}: {text}")
+
+    cache_dir = scoop_progress.scoop_cache_dir(bucket_index.scoop_root())
+    with scoop_progress.DownloadWatcher(cache_dir, parser):
+        return _run_ps(command, on_line=on_line, cancel=cancel)
+
+
+def _no_event(event: scoop_progress.ProgressEvent) -> None:
+    pass
+
+
+def split_app_ref(ref: str) -> tuple[Optional[str], str, Optional[str]]:
+    """Split an app reference "[bucket/]name[@version]" into (bucket, name, version)."""
+    bucket: Optional[str] = None
+    version: Optional[str] = None
+    if "@" in ref:
+        ref, version = ref.rsplit("@", 1)
+    if "/" in ref:
+        bucket, ref = ref.split("/", 1)
+    return bucket or None, ref, version or None
+
+
+def _error_detail(exc: subprocess.CalledProcessError) -> str:
+    stderr = exc.stderr.strip() if exc.stderr else ""
+    stdout = exc.stdout.strip() if exc.stdout else ""
+    return stderr or stdout or "unbekannter Fehler"
+
+
+def _download_app(
+    app: str,
+    parser: Optional[scoop_progress.OutputParser] = None,
+    cancel: Optional[threading.Event] = None,
+) -> None:
+    """Fetch an app's package into Scoop's download cache without installing it."""
+    parser = parser or scoop_progress.OutputParser(split_app_ref(app)[1], 1, 1, _no_event)
+    _run_tracked(f"scoop download {app}", parser, cancel=cancel)
+
+
+def _install_app(
+    app: str,
+    progress: Optional[Callable[[str], None]] = None,
+    parser: Optional[scoop_progress.OutputParser] = None,
+    cancel: Optional[threading.Event] = None,
+) -> None:
+    parser = parser or scoop_progress.OutputParser(split_app_ref(app)[1], 1, 1, _no_event)
+    _emit(progress, f"Installiere {app}...")
     try:
-        res = _run_ps(f"scoop search {app}")
-    except subprocess.CalledProcessError:
+        _run_tracked(f"scoop install {app}", parser, progress, cancel)
+        parser.event(scoop_progress.DONE)
+        _emit(progress, f"✓ {app} installiert.")
+    except subprocess.CalledProcessError as exc:
+        parser.event(scoop_progress.FAILED)
+        raise RuntimeError(f"Installation von {app} fehlgeschlagen: {_error_detail(exc)}") from exc
+
+
+def _plan_dependencies(
+    apps: List[str], installed: Iterable[str], progress: Optional[Callable[[str], None]] = None
+) -> Optional["dependency_graph.InstallPlan"]:
+    """Build the dependency plan from the manifest index; None if no index is available."""
+    import dependency_graph
+
+    index = _get_index()
+    if index is None:
+        _emit(progress, "Kein lokaler Manifest-Index, Abhängigkeiten werden von Scoop aufgelöst.")
         return None
-    buckets = set()
-    for line in res.stdout.splitlines():
-        stripped = line.strip()
-        if not stripped:
-            continue
-        low = stripped.lower()
-        if "result" in low or stripped.startswith("-") or low.startswith("name"):
-            continue
-        token = stripped.split()[0]
-        if "/" in token:
-            bucket, name = token.split("/", 1)
-            if name.lower() == app_lower:
-                buckets.add(bucket.lower())
-                _BUCKET_CACHE[app_lower] = bucket.lower()
-    if buckets:
-        chosen = sorted(buckets)[0]
-        _emit(progress, f"Bucket für {app} gefunden: {chosen}")
-        return chosen
-    return None
+    plan = dependency_graph.build_plan(apps, index.manifest_info, installed)
+    if plan.added:
+        _emit(progress, f"Zusätzliche Abhängigkeiten: {', '.join(plan.added)}")
+    for app, suggested in plan.suggestions.items():
+        _emit(progress, f"Hinweis: {app} empfiehlt zusätzlich {', '.join(suggested)}")
+    return plan
 
 
-def ensure_bucket(bucket: str, progress: Optional[Callable[[str], None]] = None) -> None:
-    global _BUCKET_LIST_CACHE
-    
-    if _BUCKET_LIST_CACHE is None:
-        res = _run_ps("scoop bucket list")
-        _BUCKET_LIST_CACHE = {ln.strip().lower() for ln in res.stdout.splitlines() if ln.strip()}
-        _save_bucket_list_cache()
-    
-    if bucket.lower() not in _BUCKET_LIST_CACHE:
-        _emit(progress, f"Füge Bucket '{bucket}' hinzu...")
-        try:
-            _run_ps(f"scoop bucket add {bucket}")
-            _BUCKET_LIST_CACHE.add(bucket.lower())
-            _save_bucket_list_cache()
-        except subprocess.CalledProcessError as exc:
-            stderr = exc.stderr.strip() if exc.stderr else "unknown error"
-            raise RuntimeError(f"Bucket '{bucket}' konnte nicht hinzugefügt werden: {stderr}") from exc
+def install_apps(
+    apps: Iterable[str],
+    progress: Optional[Callable[[str], None]] = None,
+    concurrency: Optional[int] = None,
+    installed: Iterable[str] = (),
+    install_concurrency: Optional[int] = None,
+    on_event: Optional[Callable[[scoop_progress.ProgressEvent], None]] = None,
+    cancel: Optional[threading.Event] = None,
+    retries: Optional[int] = None,
+    resume: bool = False,
+) -> List[job_queue.Job]:
+    """Install apps and their manifest dependencies.
 
+    Apps may be given as "[bucket/]name[@version]"; the bucket is added if needed and the
+    reference is passed to Scoop unchanged. Dependencies come first (already ``installed`` ones
+    are skipped), up to ``concurrency`` packages are downloaded in parallel, and up to
+    ``install_concurrency`` independent apps are installed at once. Missing or cyclic
+    dependencies are reported before anything starts. Scoop's output is streamed to ``progress``;
+    ``on_event`` receives parsed download/extract/install progress per app. Setting ``cancel``
+    kills the running Scoop commands.
 
-def install_apps(apps: Iterable[str], progress: Optional[Callable[[str], None]] = None) -> None:
-    apps = list(apps)
-    if not apps:
-        return
-    ensure_scoop_available(progress)
-    for app in apps:
-        bucket = _discover_bucket_for_app(app, progress)
+    Every app's state is kept in a persistent job queue: a failed install is retried
+    (``retries``, default APP_MANAGER_INSTALL_RETRIES) and the batch goes on without it, skipping
+    only the apps that depend on it. Returns the per-app report, or raises ``BatchFailed`` with
+    it if any app was not installed. A new batch discards the unfinished jobs of an interrupted
+    one (and says so); ``resume_install_jobs`` continues it instead (``resume``).
+    """
+    import install_pipeline
+
+    refs: Dict[str, str] = {}  # Plain name -> reference as given
+    pinned: Dict[str, str] = {}
+    for ref in dict.fromkeys(apps):
+        bucket, name, _version = split_app_ref(ref)
+        refs[name] = ref
         if bucket:
-            ensure_bucket(bucket, progress)
-        _emit(progress, f"Installiere {app}...")
-        try:
-            _run_ps(f"scoop install {app}")
-            _emit(progress, f"✓ {app} installiert.")
-        except subprocess.CalledProcessError as exc:
-            stderr = exc.stderr.strip() if exc.stderr else ""
-            stdout = exc.stdout.strip() if exc.stdout else ""
-            detail = stderr or stdout or "unbekannter Fehler"
-            raise RuntimeError(f"Installation von {app} fehlgeschlagen: {detail}") from exc
+            pinned[name] = bucket
+    if not refs:
+        return []
+    names = list(refs)
+    plan = _plan_dependencies(names, installed, progress)
+    order = plan.order if plan else names
+    ensure_scoop_available(progress)
+    explicit = dict(plan.buckets) if plan else {}
+    explicit.update(pinned)
+    buckets = resolve_buckets([app for app in order if app not in explicit], progress)
+    buckets.update(explicit)
+    ensure_buckets(buckets.values(), progress)
+    parsers = {
+        app: scoop_progress.OutputParser(app, index, len(order), on_event or _no_event)
+        for index, app in enumerate(order, 1)
+    }
+    jobs = _get_job_queue()
+    abandoned = jobs.start({app: refs.get(app, app) for app in order}, resume=resume)
+    if abandoned:
+        _emit(
+            progress,
+            "⤼ Unterbrochene Installation verworfen: " + ", ".join(job.ref for job in abandoned),
+        )
+    retries = _INSTALL_RETRIES if retries is None else retries
+
+    def install(app: str) -> None:
+        for attempt in range(retries + 1):
+            jobs.mark(app, job_queue.RUNNING)
+            try:
+                _install_app(refs.get(app, app), progress, parsers[app], cancel)
+            except RuntimeError as exc:
+                if attempt == retries:
+                    raise
+                delay = _RETRY_BACKOFF * 2 ** attempt
+                _emit(progress, f"{exc}\nNeuer Versuch in {delay:.0f} s...")
+                jobs.mark(app, job_queue.PENDING, str(exc))
+                if (cancel or threading.Event()).wait(delay):
+                    raise ps_host.CommandCancelled(f"scoop install {refs.get(app, app)}") from exc
+            else:
+                jobs.mark(app, job_queue.DONE)
+                return
+
+    def failed(app: str, exc: Exception) -> None:
+        if isinstance(exc, ps_host.CommandCancelled):
+            raise exc
+        jobs.mark(app, job_queue.FAILED, str(exc))
+
+    def skipped(app: str, blocker: str) -> None:
+        jobs.mark(app, job_queue.SKIPPED, f"übersprungen, da {blocker} fehlgeschlagen ist")
+        _emit(progress, f"⤼ {app} übersprungen, da {blocker} fehlgeschlagen ist.")
+
+    try:
+        install_pipeline.run_pipeline(
+            order,
+            download=lambda app: _download_app(refs.get(app, app), parsers[app], cancel),
+            install=install,
+            progress=progress,
+            concurrency=concurrency or _DOWNLOAD_CONCURRENCY,
+            depends=plan.depends if plan else None,
+            install_concurrency=install_concurrency or _INSTALL_CONCURRENCY,
+            on_failed=failed,
+            on_skipped=skipped,
+        )
+    except ps_host.CommandCancelled:
+        # A cancelled batch is not resumed at the next start
+        jobs.abandon("abgebrochen")
+        raise
+    finally:
+        # Also after a failure: apps installed before it are part of the inventory now
+        _invalidate_inventory()
+    report = jobs.jobs()
+    _emit(progress, "Ergebnis:\n" + "\n".join(f"  {job.describe()}" for job in report))
+    if any(job.state != job_queue.DONE for job in report):
+        raise BatchFailed(report)
     _emit(progress, "Alle ausgewählten Apps verarbeitet.")
+    return report
 
 
-def list_installed_apps(progress: Optional[Callable[[str], None]] = None) -> List[str]:
-    """List all currently installed scoop applications."""
+def _get_job_queue() -> job_queue.JobQueue:
+    global _JOBS
+    _wait_for_caches()
+    if _JOBS is None:
+        _JOBS = job_queue.JobQueue(_STORE)
+    return _JOBS
+
+
+def unfinished_install_jobs() -> List[job_queue.Job]:
+    """Apps of an install batch that was interrupted (crash, power loss, closed window)."""
+    return _get_job_queue().unfinished()
+
+
+def discard_install_jobs() -> None:
+    """Give up on an interrupted install batch; its open apps are reported as skipped."""
+    _get_job_queue().abandon("verworfen")
+
+
+def resume_install_jobs(
+    progress: Optional[Callable[[str], None]] = None,
+    on_event: Optional[Callable[[scoop_progress.ProgressEvent], None]] = None,
+    cancel: Optional[threading.Event] = None,
+) -> List[job_queue.Job]:
+    """Continue an interrupted install batch; returns the report of the whole batch.
+
+    Apps that were running when the batch stopped and are installed by now count as done.
+    """
+    jobs = _get_job_queue()
+    unfinished = jobs.unfinished()
+    if not unfinished:
+        return jobs.jobs()
+    _emit(progress, f"Setze unterbrochene Installation fort ({len(unfinished)} App(s) offen)...")
+    installed = list_installed_apps(progress)
+    present = {app.lower() for app in installed}
+    for job in unfinished:
+        if job.name.lower() in present:
+            jobs.mark(job.name, job_queue.DONE)
+    remaining = [job.ref for job in unfinished if job.name.lower() not in present]
+    if not remaining:
+        return jobs.jobs()
+    return install_apps(remaining, progress, installed=installed, on_event=on_event, cancel=cancel, resume=True)
+
+
+def _get_inventory() -> inventory.Inventory:
+    global _INVENTORY
+    root = bucket_index.scoop_root()
+    if _INVENTORY is None or _INVENTORY.root != root:
+        _INVENTORY = inventory.Inventory(root, inventory.scoop_global_root())
+    return _INVENTORY
+
+
+def _invalidate_inventory() -> None:
+    if _INVENTORY is not None:
+        _INVENTORY.invalidate()
+
+
+def installed_inventory(progress: Optional[Callable[[str], None]] = None) -> List[inventory.InstalledApp]:
+    """Return a record (name, version, bucket, install time) for every installed app.
+
+    Read from the Scoop apps directories and cached until they change; "scoop list" is only
+    used if the apps directory cannot be found.
+    """
+    inv = _get_inventory()
+    if inv.available():
+        _emit(progress, "Lese installierte Apps...")
+        with diagnostics.span("cache: inventory", str(inv.root)) as span:
+            rescans = inv.rescans
+            apps = inv.read()
+            span.cached = inv.rescans == rescans
+        return _remember_inventory(apps)
     ensure_scoop_available(progress)
     _emit(progress, "Liste installierte Apps auf...")
     try:
-        result = _run_ps("scoop list")
+        result = task_executor.get_executor().run(("scoop list",), lambda cancel: _run_ps("scoop list"))
     except subprocess.CalledProcessError as exc:
         stderr = exc.stderr.strip() if exc.stderr else "unbekannter Fehler"
         raise RuntimeError(f"Fehler beim Auflisten der Apps: {stderr}") from exc
-    
-    apps: List[str] = []
-    for line in result.stdout.splitlines():
-        stripped = line.strip()
-        if not stripped:
-            continue
-        low = stripped.lower()
-        # Skip header lines, separators, and column headers
-        if "name" in low or "installed" in low or stripped.startswith("-"):
-            continue
-        # Extract app name (first token before whitespace)
-        token = stripped.split()[0]
-        if token:
-            apps.append(token)
-    
+    return _remember_inventory(inventory.parse_scoop_list(result.stdout))
+
+
+def _remember_inventory(apps: List[inventory.InstalledApp]) -> List[inventory.InstalledApp]:
+    global _LAST_INVENTORY
+    _LAST_INVENTORY = apps
     return apps
 
 
-def uninstall_apps(apps: Iterable[str], progress: Optional[Callable[[str], None]] = None) -> None:
+def load_installed_snapshot() -> Optional[dict]:
+    """Return the installed apps and buckets saved by the previous session, or None.
+
+    The result has the keys "installed" (list of inventory records as dicts), "buckets" and
+    "saved_at" (epoch seconds). Meant to be shown right away while the real state is re-read.
+    """
+    _wait_for_caches()
+    if _STORE is None:
+        return None
+    snapshot = _STORE.get("meta", "installed_snapshot")
+    if not isinstance(snapshot, dict) or not isinstance(snapshot.get("installed"), list):
+        return None
+    snapshot.setdefault("buckets", sorted(_BUCKET_LIST_CACHE or []))
+    return snapshot
+
+
+def save_session_state() -> None:
+    """Persist the last read inventory and the bucket list for an instant start next time."""
+    _wait_for_caches()
+    if _STORE is None:
+        return
+    _save_bucket_list_cache()
+    if _LAST_INVENTORY is not None:
+        _STORE.put(
+            "meta",
+            "installed_snapshot",
+            {
+                "installed": [app.to_dict() for app in _LAST_INVENTORY],
+                "buckets": sorted(_BUCKET_LIST_CACHE or []),
+                "saved_at": time.time(),
+            },
+        )
+
+
+def revalidate_bucket_list() -> Optional[set[str]]:
+    """Re-read the added buckets from the buckets directory (no Scoop call); None if it is missing."""
+    global _BUCKET_LIST_CACHE
+    _wait_for_caches()
+    buckets_dir = bucket_index.scoop_root() / "buckets"
+    try:
+        found = {entry.name for entry in os.scandir(buckets_dir) if entry.is_dir()}
+    except OSError:
+        return None
+    with _BUCKET_LIST_LOCK:
+        changed = found != _BUCKET_LIST_CACHE
+        _BUCKET_LIST_CACHE = found
+    if changed:
+        _save_bucket_list_cache()
+    return found
+
+
+def list_installed_apps(progress: Optional[Callable[[str], None]] = None) -> List[str]:
+    """List all currently installed scoop applications."""
+    return list(dict.fromkeys(app.name for app in installed_inventory(progress)))
+
+
+def uninstall_apps(
+    apps: Iterable[str],
+    progress: Optional[Callable[[str], None]] = None,
+    on_event: Optional[Callable[[scoop_progress.ProgressEvent], None]] = None,
+    cancel: Optional[threading.Event] = None,
+) -> None:
     """Uninstall the specified scoop applications."""
     apps = list(apps)
     if not apps:
         return
     ensure_scoop_available(progress)
-    for app in apps:
+    for index, app in enumerate(apps, 1):
+        parser = scoop_progress.OutputParser(app, index, len(apps), on_event or _no_event)
         _emit(progress, f"Deinstalliere {app}...")
+        parser.event(scoop_progress.UNINSTALL)
         try:
-            _run_ps(f"scoop uninstall {app}")
+            _run_tracked(f"scoop uninstall {app}", parser, progress, cancel)
+            _invalidate_inventory()
+            parser.event(scoop_progress.DONE)
             _emit(progress, f"✓ {app} deinstalliert.")
         except subprocess.CalledProcessError as exc:
-            stderr = exc.stderr.strip() if exc.stderr else ""
-            stdout = exc.stdout.strip() if exc.stdout else ""
-            detail = stderr or stdout or "unbekannter Fehler"
-            raise RuntimeError(f"Deinstallation von {app} fehlgeschlagen: {detail}") from exc
+            parser.event(scoop_progress.FAILED)
+            raise RuntimeError(f"Deinstallation von {app} fehlgeschlagen: {_error_detail(exc)}") from exc
     _emit(progress, "Alle ausgewählten Apps deinstalliert.")
+
+
+def _parse_scoop_status(stdout: str, installed: Dict[str, inventory.InstalledApp]) -> List[inventory.OutdatedApp]:
+    """Parse the table of "scoop status" (Name, Installed Version, Latest Version, ...)."""
+    outdated: List[inventory.OutdatedApp] = []
+    for line in stdout.splitlines():
+        tokens = line.split()
+        if len(tokens) < 3 or tokens[0].lower() == "name" or tokens[0].startswith("-"):
+            continue
+        record = installed.get(tokens[0].lower())
+        if record is None or inventory.compare_versions(tokens[2], tokens[1]) <= 0:
+            continue
+        outdated.append(
+            inventory.OutdatedApp(record.name, tokens[1], tokens[2], record.bucket or "", record.global_install)
+        )
+    return outdated
+
+
+def outdated_apps(
+    progress: Optional[Callable[[str], None]] = None, refresh_buckets: bool = False
+) -> List[inventory.OutdatedApp]:
+    """Return the installed apps for which their bucket has a newer manifest.
+
+    Compares the installed versions with the local manifest index in one pass; only without the
+    index "scoop status" is asked. ``refresh_buckets`` first pulls the buckets ("scoop update"),
+    otherwise the result is as current as the last bucket update.
+    """
+    records = installed_inventory(progress)
+    if refresh_buckets:
+        ensure_scoop_available(progress)
+        _emit(progress, "Aktualisiere Buckets...")
+        try:
+            task_executor.get_executor().run(("scoop update",), lambda cancel: _run_ps("scoop update"))
+        except subprocess.CalledProcessError as exc:
+            raise RuntimeError(f"Buckets konnten nicht aktualisiert werden: {_error_detail(exc)}") from exc
+    index = _get_index(force_refresh=refresh_buckets)
+    _emit(progress, "Suche nach veralteten Apps...")
+    if index is not None:
+        def latest_version(app: inventory.InstalledApp) -> Optional[str]:
+            info = index.manifest_info(app.name, app.bucket)
+            return info["version"] if info else None
+
+        return inventory.find_outdated(records, latest_version)
+    ensure_scoop_available(progress)
+    try:
+        result = task_executor.get_executor().run(("scoop status",), lambda cancel: _run_ps("scoop status"))
+    except subprocess.CalledProcessError as exc:
+        raise RuntimeError(f"Fehler beim Prüfen auf Aktualisierungen: {_error_detail(exc)}") from exc
+    return _parse_scoop_status(result.stdout, {app.name.lower(): app for app in records})
+
+
+def update_apps(
+    apps: Iterable[str],
+    progress: Optional[Callable[[str], None]] = None,
+    on_event: Optional[Callable[[scoop_progress.ProgressEvent], None]] = None,
+    cancel: Optional[threading.Event] = None,
+    concurrency: Optional[int] = None,
+) -> None:
+    """Bring installed apps to the latest or, for "name@version", to exactly that version.
+
+    The new packages are downloaded first, up to ``concurrency`` at once, and the apps are then
+    updated one after the other from Scoop's cache. A pinned version is swapped in by uninstall
+    and install only after its download succeeded, so an unavailable version leaves the installed
+    one untouched. Afterwards only the updated apps are re-read into the inventory.
+    """
+    import install_pipeline
+
+    apps = list(dict.fromkeys(apps))
+    if not apps:
+        return
+    ensure_scoop_available(progress)
+    ensure_buckets([bucket for bucket, _, _ in map(split_app_ref, apps) if bucket], progress)
+    parsers = {
+        ref: scoop_progress.OutputParser(split_app_ref(ref)[1], index, len(apps), on_event or _no_event)
+        for index, ref in enumerate(apps, 1)
+    }
+    updated: List[str] = []
+    prefetched: Set[str] = set()
+
+    def download(ref: str) -> None:
+        _download_app(ref, parsers[ref], cancel)
+        prefetched.add(ref)
+
+    def update(ref: str) -> None:
+        _bucket, name, version = split_app_ref(ref)
+        parser = parsers[ref]
+        _emit(progress, f"Aktualisiere {ref}...")
+        try:
+            if version:
+                # The pipeline skips the prefetch for a single app and only reports a failed one
+                if ref not in prefetched:
+                    _run_tracked(f"scoop download {ref}", parser, progress, cancel)
+                _run_tracked(f"scoop uninstall {name}", parser, progress, cancel)
+                updated.append(name)
+                _run_tracked(f"scoop install {ref}", parser, progress, cancel)
+            else:
+                updated.append(name)
+                _run_tracked(f"scoop update {name}", parser, progress, cancel)
+        except subprocess.CalledProcessError as exc:
+            parser.event(scoop_progress.FAILED)
+            raise RuntimeError(f"Aktualisierung von {ref} fehlgeschlagen: {_error_detail(exc)}") from exc
+        parser.event(scoop_progress.DONE)
+        _emit(progress, f"✓ {ref} aktualisiert.")
+
+    try:
+        install_pipeline.run_pipeline(
+            apps,
+            # Downloads the manifest's current version, which "scoop update" then takes from the cache
+            download=download,
+            install=update,
+            progress=progress,
+            concurrency=concurrency or _DOWNLOAD_CONCURRENCY,
+        )
+    finally:
+        if updated:
+            _get_inventory().refresh_apps(updated)
+    _emit(progress, "Alle ausgewählten Apps aktualisiert.")
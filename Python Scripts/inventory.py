@@ -0,0 +1,237 @@
+# Author: TheLionDeveloper44
+# Dieses Skript unterliegt der Lizenz, die in der LICENSE-Datei im Stammverzeichnis dieses Repositories enthalten ist.
+# Ohne ausdrückliche schriftliche Genehmigung ist es untersagt, dieses Skript zu kopieren, zu modifizieren oder zu verbreiten.
+
+# Liest die installierten Apps direkt aus dem Scoop-Verzeichnis (apps/<app>/current),
+# statt "scoop list" in PowerShell auszuführen und dessen Ausgabe zu zerlegen.
+# Das Ergebnis wird zwischengespeichert, solange sich die mtime der apps-Verzeichnisse nicht ändert.
+
+import json
+import os
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Scoop manages itself as an app; "scoop list" does not show it either
+_EXCLUDED = {"scoop"}
+
+
+@dataclass
+class InstalledApp:
+    name: str
+    version: Optional[str]  # None if unknown, e.g. for an incomplete installation
+    bucket: Optional[str]  # None for apps installed from a URL or a local manifest
+    installed_at: Optional[float]  # Epoch seconds (mtime of install.json)
+    global_install: bool = False
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "version": self.version,
+            "bucket": self.bucket,
+            "installed_at": self.installed_at,
+            "global": self.global_install,
+        }
+
+
+@dataclass
+class OutdatedApp:
+    name: str
+    installed: str  # Installed version
+    latest: str  # Version of the bucket's manifest
+    bucket: str
+    global_install: bool = False
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "installed": self.installed,
+            "latest": self.latest,
+            "bucket": self.bucket,
+            "global": self.global_install,
+        }
+
+
+def compare_versions(a: str, b: str) -> int:
+    """Compare two version strings like Scoop does roughly; returns -1, 0 or 1.
+
+    Numeric parts compare as numbers, other parts as text, and a version with an extra
+    non-numeric part is older ("1.2.0-beta1" < "1.2.0").
+    """
+    parts_a = re.findall(r"\d+|[a-z]+", a.lower())
+    parts_b = re.findall(r"\d+|[a-z]+", b.lower())
+    for x, y in zip(parts_a, parts_b):
+        if x == y:
+            continue
+        if x.isdigit() and y.isdigit():
+            return -1 if int(x) < int(y) else 1
+        if x.isdigit() != y.isdigit():
+            return 1 if x.isdigit() else -1  # "1.2.1" > "1.2.beta"
+        return -1 if x < y else 1
+    if len(parts_a) == len(parts_b):
+        return 0
+    longer, sign = (parts_a, 1) if len(parts_a) > len(parts_b) else (parts_b, -1)
+    extra = longer[min(len(parts_a), len(parts_b))]
+    # "1.2.1" is newer than "1.2", but "1.2-rc1" is older than "1.2"
+    return sign if extra.isdigit() else -sign
+
+
+def find_outdated(
+    apps: Iterable[InstalledApp], latest_version: Callable[[InstalledApp], Optional[str]]
+) -> List[OutdatedApp]:
+    """Return the apps whose ``latest_version`` is newer than the installed one, in one pass.
+
+    Apps without a known version or bucket (installed from a URL) and "nightly" builds are skipped.
+    """
+    outdated: List[OutdatedApp] = []
+    for app in apps:
+        if not app.version or not app.bucket or app.version == "nightly":
+            continue
+        latest = latest_version(app)
+        if latest and latest != "nightly" and compare_versions(latest, app.version) > 0:
+            outdated.append(OutdatedApp(app.name, app.version, latest, app.bucket, app.global_install))
+    return outdated
+
+
+def scoop_global_root() -> Path:
+    """Return the directory of globally installed apps ($env:SCOOP_GLOBAL or %ProgramData%\\scoop)."""
+    env = os.environ.get("SCOOP_GLOBAL")
+    if env:
+        return Path(env)
+    return Path(os.environ.get("ProgramData", r"C:\ProgramData")) / "scoop"
+
+
+def _read_json(path: Path) -> Optional[dict]:
+    try:
+        with open(path, "r", encoding="utf-8-sig") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def read_app(app_dir: Path, global_install: bool = False) -> InstalledApp:
+    """Build the record of one app from its ``current`` directory."""
+    current = app_dir / "current"
+    manifest = _read_json(current / "manifest.json")
+    install = _read_json(current / "install.json") or {}
+    version = manifest.get("version") if manifest else None
+    if manifest and not isinstance(version, str):
+        # "current" is a junction to the version directory, whose name is the version
+        version = Path(os.path.realpath(current)).name
+    try:
+        installed_at: Optional[float] = (current / "install.json").stat().st_mtime
+    except OSError:
+        installed_at = None
+    bucket = install.get("bucket")
+    return InstalledApp(
+        name=app_dir.name,
+        version=version,
+        bucket=bucket if isinstance(bucket, str) and bucket else None,
+        installed_at=installed_at,
+        global_install=global_install,
+    )
+
+
+class Inventory:
+    """Installed apps of one Scoop installation (user and global scope)."""
+
+    def __init__(self, root: Path, global_root: Optional[Path] = None):
+        self.root = Path(root)
+        self.global_root = Path(global_root) if global_root else None
+        self._lock = threading.Lock()
+        self._stamp: Optional[Tuple] = None
+        self._apps: List[InstalledApp] = []
+        self.rescans = 0  # Reads that had to scan the apps directories
+
+    def _apps_dirs(self) -> List[Tuple[Path, bool]]:
+        dirs = [(self.root / "apps", False)]
+        if self.global_root is not None and self.global_root != self.root:
+            dirs.append((self.global_root / "apps", True))
+        return dirs
+
+    def available(self) -> bool:
+        return (self.root / "apps").is_dir()
+
+    def _current_stamp(self) -> Tuple:
+        stamp = []
+        for apps_dir, _ in self._apps_dirs():
+            try:
+                stamp.append(apps_dir.stat().st_mtime_ns)
+            except OSError:
+                stamp.append(None)
+        return tuple(stamp)
+
+    def invalidate(self) -> None:
+        """Force the next ``read`` to rescan (for changes that leave the directory mtime alone)."""
+        with self._lock:
+            self._stamp = None
+
+    def refresh_apps(self, names: Iterable[str]) -> None:
+        """Re-read only the named apps after Scoop changed them (e.g. updated them).
+
+        Assumes those apps are the only change since the last ``read``; if nothing has been read
+        yet, the next ``read`` scans everything anyway.
+        """
+        stamp = self._current_stamp()
+        with self._lock:
+            if self._stamp is None:
+                return
+            apps = {(app.name.lower(), app.global_install): app for app in self._apps}
+            for apps_dir, global_install in self._apps_dirs():
+                for name in names:
+                    app_dir = apps_dir / name
+                    if app_dir.is_dir():
+                        apps[(name.lower(), global_install)] = read_app(app_dir, global_install)
+                    else:
+                        apps.pop((name.lower(), global_install), None)
+            self._apps = sorted(apps.values(), key=lambda app: (app.name.lower(), app.global_install))
+            self._stamp = stamp
+
+    def read(self) -> List[InstalledApp]:
+        """Return all installed apps sorted by name; rescans only if an apps directory changed."""
+        stamp = self._current_stamp()
+        with self._lock:
+            if stamp == self._stamp:
+                return list(self._apps)
+            apps: Dict[Tuple[str, bool], InstalledApp] = {}
+            for apps_dir, global_install in self._apps_dirs():
+                try:
+                    entries = list(os.scandir(apps_dir))
+                except OSError:
+                    continue
+                for entry in entries:
+                    if not entry.is_dir() or entry.name.lower() in _EXCLUDED:
+                        continue
+                    apps[(entry.name.lower(), global_install)] = read_app(Path(entry.path), global_install)
+            self._apps = sorted(apps.values(), key=lambda app: (app.name.lower(), app.global_install))
+            self._stamp = stamp
+            self.rescans += 1
+            return list(self._apps)
+
+
+def parse_scoop_list(stdout: str) -> List[InstalledApp]:
+    """Parse "scoop list" output, both the table format and the older "name version [bucket]" lines."""
+    apps: List[InstalledApp] = []
+    for line in stdout.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith("-") or stripped.endswith(":"):
+            continue  # Blank lines, table separators and "Installed apps:"
+        tokens = stripped.split()
+        if tokens[0].lower() == "name" and len(tokens) > 1 and tokens[1].lower() == "version":
+            continue  # Column header
+        if tokens[0].lower() in _EXCLUDED:
+            continue
+        source = tokens[2].strip("[]") if len(tokens) > 2 else ""
+        apps.append(
+            InstalledApp(
+                name=tokens[0],
+                version=tokens[1] if len(tokens) > 1 else None,
+                bucket=source if source and "/" not in source and "\\" not in source else None,
+                installed_at=None,
+                global_install="*global*" in stripped.lower() or "global install" in stripped.lower(),
+            )
+        )
+    return apps
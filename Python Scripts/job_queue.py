@@ -0,0 +1,136 @@
+# Author: TheLionDeveloper44
+# Dieses Skript unterliegt der Lizenz, die in der LICENSE-Datei im Stammverzeichnis dieses Repositories enthalten ist.
+# Ohne ausdrückliche schriftliche Genehmigung ist es untersagt, dieses Skript zu kopieren, zu modifizieren oder zu verbreiten.
+
+# Dauerhafte Warteschlange für Installationen: jede App hat einen eigenen Zustand, der sofort in
+# den Cache-Speicher (SQLite) geschrieben wird. Nach einem Absturz oder Neustart lassen sich die
+# offenen Einträge fortsetzen, und am Ende steht ein Ergebnis pro App.
+
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional
+
+from cache import CacheStore
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+SKIPPED = "skipped"
+
+UNFINISHED = (PENDING, RUNNING)
+
+
+@dataclass
+class Job:
+    name: str
+    ref: str  # As passed to Scoop, e.g. "extras/vscode@1.90.0"
+    state: str = PENDING
+    attempts: int = 0
+    error: Optional[str] = None
+    position: int = 0
+    updated_at: float = 0.0
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    def describe(self) -> str:
+        """One German report line, e.g. "✗ git: Installation fehlgeschlagen (2 Versuche)"."""
+        marks = {PENDING: "…", RUNNING: "…", DONE: "✓", FAILED: "✗", SKIPPED: "⤼"}
+        text = f"{marks.get(self.state, '?')} {self.ref}"
+        if self.error:
+            text += f": {self.error}"
+        if self.attempts > 1:
+            text += f" ({self.attempts} Versuche)"
+        return text
+
+
+class JobQueue:
+    """Per-app install states of the current batch, persisted under one namespace of a CacheStore.
+
+    Without a store the queue works in memory only (nothing survives a restart).
+    """
+
+    def __init__(self, store: Optional[CacheStore], namespace: str = "install_jobs"):
+        self._store = store
+        self._namespace = namespace
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, Job] = {}
+        if store is not None:
+            for key, value, _ in store.items(namespace):
+                try:
+                    self._jobs[key] = Job(**value)
+                except TypeError:
+                    store.delete(namespace, key)  # Written by another version; not worth resuming
+
+    def _save(self, job: Job) -> None:
+        job.updated_at = time.time()
+        if self._store is not None:
+            self._store.put(self._namespace, job.name.lower(), job.to_dict())
+
+    def jobs(self) -> List[Job]:
+        """All jobs of the current batch in install order."""
+        with self._lock:
+            return sorted(self._jobs.values(), key=lambda job: job.position)
+
+    def unfinished(self) -> List[Job]:
+        """Jobs that were pending or running when the last run stopped."""
+        return [job for job in self.jobs() if job.state in UNFINISHED]
+
+    def start(self, refs: Dict[str, str], resume: bool = False) -> List[Job]:
+        """Queue ``refs`` (name -> reference) as pending; returns the jobs it abandoned.
+
+        A new batch replaces the previous one: jobs of an interrupted batch that are not part of
+        ``refs`` are marked as skipped and returned, so the caller can tell the user. With
+        ``resume`` the interrupted batch is continued instead, and its records are kept so the
+        final report covers the whole batch.
+        """
+        with self._lock:
+            keep = resume and any(job.state in UNFINISHED for job in self._jobs.values())
+            abandoned: List[Job] = []
+            if not keep:
+                wanted = {name.lower() for name in refs}
+                for job in self._jobs.values():
+                    if job.state in UNFINISHED and job.name.lower() not in wanted:
+                        job.state, job.error = SKIPPED, "verworfen, neue Installation gestartet"
+                        abandoned.append(job)
+                self._jobs.clear()
+            position = max((job.position for job in self._jobs.values()), default=0)
+            if self._store is not None:
+                # Dropping the old batch and queueing the new one is one commit, so a crash in
+                # between cannot leave an empty queue behind
+                with self._store.transaction():
+                    if not keep:
+                        self._store.clear(self._namespace)
+                    self._queue(refs, position)
+            else:
+                self._queue(refs, position)
+            return sorted(abandoned, key=lambda job: job.position)
+
+    def _queue(self, refs: Dict[str, str], position: int) -> None:
+        for name, ref in refs.items():
+            job = self._jobs.get(name.lower())
+            if job is None:
+                position += 1
+                job = self._jobs[name.lower()] = Job(name, ref, position=position)
+            job.ref, job.state, job.error = ref, PENDING, None
+            self._save(job)
+
+    def mark(self, name: str, state: str, error: Optional[str] = None) -> Job:
+        """Record a state change of one app; entering RUNNING counts as an attempt."""
+        with self._lock:
+            job = self._jobs.get(name.lower())
+            if job is None:
+                job = self._jobs[name.lower()] = Job(name, name, position=len(self._jobs) + 1)
+            if state == RUNNING:
+                job.attempts += 1
+            job.state = state
+            job.error = error
+            self._save(job)
+            return job
+
+    def abandon(self, reason: str) -> None:
+        """Mark every unfinished job as skipped, e.g. after the user cancelled the batch."""
+        for job in self.unfinished():
+            self.mark(job.name, SKIPPED, reason)
@@ -0,0 +1,45 @@
+# Author: TheLionDeveloper44
+# Dieses Skript unterliegt der Lizenz, die in der LICENSE-Datei im Stammverzeichnis dieses Repositories enthalten ist.
+# Ohne ausdrückliche schriftliche Genehmigung ist es untersagt, dieses Skript zu kopieren, zu modifizieren oder zu verbreiten.
+
+# Protokollfenster der GUI: Meldungen werden gesammelt und höchstens einmal pro Frame in das
+# Textfeld geschrieben, das Textfeld behält nur die letzten Zeilen (Ringpuffer). Jede Meldung geht
+# zusätzlich sofort in die Protokolldatei (app_log).
+
+from typing import List
+
+from PySide6.QtCore import QObject, QTimer
+from PySide6.QtWidgets import QPlainTextEdit
+
+import app_log
+
+FRAME_MS = 16
+MAX_LINES = 2000
+
+
+class LogSink(QObject):
+    """Buffered writer for a read-only ``QPlainTextEdit``; call ``append`` on the GUI thread."""
+
+    def __init__(self, view: QPlainTextEdit, max_lines: int = MAX_LINES, parent=None):
+        super().__init__(parent or view)
+        self.view = view
+        self.view.setMaximumBlockCount(max_lines)
+        self._pending: List[str] = []
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(FRAME_MS)
+        self._timer.timeout.connect(self.flush)
+
+    def append(self, message: str) -> None:
+        app_log.info(message)
+        self._pending.append(message)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self) -> None:
+        """Write the pending messages now (one widget update for the whole batch)."""
+        self._timer.stop()
+        if self._pending:
+            text = "\n".join(self._pending)
+            self._pending.clear()
+            self.view.appendPlainText(text)
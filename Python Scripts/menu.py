@@ -3,65 +3,128 @@
 # Ohne ausdrückliche schriftliche Genehmigung ist es untersagt, dieses Skript zu kopieren, zu modifizieren oder zu verbreiten.
 
 import sys
-from PySide6.QtCore import Qt, QThread, Signal, QPropertyAnimation, QSize
+import time
+from PySide6.QtCore import Qt, QTimer, Signal, QPropertyAnimation
 from PySide6.QtWidgets import (
     QApplication,
     QCheckBox,
-    QGridLayout,
+    QFileDialog,
     QGroupBox,
     QHBoxLayout,
+    QHeaderView,
     QLabel,
     QLineEdit,
     QMainWindow,
     QMessageBox,
     QPushButton,
     QPlainTextEdit,
-    QScrollArea,
     QVBoxLayout,
     QWidget,
     QGraphicsOpacityEffect,
     QProgressBar,
     QTabWidget,
-    QListWidget,
-    QListWidgetItem,
+    QTableWidget,
+    QTableWidgetItem,
+    QListView,
+    QAbstractItemView,
 )
-from PySide6.QtGui import QIcon, QFont, QColor
+from PySide6.QtGui import QFont
+import diagnostics
 import installer
+import startup_profile
+import ui_watchdog
 import uninstaller
+from app_list_model import CheckableAppModel
+from log_sink import LogSink
+from task_worker import TaskWorker
 
+# Reference point for the time-to-interactive measurement (replaced by launch_app's caller if known)
+_STARTED_AT = time.perf_counter()
 
-class SearchThread(QThread):
+# Pause after the last keystroke before an as-you-type search starts. Without a local index
+# every search is a Scoop call, so it waits longer for the user to stop typing.
+_INSTANT_DEBOUNCE_MS = 150
+_SCOOP_DEBOUNCE_MS = 700
+
+
+class SearchTask(TaskWorker):
     results = Signal(list)
-    failed = Signal(str)
+    batch = Signal(list)
     progress = Signal(str)
 
     def __init__(self, term: str):
         super().__init__()
         self.term = term
 
-    def run(self):
+    def key(self):
+        return ("search", self.term.strip().lower())
+
+    def work(self, cancel):
+        # Tell the user when Scoop has to be queried (neither cached nor in the local index)
+        status = installer.search_cache_status(self.term)
+        if status == installer.cache.STALE:
+            self.progress.emit(f"Ergebnisse für '{self.term}' sind veraltet und werden im Hintergrund aktualisiert.")
+        elif status == installer.cache.MISSING:
+            self.progress.emit(f"Erstmalige Suche nach '{self.term}': Ergebnisse werden von Scoop abgerufen und gecacht.")
+        apps = []
+        # Emit each batch right away so results appear while Scoop is still searching
+        for batch in installer.iter_search_apps(self.term, progress=self.progress.emit, cancel=cancel):
+            apps.extend(batch)
+            self.batch.emit(batch)
+        return sorted(dict.fromkeys(apps))
+
+
+class InstantSearchTask(TaskWorker):
+    """Filters the local manifest index; emits None when there is no index to search."""
+
+    def __init__(self, term: str):
+        super().__init__()
+        self.term = term
+
+    def key(self):
+        return ("instant search", self.term.strip().lower())
+
+    def work(self, cancel):
         try:
-            apps = installer.search_apps(self.term, progress=self.progress.emit)
-            self.results.emit(apps)
-        except Exception as exc:  # noqa: BLE001
-            self.failed.emit(str(exc))
+            return installer.instant_search(self.term, cancel=cancel)
+        except Exception:  # noqa: BLE001 - an unreadable index is treated like a missing one
+            return None
+
+
+class UnfinishedJobsTask(TaskWorker):
+    """Reads the open apps of an interrupted install batch (waits for the cache store)."""
+
+    def work(self, cancel):
+        return installer.unfinished_install_jobs()
 
 
-class InstallThread(QThread):
+class InstallTask(TaskWorker):
     progress = Signal(str)
-    failed = Signal(str)
+    event = Signal(object)  # scoop_progress.ProgressEvent
     finished_ok = Signal()
 
-    def __init__(self, apps):
+    def __init__(self, apps, installed=(), resume=False):
         super().__init__()
         self.apps = apps
+        self.installed = set(installed)
+        self.resume = resume  # Continue the interrupted batch instead of installing ``apps``
+
+    def work(self, cancel):
+        # No key: an install is never shared; cancelling kills the running Scoop call and
+        # leaves apps not yet started untouched
+        if self.resume:
+            installer.resume_install_jobs(progress=self.progress.emit, on_event=self.event.emit, cancel=cancel)
+        else:
+            installer.install_apps(
+                self.apps,
+                progress=self.progress.emit,
+                installed=self.installed,
+                on_event=self.event.emit,
+                cancel=cancel,
+            )
 
-    def run(self):
-        try:
-            installer.install_apps(self.apps, progress=self.progress.emit)
-            self.finished_ok.emit()
-        except Exception as exc:  # noqa: BLE001
-            self.failed.emit(str(exc))
+    def deliver(self, result):
+        self.finished_ok.emit()
 
 
 class MenuWindow(QMainWindow):
@@ -69,16 +132,46 @@ class MenuWindow(QMainWindow):
         super().__init__()
         self.setWindowTitle("App-Verwaltung")
         self.resize(1000, 720)
-        self._checkboxes = []
-        self._installed_checkboxes = []
-        self._selected_apps = set()  # Track selected apps across searches
+        # Checked search results persist across searches; installed checks only for listed apps
+        self.results_model = CheckableAppModel(keep_hidden_checks=True, parent=self)
+        self.installed_model = CheckableAppModel(parent=self)
         self._installed_apps = set()  # Track installed apps to avoid reinstall
         self._fade_anim = None
+        self._progress_fractions = {}  # Per progress bar: app -> progress 0..1
+        self.worker = None
+        self.worker_search = None
+        self.worker_snapshot = None
+        self.worker_jobs = None
+        self._installed_listed = False  # The real installed list arrived; the snapshot is outdated
+        self.worker_uninstall = None
+        self.worker_update = None
+        self.worker_outdated = None
+        self._outdated = {}  # Lowercase name -> inventory.OutdatedApp from the last update check
+        self._search_workers = set()  # Running search threads, kept alive until they finish
+        self._search_explicit = False
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(_INSTANT_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._run_instant_search)
+        self._started_at = _STARTED_AT
+        self._revalidate_started = 0.0
         self._build_ui()
         self._apply_style()
         self._fade_in(self.centralWidget())
-        # Auto-load installed apps on startup for reinstall prevention
-        self._refresh_installed_list()
+
+    def _after_first_paint(self):
+        """Startup work that can wait until the window is on screen."""
+        startup_profile.mark("Erster Frame")
+        # Show the last known state as soon as the cache store is loaded, and re-read it meanwhile.
+        # Both wait for the store, so they run on the executor instead of the GUI thread.
+        self.worker_snapshot = uninstaller.InstalledSnapshotTask()
+        self.worker_snapshot.results.connect(self._show_installed_snapshot)
+        self.worker_snapshot.finished.connect(self._mark_interactive)
+        self.worker_snapshot.start()
+        self._refresh_installed_list(background=True)
+        self.worker_jobs = UnfinishedJobsTask()
+        self.worker_jobs.results.connect(self._offer_resume_install)
+        self.worker_jobs.start()
 
     def _build_ui(self):
         central = QWidget()
@@ -133,6 +226,9 @@ class MenuWindow(QMainWindow):
         # Installed Apps Tab
         self._build_installed_tab()
 
+        # Diagnostics Tab
+        self._build_diagnostics_tab()
+
         main_layout.addWidget(self.tabs, 1)
         self.setCentralWidget(central)
 
@@ -154,8 +250,14 @@ class MenuWindow(QMainWindow):
         self.search_input.setPlaceholderText("Scoop-Repository durchsuchen (z.B. brave, vscode)...")
         self.search_input.setMinimumHeight(40)
         self.search_input.returnPressed.connect(self._start_search)
+        self.search_input.textChanged.connect(self._on_search_text_changed)
         search_layout.addWidget(self.search_input)
 
+        self.instant_search_check = QCheckBox("⚡ Sofortsuche")
+        self.instant_search_check.setChecked(True)
+        self.instant_search_check.setToolTip("Ergebnisse beim Tippen im lokalen Index filtern")
+        search_layout.addWidget(self.instant_search_check)
+
         self.search_btn = QPushButton("🔍 Suchen")
         self.search_btn.setMinimumHeight(40)
         self.search_btn.setMaximumWidth(120)
@@ -193,33 +295,42 @@ class MenuWindow(QMainWindow):
         # Results area
         self.results_group = QGroupBox("Suchergebnisse")
         self.results_group.setStyleSheet("QGroupBox { font-weight: 600; color: #1f2937; }")
-        self.results_layout = QVBoxLayout(self.results_group)
-        self.results_layout.setAlignment(Qt.AlignTop)
+        results_layout = QVBoxLayout(self.results_group)
+        self.results_view = self._make_list_view(self.results_model)
+        results_layout.addWidget(self.results_view)
+        layout.addWidget(self.results_group, 1)
 
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setWidget(self.results_group)
-        layout.addWidget(scroll, 1)
-
-        # Install progress
+        # Install progress (determinate, driven by parsed Scoop output)
         self.install_spinner = QProgressBar()
-        self.install_spinner.setRange(0, 0)
+        self.install_spinner.setRange(0, 1000)
         self.install_spinner.setFixedHeight(6)
+        self.install_spinner.setTextVisible(False)
         self.install_spinner.hide()
         layout.addWidget(self.install_spinner)
+        self.install_status = QLabel()
+        self.install_status.hide()
+        layout.addWidget(self.install_status)
 
         # Install button
         self.install_btn = QPushButton("⬇ Ausgewählte Apps installieren")
         self.install_btn.setMinimumHeight(44)
         self.install_btn.setStyleSheet("font-weight: 600; font-size: 13px;")
         self.install_btn.clicked.connect(self._start_install)
-        layout.addWidget(self.install_btn)
+        self.install_cancel_btn = QPushButton("✖ Abbrechen")
+        self.install_cancel_btn.setMinimumHeight(44)
+        self.install_cancel_btn.setEnabled(False)
+        self.install_cancel_btn.clicked.connect(self._cancel_install)
+        install_row = QHBoxLayout()
+        install_row.addWidget(self.install_btn, 1)
+        install_row.addWidget(self.install_cancel_btn)
+        layout.addLayout(install_row)
 
         # Log
         self.log = QPlainTextEdit()
         self.log.setReadOnly(True)
         self.log.setPlaceholderText("Status und Protokolle erscheinen hier...")
         self.log.setMaximumHeight(150)
+        self.log_sink = LogSink(self.log)
         layout.addWidget(self.log)
 
         self.tabs.addTab(tab, "📦 Apps installieren")
@@ -243,6 +354,11 @@ class MenuWindow(QMainWindow):
         self.refresh_btn.setMinimumWidth(180)
         self.refresh_btn.clicked.connect(self._refresh_installed_list)
         refresh_layout.addWidget(self.refresh_btn)
+        self.outdated_btn = QPushButton("⬆ Nach Updates suchen")
+        self.outdated_btn.setMinimumHeight(40)
+        self.outdated_btn.setToolTip("Buckets aktualisieren und installierte Versionen mit den Manifesten vergleichen")
+        self.outdated_btn.clicked.connect(lambda: self._check_outdated())
+        refresh_layout.addWidget(self.outdated_btn)
         refresh_layout.addStretch()
         layout.addLayout(refresh_layout)
 
@@ -256,20 +372,24 @@ class MenuWindow(QMainWindow):
         # Installed apps list
         self.installed_group = QGroupBox("Installierte Anwendungen")
         self.installed_group.setStyleSheet("QGroupBox { font-weight: 600; color: #1f2937; }")
-        self.installed_layout = QVBoxLayout(self.installed_group)
-        self.installed_layout.setAlignment(Qt.AlignTop)
-
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setWidget(self.installed_group)
-        layout.addWidget(scroll, 1)
-
-        # Uninstall progress
+        installed_layout = QVBoxLayout(self.installed_group)
+        self.installed_empty = QLabel("Keine Anwendungen installiert.")
+        self.installed_empty.hide()
+        installed_layout.addWidget(self.installed_empty)
+        self.installed_view = self._make_list_view(self.installed_model)
+        installed_layout.addWidget(self.installed_view)
+        layout.addWidget(self.installed_group, 1)
+
+        # Uninstall progress (determinate, driven by parsed Scoop output)
         self.uninstall_spinner = QProgressBar()
-        self.uninstall_spinner.setRange(0, 0)
+        self.uninstall_spinner.setRange(0, 1000)
         self.uninstall_spinner.setFixedHeight(6)
+        self.uninstall_spinner.setTextVisible(False)
         self.uninstall_spinner.hide()
         layout.addWidget(self.uninstall_spinner)
+        self.uninstall_status = QLabel()
+        self.uninstall_status.hide()
+        layout.addWidget(self.uninstall_status)
 
         # Selection buttons for installed apps
         button_layout = QHBoxLayout()
@@ -283,6 +403,11 @@ class MenuWindow(QMainWindow):
         btn_clear_inst.clicked.connect(self._clear_selection_installed)
         button_layout.addWidget(btn_clear_inst)
 
+        btn_select_outdated = QPushButton("⬆ Veraltete auswählen")
+        btn_select_outdated.setMinimumHeight(36)
+        btn_select_outdated.clicked.connect(self._select_outdated)
+        button_layout.addWidget(btn_select_outdated)
+
         layout.addLayout(button_layout)
 
         # Uninstall button
@@ -290,17 +415,157 @@ class MenuWindow(QMainWindow):
         self.uninstall_btn.setMinimumHeight(44)
         self.uninstall_btn.setStyleSheet("font-weight: 600; font-size: 13px;")
         self.uninstall_btn.clicked.connect(self._start_uninstall)
-        layout.addWidget(self.uninstall_btn)
+        self.uninstall_cancel_btn = QPushButton("✖ Abbrechen")
+        self.uninstall_cancel_btn.setMinimumHeight(44)
+        self.uninstall_cancel_btn.setEnabled(False)
+        self.uninstall_cancel_btn.clicked.connect(self._cancel_uninstall)
+        self.update_btn = QPushButton("⬆ Ausgewählte aktualisieren")
+        self.update_btn.setMinimumHeight(44)
+        self.update_btn.setStyleSheet("font-weight: 600; font-size: 13px;")
+        self.update_btn.clicked.connect(self._start_update)
+        uninstall_row = QHBoxLayout()
+        uninstall_row.addWidget(self.update_btn, 1)
+        uninstall_row.addWidget(self.uninstall_btn, 1)
+        uninstall_row.addWidget(self.uninstall_cancel_btn)
+        layout.addLayout(uninstall_row)
 
         # Log
         self.log_uninstall = QPlainTextEdit()
         self.log_uninstall.setReadOnly(True)
         self.log_uninstall.setPlaceholderText("Status und Protokolle erscheinen hier...")
         self.log_uninstall.setMaximumHeight(150)
+        self.log_uninstall_sink = LogSink(self.log_uninstall)
         layout.addWidget(self.log_uninstall)
 
         self.tabs.addTab(tab, "✅ Apps verwalten")
 
+    def _build_diagnostics_tab(self):
+        """Build the tab with the latency histograms of Scoop calls and cache lookups."""
+        tab = QWidget()
+        layout = QVBoxLayout(tab)
+        layout.setSpacing(15)
+        layout.setContentsMargins(20, 20, 20, 20)
+
+        desc = QLabel("Laufzeiten der Scoop-Aufrufe und Cache-Abfragen (Histogramm pro Befehl)")
+        desc.setStyleSheet("color: #6b7280; font-size: 12px;")
+        layout.addWidget(desc)
+
+        controls = QHBoxLayout()
+        self.diagnostics_check = QCheckBox("Messung aktiv")
+        self.diagnostics_check.setChecked(diagnostics.enabled())
+        self.diagnostics_check.setToolTip("Auch beim Start mit APP_MANAGER_DIAGNOSTICS=1 einschaltbar")
+        self.diagnostics_check.toggled.connect(self._toggle_diagnostics)
+        controls.addWidget(self.diagnostics_check)
+        controls.addStretch()
+        for text, slot in (
+            ("🔄 Aktualisieren", self._refresh_diagnostics),
+            ("🗑 Zurücksetzen", self._reset_diagnostics),
+            ("💾 Als JSON exportieren", lambda: self._export_diagnostics(chrome_trace=False)),
+            ("📈 Als Chrome-Trace exportieren", lambda: self._export_diagnostics(chrome_trace=True)),
+        ):
+            button = QPushButton(text)
+            button.setMinimumHeight(36)
+            button.clicked.connect(slot)
+            controls.addWidget(button)
+        layout.addLayout(controls)
+
+        columns = ["Art", "Anzahl", "Aus Cache", "Fehler", "Mittel ms", "p50 ms", "p95 ms", "Max ms", "Ausgabe KB"]
+        self.diagnostics_table = QTableWidget(0, len(columns))
+        self.diagnostics_table.setHorizontalHeaderLabels(columns)
+        self.diagnostics_table.verticalHeader().hide()
+        self.diagnostics_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.diagnostics_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        layout.addWidget(self.diagnostics_table, 1)
+
+        self.diagnostics_summary = QLabel()
+        self.diagnostics_summary.setStyleSheet("color: #6b7280; font-size: 12px;")
+        layout.addWidget(self.diagnostics_summary)
+
+        # Only redrawn while the tab is visible and measuring
+        self._diagnostics_timer = QTimer(self)
+        self._diagnostics_timer.setInterval(1000)
+        self._diagnostics_timer.timeout.connect(self._refresh_diagnostics)
+        self.tabs.currentChanged.connect(self._on_tab_changed)
+
+        self._diagnostics_tab = tab
+        self.tabs.addTab(tab, "📊 Diagnose")
+
+    def _on_tab_changed(self, index):
+        if self.tabs.widget(index) is self._diagnostics_tab:
+            self._refresh_diagnostics()
+            self._diagnostics_timer.start()
+        else:
+            self._diagnostics_timer.stop()
+
+    def _toggle_diagnostics(self, checked: bool):
+        if checked:
+            diagnostics.enable()
+        else:
+            diagnostics.disable()
+        self._refresh_diagnostics()
+
+    def _refresh_diagnostics(self):
+        summary = diagnostics.histograms()
+        table = self.diagnostics_table
+        table.setRowCount(len(summary))
+        for row, (kind, data) in enumerate(summary.items()):
+            values = [
+                kind,
+                data["count"],
+                data["cached"],
+                data["errors"],
+                f"{data['mean_ms']:.1f}",
+                f"{data['p50_ms']:.1f}",
+                f"{data['p95_ms']:.1f}",
+                f"{data['max_ms']:.1f}",
+                f"{data['output_bytes'] / 1024:.1f}",
+            ]
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(str(value))
+                if column:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                table.setItem(row, column, item)
+        total = sum(data["count"] for data in summary.values())
+        state = "aktiv" if diagnostics.enabled() else "aus"
+        self.diagnostics_summary.setText(f"Messung {state} · {total} Messpunkte · {len(summary)} Arten")
+
+    def _reset_diagnostics(self):
+        diagnostics.reset()
+        self._refresh_diagnostics()
+
+    def _export_diagnostics(self, chrome_trace: bool):
+        if chrome_trace:
+            path, _ = QFileDialog.getSaveFileName(
+                self, "Chrome-Trace exportieren", "app_manager_trace.json", "Trace (*.json)"
+            )
+        else:
+            path, _ = QFileDialog.getSaveFileName(
+                self, "Messwerte exportieren", "app_manager_diagnostics.json", "JSON (*.json)"
+            )
+        if not path:
+            return
+        try:
+            diagnostics.export(path, chrome_trace=chrome_trace)
+        except OSError as exc:
+            QMessageBox.critical(self, "Export fehlgeschlagen", str(exc))
+            return
+        self.diagnostics_summary.setText(f"Exportiert nach {path}")
+
+    def _make_list_view(self, model: CheckableAppModel) -> QListView:
+        view = QListView()
+        view.setModel(model)
+        # Equal row heights let the view lay out any number of rows without measuring them
+        view.setUniformItemSizes(True)
+        view.setSelectionMode(QAbstractItemView.NoSelection)
+        view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        # A click anywhere on the row toggles it, like the label of a check box
+        view.clicked.connect(lambda index: self._toggle_row(model, index))
+        return view
+
+    def _toggle_row(self, model: CheckableAppModel, index):
+        app = model.app_at(index.row())
+        model.set_checked(app, not model.is_checked(app))
+
     def _apply_style(self):
         self.setStyleSheet(
             """
@@ -368,34 +633,35 @@ class MenuWindow(QMainWindow):
                 color: #9ca3af;
             }
             
-            QCheckBox {
+            QCheckBox, QListView::item {
                 padding: 8px;
                 color: #1f2937;
                 font-size: 13px;
             }
             
-            QCheckBox::indicator {
+            QListView {
+                border: none;
+                background: transparent;
+                font-size: 13px;
+            }
+            
+            QCheckBox::indicator, QListView::indicator {
                 width: 20px;
                 height: 20px;
             }
             
-            QCheckBox::indicator:unchecked {
+            QCheckBox::indicator:unchecked, QListView::indicator:unchecked {
                 border: 2px solid #cbd5e1;
                 border-radius: 4px;
                 background: white;
             }
             
-            QCheckBox::indicator:checked {
+            QCheckBox::indicator:checked, QListView::indicator:checked {
                 border: 2px solid #2563eb;
                 border-radius: 4px;
                 background: #2563eb;
             }
             
-            QScrollArea {
-                border: none;
-                background: transparent;
-            }
-            
             QScrollBar:vertical {
                 background: #f3f4f6;
                 width: 12px;
@@ -442,105 +708,118 @@ class MenuWindow(QMainWindow):
         self._fade_anim.start()
 
     def _clear_results(self):
-        for i in reversed(range(self.results_layout.count())):
-            item = self.results_layout.takeAt(i)
-            w = item.widget()
-            if w:
-                w.deleteLater()
-        self._checkboxes.clear()
-
-    def _clear_installed_results(self):
-        for i in reversed(range(self.installed_layout.count())):
-            item = self.installed_layout.takeAt(i)
-            w = item.widget()
-            if w:
-                w.deleteLater()
-        self._installed_checkboxes.clear()
-
-    def _render_results(self, apps: list[str]):
-        self._clear_results()
-        for app in apps:
-            cb = QCheckBox(app)
-            cb.app_id = app  # type: ignore[attr-defined]
-            # Check if this app was previously selected
-            if app in self._selected_apps:
-                cb.setChecked(True)
-            # Track selection changes
-            cb.stateChanged.connect(lambda checked, app_name=app: self._update_selection(app_name, checked))
-            self.results_layout.addWidget(cb)
-            self._checkboxes.append(cb)
-        if not apps:
-            self.results_layout.addWidget(QLabel("Keine Ergebnisse gefunden."))
+        self.results_model.clear()
+
+    def _append_results(self, apps: list[str]):
+        # Previously checked apps show up checked again: the selection lives in the model
+        self.results_model.append(apps)
 
     def _render_installed(self, apps: list[str]):
-        self._clear_installed_results()
-        if not apps:
-            self.installed_layout.addWidget(QLabel("Keine Anwendungen installiert."))
-            return
-        for app in apps:
-            cb = QCheckBox(app)
-            cb.app_id = app  # type: ignore[attr-defined]
-            self.installed_layout.addWidget(cb)
-            self._installed_checkboxes.append(cb)
+        # Only the rows that changed are touched, so a revalidation does not reset the view
+        self.installed_model.sync_apps(apps)
+        self._show_outdated()
+        self.installed_empty.setVisible(not apps)
+        self.installed_view.setVisible(bool(apps))
 
     def _start_search(self):
+        self._search_timer.stop()
         self._trigger_search(explicit=True)
 
-    def _update_selection(self, app_name: str, checked: int) -> None:
-        """Track selected apps across searches."""
-        if checked:
-            self._selected_apps.add(app_name)
-        else:
-            self._selected_apps.discard(app_name)
+    def _on_search_text_changed(self, text: str):
+        if not self.instant_search_check.isChecked():
+            return
+        if len(text.strip()) < 2:
+            self._search_timer.stop()
+            return
+        self._search_timer.start()  # Restarting the single-shot timer debounces keystrokes
+
+    def _cancel_searches(self, keep=None):
+        """Supersede every running search except ``keep``; their late results are dropped."""
+        for worker in self._search_workers:
+            if worker is not keep:
+                worker.cancel()
+        self.worker_search = keep
+
+    def _current_only(self, worker, slot):
+        """Wrap ``slot`` so that signals of a superseded search worker are ignored."""
+        return lambda *args: slot(*args) if worker is self.worker_search else None
+
+    def _track_search_worker(self, worker):
+        self._search_workers.add(worker)
+        worker.finished.connect(lambda w=worker: self._search_workers.discard(w))
+
+    def _run_instant_search(self):
+        term = self.search_input.text().strip()
+        if len(term) < 2:
+            return
+        worker = InstantSearchTask(term)
+        worker.results.connect(self._current_only(worker, self._on_instant_results))
+        self._track_search_worker(worker)
+        # Start before cancelling the others, so a search for the same term is joined, not rerun
+        worker.start()
+        self._cancel_searches(keep=worker)
+
+    def _on_instant_results(self, apps):
+        if apps is None:
+            # No local index: fall back to Scoop, but only once typing has paused for longer
+            self._search_timer.setInterval(_SCOOP_DEBOUNCE_MS)
+            self._trigger_search(explicit=False)
+            return
+        self._search_timer.setInterval(_INSTANT_DEBOUNCE_MS)
+        # One model reset, regardless of the number of hits
+        self.results_model.set_apps(apps)
+        self.results_group.setTitle(f"Suchergebnisse ({len(apps)})")
+
     def _trigger_search(self, explicit=False):
         term = self.search_input.text()
         if not term or len(term.strip()) < 2:
             if explicit:
                 QMessageBox.information(self, "Info", "Bitte geben Sie mindestens 2 Zeichen ein.")
             return
-        
-        # Notify user if this is a first-time search (not cached)
-        if not installer.is_search_cached(term):
-            QMessageBox.information(
-                self,
-                "Erstmalige Suche",
-                f"Suche nach '{term}' zum ersten Mal.\n\n"
-                "Dies kann einen Moment dauern, da Ergebnisse von Scoop abgerufen werden.\n"
-                "Zukünftige Suchen nach diesem Begriff werden sofort sein (gecacht)."
-            )
-        
+
+        self._search_explicit = explicit
         self._log(f"Suche nach '{term}'...")
         self.search_btn.setEnabled(False)
         self.install_btn.setEnabled(False)
         self.search_spinner.show()
-        self.worker_search = SearchThread(term)
-        self.worker_search.progress.connect(self._log)
-        self.worker_search.results.connect(self._on_search_results)
-        self.worker_search.failed.connect(self._on_search_failed)
-        self.worker_search.finished.connect(lambda: self.search_btn.setEnabled(True))
-        self.worker_search.finished.connect(lambda: self.install_btn.setEnabled(True))
-        self.worker_search.finished.connect(self.search_spinner.hide)
-        self.worker_search.start()
+        self._clear_results()
+        self.results_group.setTitle("Suchergebnisse")
+        worker = SearchTask(term)
+        worker.progress.connect(self._current_only(worker, self._log))
+        worker.batch.connect(self._current_only(worker, self._append_results))
+        worker.results.connect(self._current_only(worker, self._on_search_results))
+        worker.failed.connect(self._current_only(worker, self._on_search_failed))
+        worker.finished.connect(lambda w=worker: self._on_search_finished(w))
+        self._track_search_worker(worker)
+        worker.start()
+        self._cancel_searches(keep=worker)
+
+    def _on_search_finished(self, worker):
+        if worker is not self.worker_search and isinstance(self.worker_search, SearchTask):
+            return  # A newer Scoop search is still running
+        self.search_btn.setEnabled(True)
+        self.install_btn.setEnabled(True)
+        self.search_spinner.hide()
 
     def _on_search_results(self, apps: list[str]):
+        # Usually the rows were added batch by batch already; a search that joined a running one
+        # for the same term only receives the final result
+        self.results_model.append(apps)
         self._log(f"✓ {len(apps)} Anwendung(en) gefunden.")
-        self._render_results(apps)
+        self.results_group.setTitle(f"Suchergebnisse ({len(apps)})")
 
     def _on_search_failed(self, message: str):
         self._log(f"✗ Suche fehlgeschlagen: {message}")
-        QMessageBox.critical(self, "Suche fehlgeschlagen", message)
+        # Searches started by typing only log their errors; a dialog would interrupt typing
+        if self._search_explicit:
+            QMessageBox.critical(self, "Suche fehlgeschlagen", message)
 
     def _select_all(self):
-        for cb in self._checkboxes:
-            if cb.isVisible():
-                cb.setChecked(True)
+        self.results_model.set_all_listed(True)
 
     def _clear_selection(self):
         # Only clear selections currently visible in the results list
-        for cb in self._checkboxes:
-            if cb.isChecked():
-                self._selected_apps.discard(cb.app_id)  # type: ignore[attr-defined]
-            cb.setChecked(False)
+        self.results_model.set_all_listed(False)
 
     def _clear_all_selection(self):
         # Confirm before clearing every tracked selection across all searches
@@ -553,22 +832,17 @@ class MenuWindow(QMainWindow):
         if reply != QMessageBox.Yes:
             return
 
-        self._selected_apps.clear()
-        for cb in self._checkboxes:
-            cb.setChecked(False)
+        self.results_model.clear_checked()
 
     def _select_all_installed(self):
-        for cb in self._installed_checkboxes:
-            if cb.isVisible():
-                cb.setChecked(True)
+        self.installed_model.set_all_listed(True)
 
     def _clear_selection_installed(self):
-        for cb in self._installed_checkboxes:
-            cb.setChecked(False)
+        self.installed_model.set_all_listed(False)
 
     def _start_install(self):
         # Use the tracked selection across searches
-        selected = sorted(self._selected_apps)
+        selected = self.results_model.checked()
         if not selected:
             QMessageBox.information(self, "Info", "Bitte wählen Sie mindestens eine App zur Installation aus.")
             return
@@ -599,42 +873,112 @@ class MenuWindow(QMainWindow):
         if reply != QMessageBox.Yes:
             return
         self._log(f"Starte Installation von {len(selected)} App(s)...")
+        self._run_install(selected)
+
+    def _offer_resume_install(self, jobs):
+        """Offer to continue an install batch that was interrupted by a crash or restart."""
+        if not jobs:
+            return
+        names = [job.ref for job in jobs]
+        reply = QMessageBox.question(
+            self,
+            "Installation fortsetzen",
+            f"Eine Installation wurde unterbrochen. {len(names)} App(s) sind noch offen:\n\n"
+            f"{', '.join(names[:5])}{'...' if len(names) > 5 else ''}\n\nJetzt fortsetzen?",
+            QMessageBox.Yes | QMessageBox.No,
+        )
+        if reply != QMessageBox.Yes:
+            installer.discard_install_jobs()
+            return
+        self.tabs.setCurrentIndex(0)
+        self._log(f"Setze Installation von {len(names)} App(s) fort...")
+        self._run_install(names, resume=True)
+
+    def _run_install(self, apps, resume=False):
         self.install_btn.setEnabled(False)
-        self.install_spinner.show()
-        self.worker = InstallThread(selected)
+        self.update_btn.setEnabled(False)
+        self.install_cancel_btn.setEnabled(True)
+        self._begin_progress(self.install_spinner, self.install_status)
+        self.worker = InstallTask(apps, self._installed_apps, resume=resume)
         self.worker.progress.connect(self._log)
+        self.worker.event.connect(lambda ev: self._on_progress_event(ev, self.install_spinner, self.install_status))
         self.worker.failed.connect(self._on_fail)
         self.worker.finished_ok.connect(self._on_success)
+        self.worker.cancelled.connect(lambda: self._log("✗ Installation abgebrochen."))
         self.worker.finished.connect(lambda: self.install_btn.setEnabled(True))
+        self.worker.finished.connect(self._sync_update_btn)
+        self.worker.finished.connect(lambda: self.install_cancel_btn.setEnabled(False))
         self.worker.finished.connect(self.install_spinner.hide)
+        self.worker.finished.connect(self.install_status.hide)
         self.worker.start()
 
-    def _refresh_installed_list(self):
-        self._log_uninstall("Aktualisiere installierte Anwendungen...")
-        self.refresh_btn.setEnabled(False)
-        self.uninstall_btn.setEnabled(False)
+    def _cancel_install(self):
+        self._log("Abbruch angefordert...")
+        self.install_cancel_btn.setEnabled(False)
+        self.worker.cancel()
+
+    def _show_installed_snapshot(self, snapshot):
+        startup_profile.mark("Momentaufnahme geladen")
+        if snapshot is None or self._installed_listed:
+            return
+        apps = [record["name"] for record in snapshot["installed"]]
+        self._installed_apps = {app.lower() for app in apps}
+        self._render_installed(apps)
+        saved = time.strftime("%d.%m.%Y %H:%M", time.localtime(snapshot.get("saved_at", 0)))
+        self._log_uninstall(f"Zuletzt bekannter Stand vom {saved}: {len(apps)} App(s), wird im Hintergrund geprüft...")
+
+    def _mark_interactive(self):
+        """Called once the first frame is on screen; reports the time-to-interactive."""
+        elapsed = (time.perf_counter() - self._started_at) * 1000
+        source = "Momentaufnahme" if self._installed_apps else "ohne Momentaufnahme"
+        self._log_uninstall(f"⏱ Bereit nach {elapsed:.0f} ms ({source}).")
+        startup_profile.mark("Interaktiv")
+        startup_profile.report()
+
+    def _refresh_installed_list(self, background=False):
+        # A background revalidation keeps the snapshot usable, so buttons stay enabled
+        if not background:
+            self._log_uninstall("Aktualisiere installierte Anwendungen...")
+            self.refresh_btn.setEnabled(False)
+            self.uninstall_btn.setEnabled(False)
         self.refresh_spinner.show()
-        self.worker_list = uninstaller.ListInstalledThread()
-        self.worker_list.progress.connect(self._log_uninstall)
+        self._revalidate_started = time.perf_counter()
+        self.worker_list = uninstaller.ListInstalledTask(revalidate_buckets=background)
+        if not background:
+            self.worker_list.progress.connect(self._log_uninstall)
         self.worker_list.results.connect(self._on_installed_list_results)
-        self.worker_list.failed.connect(self._on_installed_list_failed)
+        self.worker_list.failed.connect(
+            lambda message, quiet=background: self._on_installed_list_failed(message, quiet)
+        )
         self.worker_list.finished.connect(lambda: self.refresh_btn.setEnabled(True))
         self.worker_list.finished.connect(lambda: self.uninstall_btn.setEnabled(True))
         self.worker_list.finished.connect(self.refresh_spinner.hide)
         self.worker_list.start()
 
     def _on_installed_list_results(self, apps: list[str]):
-        self._log_uninstall(f"✓ {len(apps)} installierte Anwendung(en) gefunden.")
+        shown = set(self.installed_model.apps())
+        added = [app for app in apps if app not in shown]
+        removed = shown - set(apps)
+        elapsed = (time.perf_counter() - self._revalidate_started) * 1000
+        if added or removed:
+            self._log_uninstall(
+                f"✓ {len(apps)} installierte Anwendung(en) gefunden "
+                f"(+{len(added)} / -{len(removed)}, {elapsed:.0f} ms)."
+            )
+        else:
+            self._log_uninstall(f"✓ {len(apps)} installierte Anwendung(en), unverändert ({elapsed:.0f} ms).")
         # Keep a lowercase set for quick membership checks during install
+        self._installed_listed = True
         self._installed_apps = {app.lower() for app in apps}
         self._render_installed(apps)
 
-    def _on_installed_list_failed(self, message: str):
+    def _on_installed_list_failed(self, message: str, quiet: bool = False):
         self._log_uninstall(f"✗ Fehler beim Auflisten der Apps: {message}")
-        QMessageBox.critical(self, "Fehler", message)
+        if not quiet:
+            QMessageBox.critical(self, "Fehler", message)
 
     def _start_uninstall(self):
-        selected = [cb.app_id for cb in self._installed_checkboxes if cb.isChecked()]  # type: ignore[attr-defined]
+        selected = self.installed_model.checked()
         if not selected:
             QMessageBox.information(self, "Info", "Bitte wählen Sie mindestens eine App zur Deinstallation aus.")
             return
@@ -648,20 +992,134 @@ class MenuWindow(QMainWindow):
             return
         self._log_uninstall(f"Starte Deinstallation von {len(selected)} App(s)...")
         self.uninstall_btn.setEnabled(False)
-        self.uninstall_spinner.show()
-        self.worker_uninstall = uninstaller.UninstallThread(selected)
+        self.update_btn.setEnabled(False)
+        self.uninstall_cancel_btn.setEnabled(True)
+        self._begin_progress(self.uninstall_spinner, self.uninstall_status)
+        self.worker_uninstall = uninstaller.UninstallTask(selected)
         self.worker_uninstall.progress.connect(self._log_uninstall)
+        self.worker_uninstall.event.connect(
+            lambda ev: self._on_progress_event(ev, self.uninstall_spinner, self.uninstall_status)
+        )
         self.worker_uninstall.failed.connect(self._on_uninstall_fail)
         self.worker_uninstall.finished_ok.connect(self._on_uninstall_success)
+        self.worker_uninstall.cancelled.connect(self._on_uninstall_cancelled)
         self.worker_uninstall.finished.connect(lambda: self.uninstall_btn.setEnabled(True))
+        self.worker_uninstall.finished.connect(self._sync_update_btn)
+        self.worker_uninstall.finished.connect(lambda: self.uninstall_cancel_btn.setEnabled(False))
         self.worker_uninstall.finished.connect(self.uninstall_spinner.hide)
+        self.worker_uninstall.finished.connect(self.uninstall_status.hide)
         self.worker_uninstall.start()
 
+    def _cancel_uninstall(self):
+        # Also stops a running update, which shares the progress bar and the cancel button
+        self._log_uninstall("Abbruch angefordert...")
+        self.uninstall_cancel_btn.setEnabled(False)
+        for worker in (self.worker_uninstall, self.worker_update):
+            if worker is not None and worker.is_running():
+                worker.cancel()
+
+    def _sync_update_btn(self):
+        # An update shares the progress bar with uninstalls and the inventory with installs,
+        # so it is only offered while neither runs
+        workers = (self.worker, self.worker_uninstall, self.worker_update)
+        self.update_btn.setEnabled(not any(worker is not None and worker.is_running() for worker in workers))
+
+    def _check_outdated(self, refresh_buckets=True):
+        self._log_uninstall("Suche nach Aktualisierungen...")
+        self.outdated_btn.setEnabled(False)
+        self.refresh_spinner.show()
+        self.worker_outdated = uninstaller.OutdatedTask(refresh_buckets=refresh_buckets)
+        self.worker_outdated.progress.connect(self._log_uninstall)
+        self.worker_outdated.results.connect(self._on_outdated_results)
+        self.worker_outdated.failed.connect(lambda message: self._on_installed_list_failed(message))
+        self.worker_outdated.finished.connect(lambda: self.outdated_btn.setEnabled(True))
+        self.worker_outdated.finished.connect(self.refresh_spinner.hide)
+        self.worker_outdated.start()
+
+    def _on_outdated_results(self, outdated):
+        self._outdated = {app.name.lower(): app for app in outdated}
+        self._show_outdated()
+        if outdated:
+            self._log_uninstall(f"⬆ {len(outdated)} Aktualisierung(en) verfügbar:")
+            for app in outdated:
+                self._log_uninstall(f"    {app.name}: {app.installed} → {app.latest} ({app.bucket})")
+        else:
+            self._log_uninstall("✓ Alle Apps sind aktuell.")
+
+    def _show_outdated(self):
+        labels = {}
+        for app in self.installed_model.apps():
+            info = self._outdated.get(app.lower())
+            if info is not None:
+                labels[app] = f"{app}   ⬆ {info.installed} → {info.latest}"
+        self.installed_model.set_labels(labels)
+        title = "Installierte Anwendungen"
+        if labels:
+            title += f" – {len(labels)} Aktualisierung(en) verfügbar"
+        self.installed_group.setTitle(title)
+
+    def _select_outdated(self):
+        if not self._outdated:
+            QMessageBox.information(self, "Info", "Keine veralteten Apps bekannt. Bitte zuerst nach Updates suchen.")
+            return
+        for app in self.installed_model.apps():
+            if app.lower() in self._outdated:
+                self.installed_model.set_checked(app, True)
+
+    def _start_update(self):
+        selected = self.installed_model.checked()
+        if not selected:
+            QMessageBox.information(self, "Info", "Bitte wählen Sie mindestens eine App zur Aktualisierung aus.")
+            return
+        reply = QMessageBox.question(
+            self,
+            "Aktualisierung bestätigen",
+            f"{len(selected)} Anwendung(en) aktualisieren?\n\n{', '.join(selected[:5])}{'...' if len(selected) > 5 else ''}",
+            QMessageBox.Yes | QMessageBox.No,
+        )
+        if reply != QMessageBox.Yes:
+            return
+        self._log_uninstall(f"Starte Aktualisierung von {len(selected)} App(s)...")
+        self.update_btn.setEnabled(False)
+        self.uninstall_btn.setEnabled(False)
+        self.uninstall_cancel_btn.setEnabled(True)
+        self._begin_progress(self.uninstall_spinner, self.uninstall_status)
+        self.worker_update = uninstaller.UpdateTask(selected)
+        self.worker_update.progress.connect(self._log_uninstall)
+        self.worker_update.event.connect(
+            lambda ev: self._on_progress_event(ev, self.uninstall_spinner, self.uninstall_status)
+        )
+        self.worker_update.failed.connect(self._on_update_fail)
+        self.worker_update.finished_ok.connect(lambda apps=selected: self._on_update_success(apps))
+        self.worker_update.cancelled.connect(self._on_update_cancelled)
+        self.worker_update.finished.connect(self._sync_update_btn)
+        self.worker_update.finished.connect(lambda: self.uninstall_btn.setEnabled(True))
+        self.worker_update.finished.connect(lambda: self.uninstall_cancel_btn.setEnabled(False))
+        self.worker_update.finished.connect(self.uninstall_spinner.hide)
+        self.worker_update.finished.connect(self.uninstall_status.hide)
+        self.worker_update.start()
+
+    def _begin_progress(self, bar: QProgressBar, status: QLabel):
+        # Install and uninstall may run side by side, so progress is tracked per bar
+        self._progress_fractions[bar] = {}
+        bar.setValue(0)
+        bar.show()
+        status.setText("")
+        status.show()
+
+    def _on_progress_event(self, ev, bar: QProgressBar, status: QLabel):
+        # Overall progress is the mean of the per-app progress over the whole batch
+        fractions = self._progress_fractions[bar]
+        # The install step may repeat a download the prefetch already finished; never move backwards
+        fractions[ev.app] = max(fractions.get(ev.app, 0.0), ev.fraction())
+        bar.setValue(int(1000 * sum(fractions.values()) / max(1, ev.total)))
+        status.setText(ev.describe())
+
     def _log(self, message: str):
-        self.log.appendPlainText(message)
+        self.log_sink.append(message)
 
     def _log_uninstall(self, message: str):
-        self.log_uninstall.appendPlainText(message)
+        self.log_uninstall_sink.append(message)
 
     def _on_success(self):
         self._log("✓ Installation erfolgreich abgeschlossen.")
@@ -670,19 +1128,69 @@ class MenuWindow(QMainWindow):
     def _on_fail(self, message: str):
         self._log(f"✗ Fehler: {message}")
         QMessageBox.critical(self, "Installation fehlgeschlagen", message)
+        # Other apps of the batch may have been installed before or after the failure
+        self._refresh_installed_list(background=True)
 
     def _on_uninstall_success(self):
         self._log_uninstall("✓ Deinstallation erfolgreich abgeschlossen.")
         QMessageBox.information(self, "Erfolg", "Alle ausgewählten Apps wurden deinstalliert.")
         self._refresh_installed_list()
 
+    def _on_uninstall_cancelled(self):
+        self._log_uninstall("✗ Deinstallation abgebrochen.")
+        self._refresh_installed_list()
+
     def _on_uninstall_fail(self, message: str):
         self._log_uninstall(f"✗ Fehler: {message}")
         QMessageBox.critical(self, "Deinstallation fehlgeschlagen", message)
 
-
-def launch_app(argv=None):
+    def _on_update_success(self, apps):
+        for app in apps:
+            self._outdated.pop(app.lower(), None)
+        self._show_outdated()
+        self._log_uninstall("✓ Aktualisierung erfolgreich abgeschlossen.")
+        QMessageBox.information(self, "Erfolg", "Alle ausgewählten Apps wurden aktualisiert.")
+        # The updated apps were already re-read, so this does not rescan or call Scoop
+        self._refresh_installed_list(background=True)
+
+    def _on_update_cancelled(self):
+        self._log_uninstall("✗ Aktualisierung abgebrochen.")
+        self._refresh_after_partial_update()
+
+    def _on_update_fail(self, message: str):
+        self._log_uninstall(f"✗ Fehler: {message}")
+        QMessageBox.critical(self, "Aktualisierung fehlgeschlagen", message)
+        self._refresh_after_partial_update()
+
+    def _refresh_after_partial_update(self):
+        # Apps updated before the stop are new already; which ones is read back instead of
+        # guessed, against the bucket state the last check used
+        self._refresh_installed_list(background=True)
+        if self.worker_outdated is None or not self.worker_outdated.is_running():
+            self._check_outdated(refresh_buckets=False)
+
+    def closeEvent(self, event):
+        installer.save_session_state()
+        super().closeEvent(event)
+
+
+def launch_app(argv=None, started_at=None):
+    global _STARTED_AT
+    if started_at is not None:
+        _STARTED_AT = started_at
+    # Opening the cache store overlaps with creating the window
+    installer.load_caches_in_background()
+    installer.start_logging()
     app = QApplication(argv or [])
+    startup_profile.mark("QApplication")
     win = MenuWindow()
+    startup_profile.mark("Fenster aufgebaut")
     win.show()
-    sys.exit(app.exec())
+    # Runs once the event loop has painted the first frame
+    QTimer.singleShot(0, win._after_first_paint)
+    watchdog = ui_watchdog.install_from_env(app)
+    code = app.exec()
+    if watchdog is not None:
+        watchdog.stop()
+        print(watchdog.summary(), file=sys.stderr)
+    sys.exit(code)
@@ -0,0 +1,373 @@
+# Author: TheLionDeveloper44
+# Dieses Skript unterliegt der Lizenz, die in der LICENSE-Datei im Stammverzeichnis dieses Repositories enthalten ist.
+# Ohne ausdrückliche schriftliche Genehmigung ist es untersagt, dieses Skript zu kopieren, zu modifizieren oder zu verbreiten.
+
+# Langlebiger PowerShell-Prozess, damit nicht jeder Scoop-Aufruf einen neuen Kaltstart bezahlt.
+#
+# Protokoll (eine Zeile pro Nachricht, UTF-8):
+#   Anfrage:  "<id> <base64(befehl)>"
+#   Antwort:  "@@<id> 1 <base64(zeile)>"   -> stdout
+#             "@@<id> 2 <base64(zeile)>"   -> stderr
+#             "@@<id> X <exitcode>"        -> Ende der Antwort
+# Zeilen ohne "@@"-Präfix (z.B. direkte Konsolenausgaben) werden als stdout gewertet.
+# Ein Ersatzskript, das dieses Protokoll spricht, genügt zum Testen unter Linux: serve() ist die
+# Gegenseite des Protokolls, und "python ps_host.py" prüft es gegen einen Ersatz-Host, der die
+# Befehle mit der System-Shell ausführt.
+
+import atexit
+import base64
+import itertools
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional, Sequence
+
+# PowerShell loop executed inside the host process. Kept free of double quotes so it
+# survives Windows command line quoting when passed after "-Command".
+HOST_SCRIPT = "; ".join(
+    [
+        "$ErrorActionPreference = 'Continue'",
+        "$ProgressPreference = 'SilentlyContinue'",
+        "[Console]::OutputEncoding = [Text.Encoding]::UTF8",
+        "$u = [Text.Encoding]::UTF8",
+        "function Send-Frame($i, $k, $t) { [Console]::Out.WriteLine('@@' + $i + ' ' + $k + ' ' + "
+        "[Convert]::ToBase64String($u.GetBytes([string]$t))); [Console]::Out.Flush() }",
+        "while ($true) { "
+        "$line = [Console]::In.ReadLine(); "
+        "if ($null -eq $line) { break }; "
+        "$parts = $line.Split(' ', 2); "
+        "$id = $parts[0]; "
+        "$cmd = $u.GetString([Convert]::FromBase64String($parts[1])); "
+        "$global:LASTEXITCODE = 0; "
+        "$failed = $false; "
+        "try { Invoke-Expression $cmd *>&1 | ForEach-Object { "
+        "if ($_ -is [Management.Automation.ErrorRecord]) { $failed = $true; Send-Frame $id 2 $_ } "
+        "else { Send-Frame $id 1 (($_ | Out-String).TrimEnd()) } } } "
+        "catch { $failed = $true; Send-Frame $id 2 $_ }; "
+        "$code = $global:LASTEXITCODE; "
+        "if (-not $code) { $code = 0 }; "
+        "if ($failed -and $code -eq 0) { $code = 1 }; "
+        "[Console]::Out.WriteLine('@@' + $id + ' X ' + $code); [Console]::Out.Flush() "
+        "}",
+    ]
+)
+
+_FRAME_PREFIX = "@@"
+_CANCEL_POLL = 0.2  # Seconds between checks of a cancel flag while waiting for output
+_EOF = object()
+
+
+class HostTerminated(subprocess.CalledProcessError):
+    """Raised when the host process dies while a command is running."""
+
+
+class CommandCancelled(subprocess.SubprocessError):
+    """Raised when a running command was cancelled; its process has been killed."""
+
+    def __init__(self, command: str):
+        super().__init__(command)
+        self.command = command
+
+    def __str__(self) -> str:
+        return "Vorgang abgebrochen."
+
+
+class PowerShellHost:
+    """A single long-lived PowerShell process that executes commands one at a time."""
+
+    def __init__(self, argv: Sequence[str]):
+        self._argv = list(argv)
+        self._proc: Optional[subprocess.Popen] = None
+        self._lines: "queue.Queue[object]" = queue.Queue()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    @property
+    def alive(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    def _start(self) -> None:
+        self._lines = queue.Queue()
+        self._proc = subprocess.Popen(
+            self._argv,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            bufsize=1,
+            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+        )
+        reader = threading.Thread(
+            target=self._read_stdout, args=(self._proc, self._lines), daemon=True
+        )
+        reader.start()
+
+    @staticmethod
+    def _read_stdout(proc: subprocess.Popen, lines: "queue.Queue[object]") -> None:
+        # Each host gets its own queue, so a restarted process never sees stale frames.
+        for line in proc.stdout:
+            lines.put(line.rstrip("\r\n"))
+        lines.put(_EOF)
+
+    def _send(self, request_id: str, command: str) -> None:
+        payload = base64.b64encode(command.encode("utf-8")).decode("ascii")
+        self._proc.stdin.write(f"{request_id} {payload}\n")
+        self._proc.stdin.flush()
+
+    def kill(self) -> None:
+        """Terminate the host process; the next command starts a fresh one."""
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            proc.kill()
+            proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+
+    def close(self) -> None:
+        """Ask the host to exit by closing its stdin, then make sure it is gone."""
+        proc = self._proc
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=2)
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+        self.kill()
+
+    def run(
+        self,
+        command: str,
+        timeout: Optional[float] = None,
+        on_line: Optional[Callable[[int, str], None]] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> subprocess.CompletedProcess:
+        """Execute a command and return its output like ``subprocess.run(check=True)``.
+
+        ``on_line`` receives ``(1, text)`` for stdout and ``(2, text)`` for stderr lines as they
+        arrive. Raises ``CalledProcessError`` on a non-zero exit code and ``TimeoutExpired``
+        (after killing the host) when ``timeout`` seconds pass without the command finishing.
+        Setting ``cancel`` kills the host and raises ``CommandCancelled``.
+        """
+        with self._lock:
+            if not self.alive:
+                self._start()
+            request_id = str(next(self._ids))
+            try:
+                self._send(request_id, command)
+            except (BrokenPipeError, OSError):
+                # The host died between commands; nothing was executed yet, so retrying is safe.
+                self.kill()
+                self._start()
+                self._send(request_id, command)
+            return self._collect(request_id, command, timeout, on_line, cancel)
+
+    def _collect(
+        self,
+        request_id: str,
+        command: str,
+        timeout: Optional[float],
+        on_line: Optional[Callable[[int, str], None]],
+        cancel: Optional[threading.Event] = None,
+    ) -> subprocess.CompletedProcess:
+        stdout: List[str] = []
+        stderr: List[str] = []
+        prefix = f"{_FRAME_PREFIX}{request_id} "
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            if cancel is not None and cancel.is_set():
+                self.kill()
+                raise CommandCancelled(command)
+            wait = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if cancel is not None:
+                wait = _CANCEL_POLL if wait is None else min(wait, _CANCEL_POLL)
+            try:
+                item = self._lines.get(timeout=wait)
+            except queue.Empty:
+                if deadline is None or time.monotonic() < deadline:
+                    continue
+                self.kill()
+                raise subprocess.TimeoutExpired(
+                    command, timeout, output="\n".join(stdout), stderr="\n".join(stderr)
+                ) from None
+
+            if item is _EOF:
+                returncode = self._proc.poll() if self._proc else None
+                self.kill()
+                raise HostTerminated(
+                    returncode if returncode else -1,
+                    command,
+                    output="\n".join(stdout),
+                    stderr="\n".join(stderr + ["PowerShell-Host wurde unerwartet beendet."]),
+                )
+
+            line = str(item)
+            if not line.startswith(prefix):
+                if line.startswith(_FRAME_PREFIX):
+                    continue  # Late frame of an earlier, timed-out request.
+                stream, text = 1, line
+            else:
+                kind, _, data = line[len(prefix):].partition(" ")
+                if kind == "X":
+                    returncode = int(data or 0)
+                    out, err = "\n".join(stdout), "\n".join(stderr)
+                    if returncode != 0:
+                        raise subprocess.CalledProcessError(returncode, command, output=out, stderr=err)
+                    return subprocess.CompletedProcess(command, returncode, stdout=out, stderr=err)
+                stream = 2 if kind == "2" else 1
+                text = base64.b64decode(data).decode("utf-8", errors="replace")
+
+            for part in text.splitlines() or [""]:
+                (stderr if stream == 2 else stdout).append(part)
+                if on_line:
+                    on_line(stream, part)
+
+
+class HostPool:
+    """Hands out idle hosts; starts additional ones (up to ``max_size``) for concurrent callers."""
+
+    def __init__(self, argv: Sequence[str], max_size: int):
+        self.argv = list(argv)
+        self.max_size = max(1, max_size)
+        self._idle: List[PowerShellHost] = []
+        self._count = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    @contextmanager
+    def lease(self) -> Iterator[PowerShellHost]:
+        with self._cond:
+            while not self._idle and self._count >= self.max_size:
+                self._cond.wait()
+            if self._idle:
+                host = self._idle.pop()
+            else:
+                host = PowerShellHost(self.argv)
+                self._count += 1
+        try:
+            yield host
+        finally:
+            with self._cond:
+                if self._closed:
+                    host.close()
+                else:
+                    self._idle.append(host)
+                    self._cond.notify()
+
+    def close(self) -> None:
+        """Stop all idle hosts; hosts currently leased are stopped when they are returned."""
+        with self._cond:
+            self._closed = True
+            for host in self._idle:
+                host.close()
+            self._count -= len(self._idle)
+            self._idle.clear()
+
+
+# Upper bound of concurrently running PowerShell hosts (only started when actually needed)
+MAX_HOSTS = 4
+
+_POOL: Optional[HostPool] = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_pool(argv: Sequence[str]) -> HostPool:
+    """Return the shared pool for ``argv``, replacing it if the command line changed."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None or _POOL.argv != list(argv):
+            if _POOL is not None:
+                _POOL.close()
+            _POOL = HostPool(argv, MAX_HOSTS)
+        return _POOL
+
+
+def shutdown() -> None:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is not None:
+            _POOL.close()
+            _POOL = None
+
+
+def enabled() -> bool:
+    """The host can be switched off with APP_MANAGER_PS_HOST=0 (falls back to one process per call)."""
+    return os.environ.get("APP_MANAGER_PS_HOST", "1") != "0"
+
+
+atexit.register(shutdown)
+
+
+def serve(execute: Callable[[str, Callable[[int, str], None]], int], stdin=None, stdout=None) -> None:
+    """Host side of the protocol for stand-ins: answer requests until ``stdin`` is closed.
+
+    ``execute(command, emit)`` runs one command, passes ``(1, line)`` / ``(2, line)`` to ``emit``
+    and returns the exit code.
+    """
+    stdin = stdin or sys.stdin
+    out = stdout or sys.stdout
+    for line in stdin:
+        request_id, _, payload = line.strip().partition(" ")
+        command = base64.b64decode(payload).decode("utf-8")
+
+        def emit(stream: int, text: str) -> None:
+            for part in text.splitlines() or [""]:
+                data = base64.b64encode(part.encode("utf-8")).decode("ascii")
+                out.write(f"{_FRAME_PREFIX}{request_id} {stream} {data}\n")
+            out.flush()
+
+        code = execute(command, emit)
+        out.write(f"{_FRAME_PREFIX}{request_id} X {code}\n")
+        out.flush()
+
+
+def _shell_execute(command: str, emit: Callable[[int, str], None]) -> int:
+    """Stand-in for PowerShell: run ``command`` with the system shell."""
+    result = subprocess.run(command, shell=True, capture_output=True, text=True)
+    for stream, text in ((1, result.stdout), (2, result.stderr)):
+        for part in text.splitlines():
+            emit(stream, part)
+    return result.returncode
+
+
+def _self_check() -> int:
+    """Run the client against the shell stand-in: output, errors, exit codes, cancel and restart."""
+    host = PowerShellHost([sys.executable, os.path.abspath(__file__), "--serve"])
+    try:
+        lines: List[tuple] = []
+        result = host.run("echo eins; echo zwei", on_line=lambda stream, text: lines.append((stream, text)))
+        assert result.stdout == "eins\nzwei" and lines == [(1, "eins"), (1, "zwei")], (result, lines)
+        try:
+            host.run("echo fehler >&2; exit 3")
+            raise AssertionError("Exit-Code 3 wurde nicht gemeldet")
+        except subprocess.CalledProcessError as exc:
+            assert exc.returncode == 3 and exc.stderr == "fehler", exc
+        cancel = threading.Event()
+        threading.Timer(0.3, cancel.set).start()
+        started = time.monotonic()
+        try:
+            host.run("sleep 10", cancel=cancel)
+            raise AssertionError("Abbruch wurde nicht gemeldet")
+        except CommandCancelled:
+            assert time.monotonic() - started < 5 and not host.alive
+        assert host.run("echo ä").stdout == "ä", "Neustart nach Abbruch fehlgeschlagen"
+    finally:
+        host.close()
+    print("Host-Protokoll OK")
+    return 0
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["--serve"]:
+        serve(_shell_execute)
+        sys.exit(0)
+    sys.exit(_self_check())
@@ -4,9 +4,44 @@
 
 # Ein Cache wird für die Laufzeit des Programms verwendet, um die Leistung zu verbessern.
 # Dies ist unter "%userprofile%\.app_manager_cache" zu finden.
+# Mit "--profile-startup" wird nach dem Start eine Aufschlüsselung der Start- und Importzeiten ausgegeben.
+# "run.py search|install|uninstall|list|sync ..." arbeitet ohne GUI (siehe cli.py).
+# Diagnose per Umgebungsvariable: APP_MANAGER_STALL_MS (Blockaden der GUI, siehe ui_watchdog.py),
+# APP_MANAGER_CPROFILE und APP_MANAGER_TRACEMALLOC (siehe session_profile.py).
 
 import sys
-from menu import launch_app
+import time
+
+_STARTED_AT = time.perf_counter()  # Includes the imports below in the reported time-to-interactive
+
+import session_profile
+import startup_profile
+
+
+def main(argv):
+    session_profile.start()
+    try:
+        return _run(argv)
+    finally:
+        session_profile.report()
+
+
+def _run(argv):
+    if len(argv) > 1 and not argv[1].startswith("-"):
+        # A subcommand selects the headless mode, which never loads Qt
+        import cli
+
+        return cli.main(argv[1:])
+    if "--profile-startup" in argv:
+        argv = [arg for arg in argv if arg != "--profile-startup"]
+        startup_profile.enable(_STARTED_AT)
+    startup_profile.mark("Interpreter und run.py")
+    # Imported only here, so that argument handling does not load Qt
+    from menu import launch_app
+
+    startup_profile.mark("Import menu (Qt, installer)")
+    launch_app(argv, started_at=_STARTED_AT)
+
 
 if __name__ == "__main__":
-    launch_app(sys.argv)
\ No newline at end of file
+    sys.exit(main(sys.argv))
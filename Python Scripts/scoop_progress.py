@@ -0,0 +1,175 @@
+# Author: TheLionDeveloper44
+# Dieses Skript unterliegt der Lizenz, die in der LICENSE-Datei im Stammverzeichnis dieses Repositories enthalten ist.
+# Ohne ausdrückliche schriftliche Genehmigung ist es untersagt, dieses Skript zu kopieren, zu modifizieren oder zu verbreiten.
+
+# Wandelt die Ausgabe von "scoop install/uninstall" in strukturierte Fortschrittsereignisse um.
+# Da Scoop bei umgeleiteter Ausgabe keinen Fortschrittsbalken zeichnet, wird zusätzlich die
+# Grösse der Download-Datei im Scoop-Cache beobachtet.
+
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+DOWNLOAD = "download"
+VERIFY = "verify"
+EXTRACT = "extract"
+INSTALL = "install"
+UNINSTALL = "uninstall"
+DONE = "done"
+FAILED = "failed"
+
+# Share of one app's progress bar reached when a phase starts
+_PHASE_START = {DOWNLOAD: 0.0, VERIFY: 0.7, EXTRACT: 0.75, INSTALL: 0.9, UNINSTALL: 0.1, DONE: 1.0, FAILED: 1.0}
+_DOWNLOAD_SHARE = 0.7
+
+_UNITS = {"b": 1, "kb": 1024, "mb": 1024 ** 2, "gb": 1024 ** 3}
+_SIZE_RE = re.compile(r"\((\d+(?:[.,]\d+)?)\s*(B|KB|MB|GB)\)", re.IGNORECASE)
+_PERCENT_RE = re.compile(r"(\d{1,3}(?:[.,]\d+)?)\s*%")
+
+
+@dataclass
+class ProgressEvent:
+    app: str
+    phase: str
+    index: int = 1  # Position of the app in the current batch (1-based)
+    total: int = 1
+    percent: Optional[float] = None  # Download progress of this app (0-100)
+    bytes_done: Optional[int] = None
+    bytes_total: Optional[int] = None
+    message: str = ""
+
+    def fraction(self) -> float:
+        """Progress of this app between 0.0 and 1.0 (downloads may run for several apps at once)."""
+        if self.phase == DOWNLOAD and self.percent is not None:
+            return _DOWNLOAD_SHARE * min(self.percent, 100.0) / 100.0
+        return _PHASE_START.get(self.phase, 0.0)
+
+    def describe(self) -> str:
+        """Short German status text for the UI."""
+        labels = {
+            DOWNLOAD: "Download",
+            VERIFY: "Prüfe Hash",
+            EXTRACT: "Entpacke",
+            INSTALL: "Installiere",
+            UNINSTALL: "Deinstalliere",
+            DONE: "Fertig",
+            FAILED: "Fehlgeschlagen",
+        }
+        text = f"[{self.index}/{self.total}] {self.app}: {labels.get(self.phase, self.phase)}"
+        if self.phase == DOWNLOAD and self.percent is not None:
+            text += f" {self.percent:.0f}%"
+            if self.bytes_total:
+                done = (self.bytes_done or 0) / 1024 ** 2
+                text += f" ({done:.1f}/{self.bytes_total / 1024 ** 2:.1f} MB)"
+        return text
+
+
+def scoop_cache_dir(root: Path) -> Path:
+    """Scoop's download cache ($env:SCOOP_CACHE or <scoop root>/cache)."""
+    env = os.environ.get("SCOOP_CACHE")
+    return Path(env) if env else Path(root) / "cache"
+
+
+def _parse_size(text: str) -> Optional[int]:
+    match = _SIZE_RE.search(text)
+    if not match:
+        return None
+    value = float(match.group(1).replace(",", "."))
+    return int(value * _UNITS[match.group(2).lower()])
+
+
+class OutputParser:
+    """Turns output lines of one Scoop operation into ProgressEvents for a single app."""
+
+    def __init__(self, app: str, index: int, total: int, emit: Callable[[ProgressEvent], None]):
+        self.app = app
+        self.index = index
+        self.total = total
+        self._emit = emit
+        self.bytes_total: Optional[int] = None
+        self.phase = ""
+
+    def event(self, phase: str, **fields) -> None:
+        self.phase = phase
+        self._emit(ProgressEvent(self.app, phase, self.index, self.total, **fields))
+
+    def feed(self, line: str) -> None:
+        # Progress bars redraw with carriage returns; only the last state of a line matters
+        text = line.rsplit("\r", 1)[-1].strip()
+        if not text:
+            return
+        low = text.lower()
+        if low.startswith("downloading ") or low.startswith("starting download"):
+            self.bytes_total = _parse_size(text) or self.bytes_total
+            self.event(DOWNLOAD, percent=0.0, bytes_done=0, bytes_total=self.bytes_total, message=text)
+        elif low.startswith("checking hash"):
+            self.event(VERIFY, message=text)
+        elif low.startswith("extracting"):
+            self.event(EXTRACT, message=text)
+        elif low.startswith("linking") or low.startswith("creating shim") or low.startswith("running installer"):
+            if self.phase != INSTALL:
+                self.event(INSTALL, message=text)
+        elif low.startswith("uninstalling") or low.startswith("removing shim"):
+            if self.phase != UNINSTALL:
+                self.event(UNINSTALL, message=text)
+        elif "installed successfully" in low or "was uninstalled" in low:
+            self.event(DONE, message=text)
+        elif self.phase == DOWNLOAD:
+            match = _PERCENT_RE.search(text)
+            if match:
+                self.download_progress(float(match.group(1).replace(",", ".")))
+
+    def download_progress(self, percent: float, bytes_done: Optional[int] = None) -> None:
+        if bytes_done is None and self.bytes_total:
+            bytes_done = int(self.bytes_total * percent / 100.0)
+        self.event(DOWNLOAD, percent=percent, bytes_done=bytes_done, bytes_total=self.bytes_total)
+
+
+class DownloadWatcher:
+    """Polls Scoop's cache directory and reports the growing download file of an app."""
+
+    def __init__(self, cache_dir: Path, parser: OutputParser, interval: float = 0.5):
+        self.cache_dir = Path(cache_dir)
+        self.parser = parser
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._started = 0.0
+
+    def __enter__(self) -> "DownloadWatcher":
+        self._started = time.time()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join(timeout=2)
+
+    def _current_size(self) -> Optional[int]:
+        # Scoop names cache files "<app>#<version>#<url>"; only files written since the
+        # operation started can belong to the active download
+        try:
+            sizes = [
+                (st.st_mtime, st.st_size)
+                for st in (p.stat() for p in self.cache_dir.glob(f"{self.parser.app}#*"))
+                if st.st_mtime >= self._started - 1
+            ]
+        except OSError:
+            return None
+        return max(sizes)[1] if sizes else None
+
+    def _run(self) -> None:
+        last = None
+        while not self._stop.wait(self.interval):
+            if self.parser.phase != DOWNLOAD or not self.parser.bytes_total:
+                continue
+            size = self._current_size()
+            if size is None or size == last:
+                continue
+            last = size
+            percent = min(100.0, 100.0 * size / self.parser.bytes_total)
+            self.parser.download_progress(percent, bytes_done=size)
@@ -0,0 +1,79 @@
+# Author: TheLionDeveloper44
+# Dieses Skript unterliegt der Lizenz, die in der LICENSE-Datei im Stammverzeichnis dieses Repositories enthalten ist.
+# Ohne ausdrückliche schriftliche Genehmigung ist es untersagt, dieses Skript zu kopieren, zu modifizieren oder zu verbreiten.
+
+# Profilierung der ganzen Sitzung, per Umgebungsvariable eingeschaltet; die Berichte werden beim
+# Beenden ausgegeben:
+#   APP_MANAGER_CPROFILE=1|<datei.prof>   cProfile für den Hauptthread (GUI bzw. Kommandozeile);
+#                                          Statistik in die Datei, die teuersten Funktionen auf stderr
+#   APP_MANAGER_TRACEMALLOC=1|<anzahl>    tracemalloc; Spitzenverbrauch und die Codezeilen mit den
+#                                          meisten noch belegten Speicherblöcken auf stderr
+
+import os
+import sys
+from typing import Optional
+
+DEFAULT_PROFILE_FILE = "app_manager.prof"
+DEFAULT_TOP = 25
+
+_profiler = None
+_profile_file: Optional[str] = None
+_tracemalloc_top = 0
+
+
+def _top(value: str) -> int:
+    try:
+        return max(1, int(value)) if value != "1" else DEFAULT_TOP
+    except ValueError:
+        return DEFAULT_TOP
+
+
+def start() -> None:
+    """Start the profilers selected by the environment (no-op without the variables)."""
+    global _profiler, _profile_file, _tracemalloc_top
+    trace = os.environ.get("APP_MANAGER_TRACEMALLOC", "").strip()
+    if trace and trace != "0":
+        import tracemalloc
+
+        _tracemalloc_top = _top(trace)
+        tracemalloc.start(10)
+    target = os.environ.get("APP_MANAGER_CPROFILE", "").strip()
+    if target and target != "0":
+        import cProfile
+
+        _profile_file = DEFAULT_PROFILE_FILE if target == "1" else target
+        _profiler = cProfile.Profile()
+        _profiler.enable()
+
+
+def report(stream=None) -> None:
+    """Stop the running profilers and write their reports."""
+    global _profiler, _tracemalloc_top
+    out = stream or sys.stderr
+    if _profiler is not None:
+        import pstats
+
+        _profiler.disable()
+        try:
+            _profiler.dump_stats(_profile_file)
+            print(f"cProfile-Statistik gespeichert in {_profile_file}", file=out)
+        except OSError as exc:
+            print(f"cProfile-Statistik konnte nicht gespeichert werden: {exc}", file=out)
+        pstats.Stats(_profiler, stream=out).sort_stats("cumulative").print_stats(DEFAULT_TOP)
+        _profiler = None
+    if _tracemalloc_top:
+        import tracemalloc
+
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"tracemalloc: aktuell {current / 1024 / 1024:.1f} MiB, Spitze {peak / 1024 / 1024:.1f} MiB; "
+            f"Top {_tracemalloc_top} Zeilen:",
+            file=out,
+        )
+        snapshot = snapshot.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+        for stat in snapshot.statistics("lineno")[:_tracemalloc_top]:
+            print(f"  {stat}", file=out)
+        _tracemalloc_top = 0
+    out.flush()
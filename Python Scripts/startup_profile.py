@@ -0,0 +1,70 @@
+# Author: TheLionDeveloper44
+# Dieses Skript unterliegt der Lizenz, die in der LICENSE-Datei im Stammverzeichnis dieses Repositories enthalten ist.
+# Ohne ausdrückliche schriftliche Genehmigung ist es untersagt, dieses Skript zu kopieren, zu modifizieren oder zu verbreiten.
+
+# Startzeit-Profil für "run.py --profile-startup": misst die Dauer der einzelnen Startphasen und
+# die Importzeit jedes Moduls. Ohne den Schalter kostet ein mark()-Aufruf nur eine Abfrage.
+
+import builtins
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+_enabled = False
+_started_at = 0.0
+_phases: List[Tuple[str, float]] = []
+_imports: Dict[str, Tuple[float, float]] = {}  # module -> (inclusive, self) seconds
+_original_import = builtins.__import__
+_stack: List[float] = []  # Time spent in nested imports, per active import
+
+
+def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+    # Only the first import of a module does any work; later ones are dictionary lookups
+    if level or name in sys.modules:
+        return _original_import(name, globals, locals, fromlist, level)
+    _stack.append(0.0)
+    start = time.perf_counter()
+    try:
+        return _original_import(name, globals, locals, fromlist, level)
+    finally:
+        inclusive = time.perf_counter() - start
+        nested = _stack.pop()
+        if _stack:
+            _stack[-1] += inclusive
+        _imports.setdefault(name, (inclusive, inclusive - nested))
+
+
+def enable(started_at: Optional[float] = None) -> None:
+    """Start recording phases and module imports (``started_at`` is a perf_counter value)."""
+    global _enabled, _started_at
+    _enabled = True
+    _started_at = time.perf_counter() if started_at is None else started_at
+    builtins.__import__ = _timed_import
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def mark(phase: str) -> None:
+    """Record that ``phase`` has just finished."""
+    if _enabled:
+        _phases.append((phase, time.perf_counter()))
+
+
+def report(top: int = 15, stream=None) -> None:
+    """Print the phase breakdown and the slowest imports, then stop recording imports."""
+    if not _enabled:
+        return
+    builtins.__import__ = _original_import
+    out = stream or sys.stderr
+    print("Startprofil (ms):", file=out)
+    previous = _started_at
+    for phase, at in _phases:
+        print(f"  {phase:<28} {(at - previous) * 1000:8.1f}   (gesamt {(at - _started_at) * 1000:8.1f})", file=out)
+        previous = at
+    print(f"Langsamste Importe (ms, inklusive / eigen), {len(_imports)} Module:", file=out)
+    slowest = sorted(_imports.items(), key=lambda item: item[1][0], reverse=True)[:top]
+    for name, (inclusive, own) in slowest:
+        print(f"  {name:<40} {inclusive * 1000:8.1f} {own * 1000:8.1f}", file=out)
+    out.flush()
@@ -0,0 +1,193 @@
+# Author: TheLionDeveloper44
+# Dieses Skript unterliegt der Lizenz, die in der LICENSE-Datei im Stammverzeichnis dieses Repositories enthalten ist.
+# Ohne ausdrückliche schriftliche Genehmigung ist es untersagt, dieses Skript zu kopieren, zu modifizieren oder zu verbreiten.
+
+# Gemeinsamer Executor für Hintergrundaufgaben: begrenzte Parallelität, gleichzeitige Aufrufe mit
+# demselben Schlüssel (Operation und Argumente) teilen sich eine Ausführung ("single flight"),
+# und eine abgebrochene Aufgabe beendet den laufenden Scoop-Prozess über ihr Abbruch-Event.
+
+import queue
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from ps_host import CommandCancelled
+
+MAX_WORKERS = 4
+
+
+class Task:
+    """Handle of one (possibly shared) execution.
+
+    Every caller that submitted or joined the task holds one subscription; ``cancel`` drops it,
+    and the task's ``cancel_event`` is only set once nobody is waiting for the result any more.
+    """
+
+    def __init__(self, key: Optional[Hashable]):
+        self.key = key
+        self.cancel_event = threading.Event()
+        self._done = threading.Event()
+        self._lock = threading.Lock()
+        self._subscribers = 1
+        self._result: Any = None
+        self._exception: Optional[BaseException] = None
+        self._callbacks: List[Callable[["Task"], None]] = []
+
+    def _subscribe(self) -> None:
+        with self._lock:
+            self._subscribers += 1
+
+    def cancel(self) -> None:
+        with self._lock:
+            self._subscribers -= 1
+            if self._subscribers > 0:
+                return
+        self.cancel_event.set()
+
+    def cancelled(self) -> bool:
+        return self.cancel_event.is_set()
+
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def _finish(self, result: Any = None, exception: Optional[BaseException] = None) -> None:
+        with self._lock:
+            self._result, self._exception = result, exception
+            self._done.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback(self)
+
+    def add_done_callback(self, callback: Callable[["Task"], None]) -> None:
+        """Call ``callback(task)`` once the task is done (on the thread that finished it)."""
+        with self._lock:
+            if not self._done.is_set():
+                self._callbacks.append(callback)
+                return
+        callback(self)
+
+    def exception(self) -> Optional[BaseException]:
+        self._done.wait()
+        return self._exception
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        if not self._done.wait(timeout):
+            raise TimeoutError(f"Zeitüberschreitung bei {self.key!r}")
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+
+class TaskExecutor:
+    """Runs tasks on a bounded thread pool; concurrent tasks with the same key run only once.
+
+    The worker threads are daemons (started on the first submit), so a background refresh that
+    is still running never delays the exit of the program.
+    """
+
+    def __init__(self, max_workers: int = MAX_WORKERS, name: str = "task"):
+        self.max_workers = max_workers
+        self.name = name
+        self._queue: "queue.SimpleQueue[Callable[[], None]]" = queue.SimpleQueue()
+        self._workers: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Hashable, Task] = {}
+
+    def _worker(self) -> None:
+        while True:
+            self._queue.get()()
+
+    def _join_or_create(self, key: Optional[Hashable]) -> tuple[Task, bool]:
+        with self._lock:
+            task = self._in_flight.get(key) if key is not None else None
+            if task is not None and not task.cancelled():
+                task._subscribe()
+                return task, False
+            task = Task(key)
+            if key is not None:
+                self._in_flight[key] = task
+            return task, True
+
+    def _execute(self, task: Task, fn: Callable[[threading.Event], Any]) -> Any:
+        try:
+            result = fn(task.cancel_event)
+        except BaseException as exc:
+            self._release(task)
+            task._finish(exception=exc)
+            raise
+        self._release(task)
+        task._finish(result)
+        return result
+
+    def _release(self, task: Task) -> None:
+        with self._lock:
+            if task.key is not None and self._in_flight.get(task.key) is task:
+                del self._in_flight[task.key]
+
+    def submit(self, key: Optional[Hashable], fn: Callable[[threading.Event], Any]) -> Task:
+        """Run ``fn(cancel_event)`` on the pool, or join the running task with the same ``key``.
+
+        A ``key`` of None never shares. ``fn`` should pass the event on to the installer, which
+        kills the running Scoop process when it is set.
+        """
+        task, created = self._join_or_create(key)
+        if created:
+
+            def run() -> None:
+                try:
+                    self._execute(task, fn)
+                except BaseException:  # noqa: BLE001 - delivered through the task
+                    pass
+
+            with self._lock:
+                while len(self._workers) < self.max_workers:
+                    worker = threading.Thread(
+                        target=self._worker, name=f"{self.name}-{len(self._workers)}", daemon=True
+                    )
+                    worker.start()
+                    self._workers.append(worker)
+            self._queue.put(run)
+        return task
+
+    def run(
+        self,
+        key: Hashable,
+        fn: Callable[[threading.Event], Any],
+        cancel: Optional[threading.Event] = None,
+    ) -> Any:
+        """Run ``fn`` on the calling thread, unless a task with ``key`` is already running.
+
+        In that case wait for its result instead (``cancel`` stops waiting and raises
+        ``CommandCancelled``). Meant for short operations inside worker threads, so keys used
+        here should not also be submitted to the pool.
+        """
+        while True:
+            task, created = self._join_or_create(key)
+            if created:
+                return self._execute(task, lambda own: fn(cancel or own))
+            while not task._done.wait(0.05):
+                if cancel is not None and cancel.is_set():
+                    task.cancel()
+                    raise CommandCancelled(str(key))
+            try:
+                return task.result()
+            except CommandCancelled:
+                # The leader was cancelled, not this caller: run the operation again
+                if cancel is not None and cancel.is_set():
+                    raise
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._in_flight)
+
+
+_EXECUTOR: Optional[TaskExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def get_executor() -> TaskExecutor:
+    """Return the executor shared by the window and the installer."""
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = TaskExecutor(MAX_WORKERS, "app-task")
+        return _EXECUTOR
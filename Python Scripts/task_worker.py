@@ -0,0 +1,68 @@
+# Author: TheLionDeveloper44
+# Dieses Skript unterliegt der Lizenz, die in der LICENSE-Datei im Stammverzeichnis dieses Repositories enthalten ist.
+# Ohne ausdrückliche schriftliche Genehmigung ist es untersagt, dieses Skript zu kopieren, zu modifizieren oder zu verbreiten.
+
+# Qt-Anbindung des gemeinsamen Executors: statt für jede Suche oder Liste einen eigenen QThread
+# zu starten, laufen die Aufgaben im Executor und melden sich über Qt-Signale zurück.
+
+import threading
+
+from PySide6.QtCore import QObject, Signal
+
+import task_executor
+from ps_host import CommandCancelled
+
+
+class TaskWorker(QObject):
+    """A background operation on the shared executor that reports through Qt signals.
+
+    Subclasses implement ``work(cancel)`` and may return a ``key``: workers with the same key
+    that run at the same time share one execution, and each of them receives the result. Signals
+    emitted from ``work`` (e.g. progress) come from the worker that started the execution.
+    """
+
+    results = Signal(object)
+    failed = Signal(str)
+    cancelled = Signal()  # Sent instead of a result or failure after ``cancel``
+    finished = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._task = None
+        self._cancelled = False
+
+    def key(self):
+        return None
+
+    def work(self, cancel: threading.Event):
+        raise NotImplementedError
+
+    def start(self):
+        self._task = task_executor.get_executor().submit(self.key(), self.work)
+        self._task.add_done_callback(self._on_done)
+
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def cancel(self):
+        """Stop waiting for the result; the Scoop call is killed once no other worker needs it."""
+        if self._task is not None and not self._cancelled:
+            self._cancelled = True
+            self._task.cancel()
+
+    def deliver(self, result):
+        self.results.emit(result)
+
+    def _on_done(self, task):
+        # Runs on the executor thread; the signals are queued to the receivers' thread
+        try:
+            if self._cancelled:
+                self.cancelled.emit()
+                return
+            exc = task.exception()
+            if exc is None:
+                self.deliver(task.result())
+            elif not isinstance(exc, CommandCancelled):
+                self.failed.emit(str(exc))
+        finally:
+            self.finished.emit()
@@ -0,0 +1,108 @@
+# Author: TheLionDeveloper44
+# Dieses Skript unterliegt der Lizenz, die in der LICENSE-Datei im Stammverzeichnis dieses Repositories enthalten ist.
+# Ohne ausdrückliche schriftliche Genehmigung ist es untersagt, dieses Skript zu kopieren, zu modifizieren oder zu verbreiten.
+
+# Wächter für die Ereignisschleife der GUI (nur mit APP_MANAGER_STALL_MS=<Schwelle in ms>):
+# ein Zeitgeber im GUI-Thread misst die Verzögerung der Ereignisschleife, ein Hintergrund-Thread
+# bemerkt Blockaden über der Schwelle und gibt den Stack des GUI-Threads aus, solange er noch
+# blockiert ist - also den Handler, der gerade hängt. Modale Dialoge zählen nicht als Blockade,
+# da sie eine eigene Ereignisschleife betreiben.
+
+import os
+import sys
+import threading
+import time
+import traceback
+from typing import Optional
+
+from PySide6.QtCore import QObject, Qt, QTimer
+
+import diagnostics
+
+INTERVAL_MS = 50  # Heartbeat of the GUI thread
+
+
+class StallWatchdog(QObject):
+    """Measure event-loop latency on the GUI thread and report stalls over ``threshold_ms``.
+
+    Must be created on the GUI thread. Each stall is printed to ``stream`` (stderr by default)
+    with the GUI thread's stack while it is blocked, and its duration is recorded as a
+    "ui: stall" span when diagnostics are enabled.
+    """
+
+    def __init__(self, threshold_ms: float, stream=None, parent=None):
+        super().__init__(parent)
+        self.threshold = threshold_ms / 1000
+        self.stream = stream or sys.stderr
+        self.max_latency = 0.0
+        self.total_latency = 0.0
+        self.beats = 0
+        self.stalls = 0
+        self._interval = INTERVAL_MS / 1000
+        self._gui_thread = threading.get_ident()
+        self._last_beat = time.perf_counter()
+        self._reported_beat = 0.0  # Heartbeat whose stall was already reported
+        self._stop = threading.Event()
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.setInterval(INTERVAL_MS)
+        self._timer.timeout.connect(self._beat)
+        self._thread = threading.Thread(target=self._watch, name="ui-watchdog", daemon=True)
+
+    def start(self) -> None:
+        self._last_beat = time.perf_counter()
+        self._timer.start()
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._timer.stop()
+        self._stop.set()
+
+    def _beat(self) -> None:
+        now = time.perf_counter()
+        previous, self._last_beat = self._last_beat, now
+        latency = max(0.0, now - previous - self._interval)
+        self.beats += 1
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+        if latency > self.threshold:
+            self.stalls += 1
+            print(f"[Watchdog] GUI war {latency * 1000:.0f} ms blockiert.", file=self.stream, flush=True)
+            diagnostics.record("ui: stall", previous + self._interval, latency)
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.threshold / 4):
+            last = self._last_beat
+            if last == self._reported_beat or time.perf_counter() - last - self._interval <= self.threshold:
+                continue
+            self._reported_beat = last
+            frame = sys._current_frames().get(self._gui_thread)
+            stack = "".join(traceback.format_stack(frame)) if frame is not None else "  (kein Stack)\n"
+            print(
+                f"[Watchdog] GUI blockiert seit über {self.threshold * 1000:.0f} ms, Stack des GUI-Threads:\n{stack}",
+                file=self.stream,
+                end="",
+                flush=True,
+            )
+
+    def summary(self) -> str:
+        mean = self.total_latency / self.beats * 1000 if self.beats else 0.0
+        return (
+            f"[Watchdog] Latenz der Ereignisschleife: Mittel {mean:.1f} ms, "
+            f"Max {self.max_latency * 1000:.0f} ms, {self.stalls} Blockade(n) über {self.threshold * 1000:.0f} ms"
+        )
+
+
+def install_from_env(parent=None) -> Optional[StallWatchdog]:
+    """Start a watchdog if APP_MANAGER_STALL_MS is set (the stall threshold in milliseconds)."""
+    value = os.environ.get("APP_MANAGER_STALL_MS", "").strip()
+    if not value:
+        return None
+    try:
+        threshold = float(value)
+    except ValueError:
+        print(f"[Watchdog] Ungültiger Wert für APP_MANAGER_STALL_MS: {value!r}", file=sys.stderr)
+        return None
+    watchdog = StallWatchdog(max(threshold, INTERVAL_MS), parent=parent)
+    watchdog.start()
+    return watchdog
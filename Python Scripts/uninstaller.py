@@ -2,36 +2,84 @@
 # Dieses Skript unterliegt der Lizenz, die in der LICENSE-Datei im Stammverzeichnis dieses Repositories enthalten ist.
 # Ohne ausdrückliche schriftliche Genehmigung ist es untersagt, dieses Skript zu kopieren, zu modifizieren oder zu verbreiten.
 
-from PySide6.QtCore import QThread, Signal
+from PySide6.QtCore import Signal
 import installer
+from task_worker import TaskWorker
 
-class ListInstalledThread(QThread):
-    """Thread to list installed scoop applications without blocking UI."""
+class ListInstalledTask(TaskWorker):
+    """Lists installed scoop applications without blocking the UI.
+
+    Refreshes that overlap (e.g. the startup revalidation and a click on "refresh") share one read.
+    """
+    results = Signal(list)
+    progress = Signal(str)
+
+    def __init__(self, revalidate_buckets=False):
+        super().__init__()
+        self.revalidate_buckets = revalidate_buckets
+
+    def key(self):
+        return ("list installed",)
+
+    def work(self, cancel):
+        if self.revalidate_buckets:
+            installer.revalidate_bucket_list()
+        return installer.list_installed_apps(progress=self.progress.emit)
+
+
+class InstalledSnapshotTask(TaskWorker):
+    """Loads the installed apps saved by the previous session (waits for the cache store)."""
+
+    def work(self, cancel):
+        return installer.load_installed_snapshot()
+
+
+class UninstallTask(TaskWorker):
+    """Uninstalls scoop applications without blocking the UI."""
+    progress = Signal(str)
+    event = Signal(object)  # scoop_progress.ProgressEvent
+    finished_ok = Signal()
+
+    def __init__(self, apps):
+        super().__init__()
+        self.apps = apps
+
+    def work(self, cancel):
+        # Cancelling kills the running Scoop call; apps not yet started are left untouched
+        installer.uninstall_apps(self.apps, progress=self.progress.emit, on_event=self.event.emit, cancel=cancel)
+
+    def deliver(self, result):
+        self.finished_ok.emit()
+
+
+class OutdatedTask(TaskWorker):
+    """Finds installed apps with a newer version in their bucket (pulls the buckets first by default)."""
     results = Signal(list)
-    failed = Signal(str)
     progress = Signal(str)
 
-    def run(self):
-        try:
-            apps = installer.list_installed_apps(progress=self.progress.emit)
-            self.results.emit(apps)
-        except Exception as exc:  # noqa: BLE001
-            self.failed.emit(str(exc))
+    def __init__(self, refresh_buckets=True):
+        super().__init__()
+        self.refresh_buckets = refresh_buckets
+
+    def key(self):
+        return ("outdated", self.refresh_buckets)
+
+    def work(self, cancel):
+        return installer.outdated_apps(progress=self.progress.emit, refresh_buckets=self.refresh_buckets)
 
 
-class UninstallThread(QThread):
-    """Thread to uninstall scoop applications without blocking UI."""
+class UpdateTask(TaskWorker):
+    """Updates scoop applications without blocking the UI (downloads run in parallel)."""
     progress = Signal(str)
-    failed = Signal(str)
+    event = Signal(object)  # scoop_progress.ProgressEvent
     finished_ok = Signal()
 
     def __init__(self, apps):
         super().__init__()
         self.apps = apps
 
-    def run(self):
-        try:
-            installer.uninstall_apps(self.apps, progress=self.progress.emit)
-            self.finished_ok.emit()
-        except Exception as exc:  # noqa: BLE001
-            self.failed.emit(str(exc))
+    def work(self, cancel):
+        installer.update_apps(self.apps, progress=self.progress.emit, on_event=self.event.emit, cancel=cancel)
+
+    def deliver(self, result):
+        self.finished_ok.emit()